@@ -23,7 +23,7 @@ const CompetitionListItem: React.FC<CompetitionListItemProps> = ({ competition }
         <CardContent className="p-4 flex flex-col items-center text-center flex-grow">
           <Avatar className="h-20 w-20 mb-3">
             {competition.logo_url ? (
-              <AvatarImage src={competition.logo_url} alt={`${competition.name} logo`} className="object-contain"/>
+              <AvatarImage src={competition.logo_url} srcSet={competition.logo_srcset ?? undefined} sizes="80px" alt={`${competition.name} logo`} className="object-contain"/>
             ) : null}
             <AvatarFallback className="text-2xl">{getInitials(competition.name)}</AvatarFallback>
           </Avatar>
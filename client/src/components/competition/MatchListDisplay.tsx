@@ -3,14 +3,65 @@ import { MatchListItemData } from '@/libs/types/models/matchListItemData';
 import MatchListItem from '@/components/match/MatchListItem';
 import { Card, CardContent, CardHeader, CardTitle } from '@/components/ui/card';
 import { Separator } from '@/components/ui/separator';
+import { Button } from '@/components/ui/button';
+import { Link } from '@django-bridge/react';
 import { cn } from '@/libs/utils';
 import competitionDetailStrings from '@/libs/keychains/competitionDetail.json';
 
 interface MatchListDisplayProps {
   matches: MatchListItemData[];
+  nextCursor?: string | null; // Cursor of the next page of matches, null on the last page
+  isFirstPage?: boolean;
+  pageKey: 'team' | 'competition'; // Page prop holding the matches, read from the responses of the next pages
 }
 
-const MatchListDisplay: React.FC<MatchListDisplayProps> = ({ matches }) => {
+interface MatchPageData {
+  matches: MatchListItemData[];
+  matches_next_cursor: string | null;
+}
+
+// URL of the current page with another cursor (none for the first page), keeping the ?limit= the user chose
+const matchPageUrl = (cursor: string | null) => {
+  const params = new URLSearchParams(window.location.search);
+  if (cursor) {
+    params.set('cursor', cursor);
+  } else {
+    params.delete('cursor');
+  }
+  const query = params.toString();
+  return query ? `${window.location.pathname}?${query}` : window.location.pathname;
+};
+
+const MatchListDisplay: React.FC<MatchListDisplayProps> = ({ matches: firstMatches, nextCursor = null, isFirstPage = true, pageKey }) => {
+  // "More Matches" appends the next page to the list instead of replacing it
+  const [matches, setMatches] = React.useState(firstMatches);
+  const [cursor, setCursor] = React.useState(nextCursor);
+  const [isLoading, setIsLoading] = React.useState(false);
+
+  React.useEffect(() => {
+    setMatches(firstMatches);
+    setCursor(nextCursor);
+  }, [firstMatches, nextCursor]);
+
+  const loadMoreMatches = async () => {
+    if (!cursor) return;
+    setIsLoading(true);
+    try {
+      const response = await fetch(matchPageUrl(cursor), {
+        headers: { 'X-Requested-With': 'DjangoBridge' }, // The page props as JSON, as django-bridge requests them
+        credentials: 'same-origin',
+      });
+      if (!response.ok) throw new Error(`Unexpected status ${response.status}`);
+      const page: MatchPageData = (await response.json()).props[pageKey];
+      setMatches(previousMatches => [...previousMatches, ...page.matches]);
+      setCursor(page.matches_next_cursor);
+    } catch {
+      window.location.assign(matchPageUrl(cursor)); // Falls back to opening the next page
+    } finally {
+      setIsLoading(false);
+    }
+  };
+
   const upcomingMatches = matches.filter(match => !match.is_finished);
   const finishedMatches = matches.filter(match => match.is_finished);
 
@@ -88,6 +139,21 @@ const MatchListDisplay: React.FC<MatchListDisplayProps> = ({ matches }) => {
           </CardContent>
         </Card>
       )}
+
+      {(cursor || !isFirstPage) && (
+        <div className="flex justify-center gap-3">
+          {!isFirstPage && (
+            <Button asChild variant="outline">
+              <Link href={matchPageUrl(null)}>{competitionDetailStrings.first_matches_page_button}</Link>
+            </Button>
+          )}
+          {cursor && (
+            <Button variant="outline" onClick={loadMoreMatches} disabled={isLoading}>
+              {isLoading ? competitionDetailStrings.loading_matches_button : competitionDetailStrings.more_matches_button}
+            </Button>
+          )}
+        </div>
+      )}
     </div>
   );
 };
@@ -23,6 +23,7 @@ export interface GenericLeaderboardEntry {
     username: string;
   };
   score: number; // Generic score field
+  rank?: number; // Absolute rank when the data is one page of a larger leaderboard
   // total_gained_points is now just 'score'
 }
 
@@ -39,13 +40,15 @@ interface GenericLeaderboardProps {
   currentUserId?: number | null;
   strings: LeaderboardStrings;
   pointsSuffix?: string; // e.g., "pts" or "points"
+  footer?: React.ReactNode; // Shown under the table, e.g. page controls
 }
 
 const GenericLeaderboard: React.FC<GenericLeaderboardProps> = ({ 
     leaderboardData, 
     currentUserId, 
     strings, 
-    pointsSuffix = "pts" 
+    pointsSuffix = "pts",
+    footer
 }) => {
   if (!leaderboardData || leaderboardData.length === 0) {
     return (
@@ -86,7 +89,7 @@ const GenericLeaderboard: React.FC<GenericLeaderboardProps> = ({
                   key={entry.user.id}
                   className={cn(isCurrentUser ? 'bg-primary/10' : '')}
                 >
-                  <TableCell className={cn("font-semibold", isCurrentUser ? 'text-primary' : '')}>{index + 1}</TableCell>
+                  <TableCell className={cn("font-semibold", isCurrentUser ? 'text-primary' : '')}>{entry.rank ?? index + 1}</TableCell>
                   <TableCell className={cn(isCurrentUser ? 'font-bold text-primary' : '')}>{entry.user.username}</TableCell>
                   <TableCell className="text-right">
                     <Badge 
@@ -101,6 +104,7 @@ const GenericLeaderboard: React.FC<GenericLeaderboardProps> = ({
             })}
           </TableBody>
         </Table>
+        {footer}
       </CardContent>
     </Card>
   );
@@ -5,6 +5,7 @@ import { cn } from '@/libs/utils';
 interface TeamInfo {
   name: string;
   logo_url?: string | null;
+  logo_srcset?: string | null;
 }
 
 interface MatchTeamDisplayProps {
@@ -21,7 +22,7 @@ const MatchTeamDisplay: React.FC<MatchTeamDisplayProps> = ({ team, alignment = '
   const avatar = (
     <Avatar className="h-8 w-8 sm:h-10 sm:w-10 flex-shrink-0">
       {team.logo_url ? (
-        <AvatarImage src={team.logo_url} alt={`${team.name} logo`} className="object-cover" />
+        <AvatarImage src={team.logo_url} srcSet={team.logo_srcset ?? undefined} sizes="(min-width: 640px) 40px, 32px" alt={`${team.name} logo`} className="object-cover" />
       ) : null}
       <AvatarFallback>{getInitials(team.name)}</AvatarFallback>
     </Avatar>
@@ -18,7 +18,7 @@ const PlayerListItem: React.FC<PlayerListItemProps> = ({ player }) => {
       <CardContent className="p-3 sm:p-4 flex items-center space-x-3 sm:space-x-4">
         <Avatar className="h-12 w-12 sm:h-16 sm:w-16">
           {player.photo_url ? (
-            <AvatarImage src={player.photo_url} alt={`${teamDetailStrings.player_photo_alt_prefix}${playerName}`} className="object-cover" />
+            <AvatarImage src={player.photo_url} srcSet={player.photo_srcset ?? undefined} sizes="(min-width: 640px) 64px, 48px" alt={`${teamDetailStrings.player_photo_alt_prefix}${playerName}`} className="object-cover" />
           ) : null}
           <AvatarFallback className="text-lg sm:text-xl">{playerInitials.toUpperCase()}</AvatarFallback>
         </Avatar>
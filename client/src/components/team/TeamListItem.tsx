@@ -23,7 +23,7 @@ const TeamListItem: React.FC<TeamListItemProps> = ({ team }) => {
         <CardContent className="p-4 flex flex-col items-center text-center flex-grow">
           <Avatar className="h-20 w-20 mb-3">
             {team.logo_url ? (
-              <AvatarImage src={team.logo_url} alt={`${team.name} logo`} className="object-contain"/>
+              <AvatarImage src={team.logo_url} srcSet={team.logo_srcset ?? undefined} sizes="80px" alt={`${team.name} logo`} className="object-contain"/>
             ) : null}
             <AvatarFallback className="text-2xl">{getInitials(team.name)}</AvatarFallback>
           </Avatar>
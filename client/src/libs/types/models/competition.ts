@@ -2,5 +2,6 @@ export interface Competition {
   id: number;
   name: string;
   logo_url: string | null;
+  logo_srcset: string | null;
   // start_date and end_date were removed by user preference
 } 
\ No newline at end of file
@@ -1,10 +1,16 @@
 import { MatchListItemData } from './matchListItemData';
+import { UserLeaderboardEntryData, UserStandingData } from './userLeaderboardEntryData';
 
 export interface CompetitionData {
   id: number;
   name: string;
   logo_url: string | null;
+  logo_srcset: string | null;
   start_date: string; // Formatted as YYYY-MM-DD
   end_date: string;   // Formatted as YYYY-MM-DD
-  matches: MatchListItemData[];
+  matches: MatchListItemData[]; // One page of matches
+  matches_next_cursor: string | null; // Pass back as ?cursor= to get the next page
+  matches_is_first_page: boolean;
+  standings: UserLeaderboardEntryData[]; // Top of the competition leaderboard
+  current_user_standing?: UserStandingData | null; // Rank of the logged-in user when outside the top of the standings
 } 
\ No newline at end of file
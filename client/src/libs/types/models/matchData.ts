@@ -9,6 +9,14 @@ export interface LeaderboardEntryType {
     username: string;
   };
   total_gained_points: number;
+  rank: number;
+}
+
+export interface LeaderboardPagination {
+  page: number;
+  num_pages: number;
+  has_next: boolean;
+  has_previous: boolean;
 }
 
 export interface MatchData {
@@ -28,4 +36,5 @@ export interface MatchData {
   score_points: number;
   predictions: Prediction[];
   leaderboard?: LeaderboardEntryType[] | null; // Leaderboard data
+  leaderboard_pagination?: LeaderboardPagination | null; // Page requested with ?leaderboard_page=
 } 
\ No newline at end of file
@@ -1,6 +1,7 @@
 interface TeamInfo {
   name: string;
   logo_url: string | null;
+  logo_srcset: string | null;
 }
 
 export interface MatchListItemData {
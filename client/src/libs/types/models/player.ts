@@ -5,5 +5,6 @@ export interface Player {
   nickname: string;
   role: string;
   photo_url: string | null;
+  photo_srcset: string | null;
   // birth_date was removed by user preference
 } 
\ No newline at end of file
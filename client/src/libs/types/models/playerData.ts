@@ -5,4 +5,5 @@ export interface PlayerData {
   nickname: string | null;
   role: string | null;
   photo_url: string | null;
+  photo_srcset: string | null;
 } 
\ No newline at end of file
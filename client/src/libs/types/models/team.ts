@@ -4,5 +4,6 @@ export interface Team {
   id: number;
   name: string;
   logo_url: string | null;
+  logo_srcset: string | null;
   players: Player[];
 } 
\ No newline at end of file
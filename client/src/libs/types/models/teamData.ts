@@ -5,6 +5,9 @@ export interface TeamData {
   id: number;
   name: string;
   logo_url: string | null;
+  logo_srcset: string | null;
   players: PlayerData[];
-  matches: MatchListItemData[];
+  matches: MatchListItemData[]; // One page of matches
+  matches_next_cursor: string | null; // Pass back as ?cursor= to get the next page
+  matches_is_first_page: boolean;
 } 
\ No newline at end of file
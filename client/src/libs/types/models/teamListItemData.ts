@@ -2,4 +2,5 @@ export interface TeamListItemData {
   id: number;
   name: string;
   logo_url: string | null;
+  logo_srcset: string | null;
 } 
\ No newline at end of file
@@ -4,4 +4,11 @@ export interface UserLeaderboardEntryData {
     username: string;
   };
   score: number; // General user score
+  rank: number;
+}
+
+export interface UserStandingData {
+  rank: number;
+  score: number;
+  entries: UserLeaderboardEntryData[]; // The user with their neighbours above and below
 } 
\ No newline at end of file
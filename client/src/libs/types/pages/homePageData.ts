@@ -1,10 +1,11 @@
-import { UserLeaderboardEntryData } from '../models/userLeaderboardEntryData';
+import { UserLeaderboardEntryData, UserStandingData } from '../models/userLeaderboardEntryData';
 import { MatchListItemData } from '../models/matchListItemData'; // Reused
 import { TeamListItemData } from '../models/teamListItemData';
 import { CompetitionListItemData } from '../models/competitionListItemData';
 
 export interface HomePageData {
   leaderboard: UserLeaderboardEntryData[];
+  current_user_standing?: UserStandingData | null; // Rank of the logged-in user when outside the top 10
   upcoming_matches: MatchListItemData[];
   featured_teams: TeamListItemData[];
   featured_competitions: CompetitionListItemData[];
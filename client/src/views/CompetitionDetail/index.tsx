@@ -8,6 +8,7 @@ import competitionDetailStrings from '@/libs/keychains/competitionDetail.json';
 import { Separator } from "@/components/ui/separator";
 import Layout from '@/components/layout/Layout';
 import { CurrentUser } from '@/libs/types/currentUser';
+import GenericLeaderboard from '@/components/match/MatchLeaderboard';
 
 export interface CompetitionDetailViewProps {
   competition: CompetitionData;
@@ -17,7 +18,15 @@ export interface CompetitionDetailViewProps {
 }
 
 const CompetitionDetailView: React.FC<CompetitionDetailViewProps> = ({ competition, isAuthenticated, currentUser, csrfToken }) => {
-  const { name, logo_url, start_date, end_date, matches } = competition;
+  const { name, logo_url, logo_srcset, start_date, end_date, matches, standings, current_user_standing } = competition;
+
+  const standingsStrings = {
+    title: competitionDetailStrings.standings_title,
+    rank_header: competitionDetailStrings.standings_rank_header,
+    player_header: competitionDetailStrings.standings_player_header,
+    points_header: competitionDetailStrings.standings_points_header,
+    no_data: competitionDetailStrings.no_standings_message,
+  };
 
   const formatDate = (dateString: string) => {
     if (!dateString) return '';
@@ -41,7 +50,7 @@ const CompetitionDetailView: React.FC<CompetitionDetailViewProps> = ({ competiti
           <CardHeader className="p-6 text-center bg-muted/20">
             {logo_url ? (
               <Avatar className={cn("w-24 h-24 sm:w-28 sm:h-28 mx-auto mb-4 border-2 border-border bg-background shadow-sm")}>
-                <AvatarImage src={logo_url} alt={`${name}${competitionDetailStrings.competition_logo_alt}`} className="object-contain" />
+                <AvatarImage src={logo_url} srcSet={logo_srcset ?? undefined} sizes="(min-width: 640px) 112px, 96px" alt={`${name}${competitionDetailStrings.competition_logo_alt}`} className="object-contain" />
                 <AvatarFallback className="text-3xl sm:text-4xl">{getInitials(name)}</AvatarFallback>
               </Avatar>
             ) : (
@@ -56,10 +65,26 @@ const CompetitionDetailView: React.FC<CompetitionDetailViewProps> = ({ competiti
           </CardHeader>
         </Card>
 
+        <GenericLeaderboard
+          leaderboardData={standings}
+          currentUserId={currentUser?.id}
+          strings={standingsStrings}
+          pointsSuffix="pts"
+        />
+        {/* Sent only when the user is outside the top of the standings */}
+        {current_user_standing && (
+          <GenericLeaderboard
+            leaderboardData={current_user_standing.entries}
+            currentUserId={currentUser?.id}
+            strings={{ ...standingsStrings, title: competitionDetailStrings.current_user_standing_title }}
+            pointsSuffix="pts"
+          />
+        )}
+
         <Separator className="my-6 sm:my-8" />
 
         {/* Matches List Section - Now uses MatchListDisplay */}
-        <MatchListDisplay matches={matches} />
+        <MatchListDisplay matches={matches} nextCursor={competition.matches_next_cursor} isFirstPage={competition.matches_is_first_page} pageKey="competition" />
       </div>
     </Layout>
   );
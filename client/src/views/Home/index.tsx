@@ -19,6 +19,7 @@ export interface HomeViewProps extends HomePageData {
 
 const HomeView: React.FC<HomeViewProps> = ({
   leaderboard,
+  current_user_standing,
   upcoming_matches,
   featured_teams,
   featured_competitions,
@@ -48,6 +49,15 @@ const HomeView: React.FC<HomeViewProps> = ({
               strings={leaderboardStrings} 
               pointsSuffix="pts"
             />
+            {/* Sent only when the user is outside the top of the leaderboard */}
+            {current_user_standing && (
+              <GenericLeaderboard
+                leaderboardData={current_user_standing.entries}
+                currentUserId={current_user_id}
+                strings={{ ...leaderboardStrings, title: homeStrings.current_user_standing_title }}
+                pointsSuffix="pts"
+              />
+            )}
             <Card className={cn("shadow-xl border-border")}>
               <CardHeader>
                 <CardTitle className="text-xl sm:text-2xl font-semibold text-foreground">{homeStrings.upcoming_matches_title}</CardTitle>
@@ -20,9 +20,22 @@ import GenericLeaderboard from '@/components/match/MatchLeaderboard'; // Renamed
 // Note: Competition, Team, Player, Prediction are implicitly used through MatchData
 import Layout from '@/components/layout/Layout'; // Import Layout
 import { CurrentUser } from '@/libs/types/currentUser'; // Import CurrentUser
+import { Link } from '@django-bridge/react';
 
 // Local definitions of DjangoMessage, SerializedPredictionAnswer, UserBetDetailsType are removed.
 
+// URL of the current page showing another page of the leaderboard
+const leaderboardPageUrl = (page: number) => {
+  const params = new URLSearchParams(window.location.search);
+  if (page > 1) {
+    params.set('leaderboard_page', String(page));
+  } else {
+    params.delete('leaderboard_page');
+  }
+  const query = params.toString();
+  return query ? `${window.location.pathname}?${query}` : window.location.pathname;
+};
+
 export interface MatchDetailViewProps {
   match: MatchData;
   bet_form: DjangoProvidedForm | null; // Can be null if user already bet
@@ -55,6 +68,7 @@ const MatchDetailView: React.FC<MatchDetailViewProps> = ({
     is_finished,
     points_calculation_done, // Destructure this
     leaderboard, // Destructure leaderboard
+    leaderboard_pagination,
     start_datetime,
   } = match;
 
@@ -94,7 +108,7 @@ const MatchDetailView: React.FC<MatchDetailViewProps> = ({
         <CardHeader>
           {competition.logo_url ? (
             <Avatar className={cn("w-24 h-24 mx-auto mb-4")}>
-              <AvatarImage src={competition.logo_url} alt={`${competition.name}${matchDetailStrings.alt_logo_suffix}`} className='object-cover'/>
+              <AvatarImage src={competition.logo_url} srcSet={competition.logo_srcset ?? undefined} sizes="96px" alt={`${competition.name}${matchDetailStrings.alt_logo_suffix}`} className='object-cover'/>
               <AvatarFallback>{competition.name.substring(0, 1)}</AvatarFallback>
             </Avatar>
           ) : (
@@ -174,7 +188,8 @@ const MatchDetailView: React.FC<MatchDetailViewProps> = ({
         <GenericLeaderboard 
           leaderboardData={leaderboard.map(entry => ({ // Adapt data shape
             user: entry.user,
-            score: entry.total_gained_points 
+            score: entry.total_gained_points,
+            rank: entry.rank
           }))}
           currentUserId={derivedCurrentUserId} // Use derived ID
           strings={{
@@ -185,6 +200,23 @@ const MatchDetailView: React.FC<MatchDetailViewProps> = ({
             no_data: matchDetailStrings.leaderboard_no_data,
           }}
           pointsSuffix="pts"
+          footer={leaderboard_pagination && leaderboard_pagination.num_pages > 1 && (
+            <div className="flex items-center justify-center gap-3 mt-4">
+              {leaderboard_pagination.has_previous && (
+                <Button asChild variant="outline">
+                  <Link href={leaderboardPageUrl(leaderboard_pagination.page - 1)}>{matchDetailStrings.leaderboard_previous_page_button}</Link>
+                </Button>
+              )}
+              <span className="text-sm text-muted-foreground">
+                {matchDetailStrings.leaderboard_page_label} {leaderboard_pagination.page} {matchDetailStrings.leaderboard_page_of} {leaderboard_pagination.num_pages}
+              </span>
+              {leaderboard_pagination.has_next && (
+                <Button asChild variant="outline">
+                  <Link href={leaderboardPageUrl(leaderboard_pagination.page + 1)}>{matchDetailStrings.leaderboard_next_page_button}</Link>
+                </Button>
+              )}
+            </div>
+          )}
         />
       )}
     </Layout>
@@ -18,7 +18,7 @@ export interface TeamDetailViewProps {
 }
 
 const TeamDetailView: React.FC<TeamDetailViewProps> = ({ team, isAuthenticated, currentUser, csrfToken }) => {
-  const { name, logo_url, players, matches } = team;
+  const { name, logo_url, logo_srcset, players, matches } = team;
 
   const getInitials = (nameStr: string) => {
     if (!nameStr) return '';
@@ -33,7 +33,7 @@ const TeamDetailView: React.FC<TeamDetailViewProps> = ({ team, isAuthenticated,
           <CardHeader className="p-6 text-center bg-muted/20">
             {logo_url ? (
               <Avatar className={cn("w-24 h-24 sm:w-28 sm:h-28 mx-auto mb-4 border-2 border-border bg-background shadow-sm")}>
-                <AvatarImage src={logo_url} alt={`${name}${teamDetailStrings.team_logo_alt}`} className="object-contain" />
+                <AvatarImage src={logo_url} srcSet={logo_srcset ?? undefined} sizes="(min-width: 640px) 112px, 96px" alt={`${name}${teamDetailStrings.team_logo_alt}`} className="object-contain" />
                 <AvatarFallback className="text-3xl sm:text-4xl">{getInitials(name)}</AvatarFallback>
               </Avatar>
             ) : (
@@ -71,7 +71,7 @@ const TeamDetailView: React.FC<TeamDetailViewProps> = ({ team, isAuthenticated,
         {/* Matches List Section - Reusing MatchListDisplay */}
         {/* Note: MatchListDisplay expects competitionDetailStrings for its internal headers if no matches */} 
         {/* We might need to pass specific titles or adjust MatchListDisplay if this becomes an issue */} 
-        <MatchListDisplay matches={matches} /> 
+        <MatchListDisplay matches={matches} nextCursor={team.matches_next_cursor} isFirstPage={team.matches_is_first_page} pageKey="team" /> 
 
       </div>
     </Layout>
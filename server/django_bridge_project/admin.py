@@ -1,18 +1,48 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin
 from django import forms
+from django.db import models
 from django.db.models import Q
-from .models import CustomUser, Competition, Team, Player, Match, Prediction, Bet, Answer
+from django.utils import timezone
+from django.utils.decorators import method_decorator
+from django.views.decorators.csrf import csrf_exempt
+from .models import CustomUser, Competition, Team, Player, Match, Prediction, Bet, Answer, SettlementJob
 from .enums.prediction_types import PredictionType
+from .enums.settlement_job_status import SettlementJobStatus
+from .services.player_name_resolver import PlayerNameResolver
+from .forms.image_fields import ModelValidatedImageField
+from .validators.upload_handlers import MaxSizeUploadHandler
+
+# Images are validated once, by the model's clean() (CustomImageValidator)
+IMAGE_FORMFIELD_OVERRIDES = {models.ImageField: {'form_class': ModelValidatedImageField}}
+
+class ImageUploadAdminMixin:
+    """
+    Drops oversized images while they stream in (MaxSizeUploadHandler), on the add and change
+    views of admins that take images, inlines included. The handler must be in place before
+    request.POST is read, which CsrfViewMiddleware would do: the views are exempted from the
+    middleware, and changeform_view checks the CSRF token itself (csrf_protect).
+    """
+
+    @method_decorator(csrf_exempt)
+    def add_view(self, request, form_url='', extra_context=None):
+        request.upload_handlers.insert(0, MaxSizeUploadHandler(request))
+        return super().add_view(request, form_url, extra_context)
+
+    @method_decorator(csrf_exempt)
+    def change_view(self, request, object_id, form_url='', extra_context=None):
+        request.upload_handlers.insert(0, MaxSizeUploadHandler(request))
+        return super().change_view(request, object_id, form_url, extra_context)
 
 # To customize the CustomUser admin:
 class CustomUserAdmin(UserAdmin):
-    list_display = UserAdmin.list_display + ('score',)
+    list_display = UserAdmin.list_display + ('score', 'is_bot')
+    list_filter = UserAdmin.list_filter + ('is_bot', 'bot_strategy')
     fieldsets = UserAdmin.fieldsets + (
-        (None, {'fields': ('score',)}),
+        (None, {'fields': ('score', 'is_bot', 'bot_strategy')}),
     )
     add_fieldsets = UserAdmin.add_fieldsets + (
-        (None, {'fields': ('score',)}),
+        (None, {'fields': ('score', 'is_bot', 'bot_strategy')}),
     )
 
 admin.site.register(CustomUser, CustomUserAdmin)
@@ -21,15 +51,20 @@ admin.site.register(CustomUser, CustomUserAdmin)
 class PlayerInline(admin.StackedInline):
     model = Player
     extra = 1 # Number of empty forms to display
+    formfield_overrides = IMAGE_FORMFIELD_OVERRIDES
     # No 'fields' attribute here means it will show all fields by default
     # fields = ['first_name', 'last_name', 'role'] # Removed this line
     # readonly_fields = ['photo', 'birth_date'] 
 
 # Custom Admin for Team model
-class TeamAdmin(admin.ModelAdmin):
+class TeamAdmin(ImageUploadAdminMixin, admin.ModelAdmin):
     list_display = ['name']
     search_fields = ['name']
     inlines = [PlayerInline]
+    formfield_overrides = IMAGE_FORMFIELD_OVERRIDES
+
+class CompetitionAdmin(ImageUploadAdminMixin, admin.ModelAdmin):
+    formfield_overrides = IMAGE_FORMFIELD_OVERRIDES
 
 # Custom ModelForm for Prediction inline
 class PredictionAdminForm(forms.ModelForm):
@@ -133,18 +168,28 @@ class PredictionInline(admin.StackedInline):
         # 'correct_value' should be editable in this case.
         return list(super().get_readonly_fields(request, obj) or [])
 
+    def _get_player_names(self, match_id):
+        """
+        One resolver per match for this inline (inline instances live for a single request):
+        the correct values of all PLAYER predictions of the match are fetched together.
+        """
+        if not hasattr(self, '_player_names_by_match'):
+            self._player_names_by_match = {}
+        if match_id not in self._player_names_by_match:
+            player_predictions = Prediction.objects.filter(match_id=match_id, prediction_type=PredictionType.PLAYER.value)
+            self._player_names_by_match[match_id] = PlayerNameResolver(player_predictions.values_list('correct_value', flat=True))
+        return self._player_names_by_match[match_id]
+
     def correct_value(self, obj):
         """Custom display for the read-only correct_value field."""
         if obj is None or obj.correct_value is None or obj.correct_value == '':
             return "-" 
 
         if obj.prediction_type == PredictionType.PLAYER.value:
-            try:
-                player_id = int(obj.correct_value)
-                player = Player.objects.get(pk=player_id)
-                return str(player)
-            except (ValueError, Player.DoesNotExist):
+            player = self._get_player_names(obj.match_id).get_player(obj.correct_value)
+            if player is None:
                 return f"Invalid Player ID: {obj.correct_value}"
+            return str(player)
         elif obj.prediction_type == PredictionType.BOOLEAN.value:
             if str(obj.correct_value).lower() == 'true':
                 return "Yes"
@@ -194,7 +239,30 @@ class MatchAdmin(admin.ModelAdmin):
         # return list(base_readonly_fields)
         return [] # Default: no fields are read-only unless specified in readonly_fields attribute
 
+# Read-only admin for the settlement queue, with a retry action for failed jobs
+class SettlementJobAdmin(admin.ModelAdmin):
+    list_display = ('match', 'status', 'attempts', 'duration_seconds', 'created_at', 'started_at', 'finished_at')
+    list_filter = ('status',)
+    search_fields = ('match__team_one__name', 'match__team_two__name')
+    list_select_related = ('match__team_one', 'match__team_two', 'match__competition')
+    readonly_fields = ('match', 'status', 'attempts', 'available_at', 'created_at', 'started_at', 'finished_at',
+                       'duration_seconds', 'result_message')
+    actions = ['retry_jobs']
+
+    def has_add_permission(self, request):
+        return False
+
+    @admin.action(description="Retry selected failed jobs")
+    def retry_jobs(self, request, queryset):
+        updated = queryset.filter(status=SettlementJobStatus.FAILED.value).update(
+            status=SettlementJobStatus.PENDING.value,
+            attempts=0,
+            available_at=timezone.now(),
+        )
+        self.message_user(request, f"{updated} job(s) queued again.")
+
 # Register other models
-admin.site.register(Competition)
+admin.site.register(Competition, CompetitionAdmin)
 admin.site.register(Team, TeamAdmin) # Use custom TeamAdmin
-admin.site.register(Match, MatchAdmin) # Use custom MatchAdmin
\ No newline at end of file
+admin.site.register(Match, MatchAdmin) # Use custom MatchAdmin
+admin.site.register(SettlementJob, SettlementJobAdmin)
\ No newline at end of file
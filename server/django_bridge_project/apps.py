@@ -5,4 +5,5 @@ class DjangoBridgeProjectConfig(AppConfig):
     name = 'django_bridge_project' # Make sure this matches your app's name in INSTALLED_APPS
 
     def ready(self):
-        import django_bridge_project.signals # Import your signals module 
\ No newline at end of file
+        import django_bridge_project.signals # Import your signals module 
+        import django_bridge_project.checks
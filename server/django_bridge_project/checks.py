@@ -0,0 +1,19 @@
+from django.conf import settings
+from django.core.checks import Tags, Warning, register
+from django_bridge_project.services.version_stamps import VersionStamps
+
+@register(Tags.caches)
+def check_shared_cache(app_configs, **kwargs):
+    """
+    Cached pages, forms and ETags are invalidated through version stamps in the default
+    cache, which the web workers and the settle worker must all see.
+    """
+    if settings.DEBUG or VersionStamps.is_shared():
+        return []
+    return [Warning(
+        "The default cache is local to each process, so data changed by one gunicorn worker or by the "
+        "settle worker stays stale in the caches of the others.",
+        hint="Set DJANGO_CACHE_BACKEND and DJANGO_CACHE_LOCATION to a shared cache, e.g. "
+             "django.core.cache.backends.redis.RedisCache with redis://localhost:6379/0.",
+        id="django_bridge_project.W001",
+    )]
@@ -4,7 +4,7 @@ from django.urls import reverse
 from django.views import View # Import Django's base View class
 from django.middleware.csrf import get_token # Added import
 
-from django_bridge.response import Response
+from .utils.bridge_response import Response
 
 from ..forms import LoginForm, RegistrationForm # Use relative import for forms
 
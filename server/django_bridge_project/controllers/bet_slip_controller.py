@@ -0,0 +1,32 @@
+import json
+
+from django.http import JsonResponse
+from django_bridge_project.services.bet_placement_service import BetPlacement
+
+class BetSlipController:
+    """
+    Controller for the JSON betting API: one request places bets on many matches.
+    """
+    def submit_slip(self, request):
+        """
+        Expects {"bets": [{"match_id": 1, "match_winner": "3", "predictions": {"7": "12"}}, ...]}.
+        "match_winner" is a team id or "0" for a draw, "predictions" maps prediction ids to answers.
+        All bets are placed or none: any invalid entry returns 400 with the errors by match id.
+        """
+        if not request.user.is_authenticated:
+            return JsonResponse({"error": "Authentication required."}, status=401)
+
+        try:
+            payload = json.loads(request.body)
+            entries = payload["bets"]
+        except (ValueError, TypeError, KeyError):
+            return JsonResponse({"error": "Expected a JSON object with a \"bets\" list."}, status=400)
+        if not isinstance(entries, list) or not entries or not all(isinstance(entry, dict) for entry in entries):
+            return JsonResponse({"error": "\"bets\" must be a non-empty list of objects."}, status=400)
+        if len(entries) > BetPlacement.MAX_SLIP_SIZE:
+            return JsonResponse({"error": f"A slip can contain at most {BetPlacement.MAX_SLIP_SIZE} bets."}, status=400)
+
+        bets, errors = BetPlacement.place_slip(request.user, entries)
+        if errors:
+            return JsonResponse({"errors": errors}, status=400)
+        return JsonResponse({"bets": [{"match_id": bet.match_id, "bet_id": bet.id} for bet in bets]}, status=201)
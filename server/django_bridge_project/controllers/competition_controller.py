@@ -1,6 +1,6 @@
 from django.shortcuts import get_object_or_404
 from django_bridge_project.models import Competition # Removed Match, Team as they are handled by helper
-from django_bridge.response import Response
+from .utils.bridge_response import Response
 # from django.urls import reverse # Not strictly needed here anymore
 from .utils.competition_data_helper import CompetitionDataHelper # Import the new helper
 from django.middleware.csrf import get_token # Added import
@@ -0,0 +1,64 @@
+import mimetypes
+import os
+
+from django.conf import settings
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core.exceptions import SuspiciousFileOperation
+from django.http import FileResponse, Http404, HttpResponseNotModified
+from django.utils._os import safe_join
+from django.utils.cache import patch_vary_headers
+from django.utils.http import http_date
+from django.views.static import was_modified_since
+from django_bridge_project.storage.content_addressed_storage import ContentAddressedStorage
+
+class FileServingController:
+    """
+    Serves uploaded media and collected static files from the app server, for deployments
+    without a web server in front of gunicorn. Files whose name carries a hash of their content
+    are cached for a year as immutable; the others for an hour. Text files are sent as their
+    precompressed .gz (CompressedManifestStaticFilesStorage) to clients accepting gzip. Under
+    gunicorn the file body is sent with sendfile (wsgi.file_wrapper).
+    """
+    IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+    DEFAULT_CACHE_CONTROL = "public, max-age=3600"
+
+    _hashed_static_names = None # Hashed names of the staticfiles manifest, loaded once per process
+
+    def serve_media(self, request, path):
+        return self._serve(request, settings.MEDIA_ROOT, path, ContentAddressedStorage.is_content_addressed(path))
+
+    def serve_static(self, request, path):
+        if FileServingController._hashed_static_names is None:
+            # The manifest maps original names to hashed ones
+            FileServingController._hashed_static_names = set(getattr(staticfiles_storage, 'hashed_files', {}).values())
+        is_immutable = path in FileServingController._hashed_static_names
+        return self._serve(request, settings.STATIC_ROOT, path, is_immutable)
+
+    def _serve(self, request, root, path, is_immutable):
+        try:
+            full_path = safe_join(root, path)
+        except SuspiciousFileOperation:
+            raise Http404("File not found.")
+        if not os.path.isfile(full_path):
+            raise Http404("File not found.")
+
+        content_type, _encoding = mimetypes.guess_type(full_path)
+        sent_path, content_encoding = full_path, None
+        compressed_path = f"{full_path}.gz"
+        has_compressed = os.path.isfile(compressed_path)
+        if has_compressed and "gzip" in request.headers.get("Accept-Encoding", ""):
+            sent_path, content_encoding = compressed_path, "gzip"
+
+        stat = os.stat(sent_path)
+        if not was_modified_since(request.headers.get("If-Modified-Since"), stat.st_mtime):
+            response = HttpResponseNotModified()
+        else:
+            response = FileResponse(open(sent_path, 'rb'), content_type=content_type or "application/octet-stream")
+            response["Last-Modified"] = http_date(stat.st_mtime)
+            response["Content-Length"] = stat.st_size
+            if content_encoding:
+                response["Content-Encoding"] = content_encoding
+        if has_compressed:
+            patch_vary_headers(response, ("Accept-Encoding",))
+        response["Cache-Control"] = self.IMMUTABLE_CACHE_CONTROL if is_immutable else self.DEFAULT_CACHE_CONTROL
+        return response
@@ -0,0 +1,44 @@
+from django.http import JsonResponse
+from django.utils import timezone
+from django_bridge_project.services.leaderboard_service import get_global_leaderboard
+from django_bridge_project.services.scoped_leaderboards import ScopedLeaderboards
+
+class LeaderboardController:
+    """
+    Controller serving the global and scoped leaderboards as JSON, one keyset page at a time.
+    """
+    def _get_leaderboard(self, request):
+        """
+        ?scope=competition:<id>, ?scope=week / ?scope=month (current period) or an explicit
+        week:YYYY-Www / month:YYYY-MM selects a scoped board. No scope means the global board.
+        """
+        scope = request.GET.get('scope')
+        if not scope:
+            return get_global_leaderboard()
+        if scope == 'week':
+            scope = ScopedLeaderboards.week_scope(timezone.now())
+        elif scope == 'month':
+            scope = ScopedLeaderboards.month_scope(timezone.now())
+        if not ScopedLeaderboards.is_valid_scope(scope):
+            return None
+        return ScopedLeaderboards.get_leaderboard(scope)
+
+    def get_leaderboard_page(self, request):
+        """
+        ?cursor= continues after the last page received, ?limit= sets the page size.
+        ?around_me=1 returns the authenticated user's rank and neighbours instead.
+        """
+        leaderboard = self._get_leaderboard(request)
+        if leaderboard is None:
+            return JsonResponse({"error": "Unknown leaderboard scope."}, status=400)
+
+        if request.GET.get('around_me'):
+            if not request.user.is_authenticated:
+                return JsonResponse({"error": "Authentication required."}, status=401)
+            return JsonResponse({"standing": leaderboard.get_standing(request.user.id)})
+
+        try:
+            limit = int(request.GET.get('limit', leaderboard.DEFAULT_PAGE_SIZE))
+        except ValueError:
+            limit = leaderboard.DEFAULT_PAGE_SIZE
+        return JsonResponse(leaderboard.get_page(cursor=request.GET.get('cursor'), limit=max(limit, 1)))
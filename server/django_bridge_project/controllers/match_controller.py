@@ -4,13 +4,14 @@ from django_bridge_project.models import Match, Bet, Answer, Team, Prediction #
 from django.views import View
 from django.utils.decorators import method_decorator
 from django.views.decorators.csrf import csrf_exempt # If you need to exempt CSRF for API-like views
-from django_bridge.response import Response # ADDED
+from .utils.bridge_response import Response
 from django_bridge_project.forms.utils.bet_form_utils import BetFormGenerator # Import BetFormGenerator
 from django.middleware.csrf import get_token # Import get_token
 from django.urls import reverse # To generate action_url
 from django.contrib import messages as django_messages # Use an alias
 from django.db import transaction # Added transaction for atomic operations
-from .utils.match_data_helper import MatchDataHelper # Import the new helper
+from django_bridge_project.services.bet_placement_service import BetAlreadyPlacedError
+from .utils.match_data_helper import MatchDataHelper
 from .utils.user_bet_data_helper import UserBetDataHelper # Import the new helper
 
 # It's good practice to define a base controller if you have common functionalities
@@ -26,7 +27,7 @@ class MatchController(View):
         Fetches match data, creates/uses a betting form, and renders the MatchDetail React component page.
         """
         try:
-            match_instance = get_object_or_404(Match, pk=match_id)
+            match_instance = get_object_or_404(MatchDataHelper.get_match_detail_queryset(), pk=match_id)
 
             # Use the helper to get match_data
             helper = MatchDataHelper(request, match_instance)
@@ -41,7 +42,12 @@ class MatchController(View):
             # Or if a bet already exists, we don't need to generate/pass the form for new betting
             final_bet_form = None
             if not user_bet_details: # Only prepare a new form if no existing bet
-                final_bet_form = bet_form_instance if bet_form_instance is not None else BetFormGenerator.create_bet_form_for_match(match_instance, request=request)
+                if bet_form_instance is not None:
+                    final_bet_form = bet_form_instance
+                elif request.method == 'POST':
+                    final_bet_form = BetFormGenerator.create_bet_form_for_match(match_instance, request=request)
+                else: # An empty form packs the same for everyone, so its packed value is cached
+                    final_bet_form = BetFormGenerator.get_prepacked_unbound_form(match_instance)
             
             # Extract messages for React
             contrib_messages = django_messages.get_messages(request)
@@ -88,7 +94,7 @@ class MatchController(View):
             return self.render_match_detail_page(request, match_id)
 
         try:
-            match_instance = get_object_or_404(Match, pk=match_id)
+            match_instance = get_object_or_404(MatchDataHelper.get_match_detail_queryset(), pk=match_id)
         except Http404:
             raise
 
@@ -97,10 +103,6 @@ class MatchController(View):
             django_messages.error(request, "This match has already finished. Betting is closed.")
             return self.render_match_detail_page(request, match_id)
 
-        if Bet.objects.filter(user=request.user, match=match_instance).exists():
-            django_messages.warning(request, "You have already placed a bet on this match.") # Ensure message is set before re-render
-            return self.render_match_detail_page(request, match_id) # Re-render with the message
-
         bet_form = BetFormGenerator.create_bet_form_for_match(match_instance, request=request) # Binds POST data
 
         if bet_form.is_valid():
@@ -119,7 +121,10 @@ class MatchController(View):
 
                 django_messages.success(request, "Your bet has been placed successfully!")
                 return redirect(reverse('match_detail', kwargs={'match_id': match_id}))
-            except Http404: # Raised if get_object_or_404 fails for team or prediction inside helper
+            except BetAlreadyPlacedError: # The unique (match, user) constraint replaces an exists() pre-check
+                django_messages.warning(request, "You have already placed a bet on this match.")
+                return self.render_match_detail_page(request, match_id)
+            except Http404: # Raised if the winner or a prediction does not belong to the match
                 django_messages.error(request, "Error finding team or prediction details. Bet not placed.")
                 # Transaction will rollback
                 return self.render_match_detail_page(request, match_id, bet_form_instance=bet_form)
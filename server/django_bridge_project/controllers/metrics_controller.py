@@ -0,0 +1,14 @@
+from django.http import JsonResponse
+from django_bridge_project.services.request_metrics import RequestMetricsHistogram
+
+class MetricsController:
+    """
+    Controller dumping the request metrics histogram of the current worker process (staff only).
+    """
+    def get_request_metrics(self, request):
+        if not request.user.is_authenticated or not request.user.is_staff:
+            return JsonResponse({"error": "Staff access required."}, status=403)
+        return JsonResponse({
+            "window_size": RequestMetricsHistogram.WINDOW_SIZE,
+            "views": RequestMetricsHistogram.snapshot(),
+        })
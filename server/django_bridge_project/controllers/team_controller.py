@@ -1,6 +1,6 @@
 from django.shortcuts import get_object_or_404
 from django_bridge_project.models import Team
-from django_bridge.response import Response
+from .utils.bridge_response import Response
 from .utils.team_data_helper import TeamDataHelper
 from django.middleware.csrf import get_token
 
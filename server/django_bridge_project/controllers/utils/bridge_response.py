@@ -0,0 +1,34 @@
+import time
+
+from django.http import HttpResponse
+from django.utils.cache import patch_cache_control
+from django_bridge.response import Response as BridgeResponse
+from django_bridge_project.services.request_metrics import RequestMetrics
+
+class Response(BridgeResponse):
+    """
+    django-bridge Response that reports the time spent packing and encoding the props
+    to the request metrics (the "ser" entry of the Server-Timing header).
+    """
+    def __init__(self, request, *args, **kwargs):
+        metrics = RequestMetrics.for_request(request)
+        if metrics is None:
+            super().__init__(request, *args, **kwargs)
+            return
+
+        started = time.perf_counter()
+        sql_seconds_before = metrics.sql_seconds # Reading the messages can hit the session store
+        super().__init__(request, *args, **kwargs)
+        metrics.serialization_seconds += time.perf_counter() - started - (metrics.sql_seconds - sql_seconds_before)
+
+
+class ReplayedResponse(BridgeResponse):
+    """
+    Response replayed from the encoded body of an earlier one (AnonymousPageCache), without
+    packing the props again. It is still a django-bridge response, so the middleware wraps it
+    in the bootstrap page for regular browser requests.
+    """
+    def __init__(self, content):
+        HttpResponse.__init__(self, content, content_type="application/json") # Skips the packing in BaseResponse
+        self["X-DjangoBridge-Action"] = self.action
+        patch_cache_control(self, no_store=True) # As BaseResponse does
@@ -1,49 +1,44 @@
-from django_bridge_project.models import Competition, Match, Team
+from django_bridge_project.models import Competition
+from django_bridge_project.services.match_list_service import MatchList, get_competition_match_list
+from django_bridge_project.services.scoped_leaderboards import ScopedLeaderboards
+from .serializers import PageSerializer, COMPETITION_DETAIL_FIELDS, MATCH_TEAM_FIELDS
 
 class CompetitionDataHelper:
     def __init__(self, request, competition_instance: Competition):
         self.request = request
         self.competition_instance = competition_instance
+        self.serializer = PageSerializer(request)
 
-    def _serialize_team_info(self, team_instance: Team):
-        if not team_instance:
-            return None
-        logo_url = None
-        if team_instance.logo and hasattr(team_instance.logo, 'url'):
-            logo_url = self.request.build_absolute_uri(team_instance.logo.url)
-        return {
-            "name": team_instance.name,
-            "logo_url": logo_url,
-        }
+    def _get_standings_data(self, limit=10):
+        """Top of the competition leaderboard, and the user's standing when they are not in it."""
+        leaderboard = ScopedLeaderboards.get_leaderboard(ScopedLeaderboards.competition_scope(self.competition_instance.id))
+        standings = leaderboard.get_page(limit=limit)["entries"]
+        current_user_standing = None
+        if self.request.user.is_authenticated and all(entry["user"]["id"] != self.request.user.id for entry in standings):
+            current_user_standing = leaderboard.get_standing(self.request.user.id)
+        return standings, current_user_standing
 
-    def _serialize_match_list_item(self, match_instance: Match):
-        return {
-            "id": match_instance.id,
-            "team_one": self._serialize_team_info(match_instance.team_one),
-            "team_two": self._serialize_team_info(match_instance.team_two),
-            "start_datetime": match_instance.start_datetime.isoformat(),
-            "is_finished": match_instance.is_finished,
-        }
+    def _get_matches_page(self):
+        """One page of the competition's matches in schedule order. ?cursor= continues after the previous page."""
+        try:
+            limit = max(int(self.request.GET.get('limit', MatchList.DEFAULT_PAGE_SIZE)), 1)
+        except ValueError:
+            limit = MatchList.DEFAULT_PAGE_SIZE
+        return get_competition_match_list(self.competition_instance.id).get_page(cursor=self.request.GET.get('cursor'), limit=limit)
 
     def get_competition_data(self):
         """
-        Fetches and serializes competition data and its matches.
+        Fetches and serializes competition data and one page of its matches.
         """
-        competition_logo_url = None
-        if self.competition_instance.logo and hasattr(self.competition_instance.logo, 'url'):
-            competition_logo_url = self.request.build_absolute_uri(self.competition_instance.logo.url)
-
-        matches_qs = Match.objects.filter(competition=self.competition_instance)\
-                                .select_related('team_one', 'team_two')\
-                                .order_by('start_datetime')
-        
-        serialized_matches = [self._serialize_match_list_item(match) for match in matches_qs]
+        matches_page = self._get_matches_page()
+        serialized_matches = [self.serializer.match_list_item(match, team_fields=MATCH_TEAM_FIELDS) for match in matches_page["matches"]]
+        standings, current_user_standing = self._get_standings_data()
 
         return {
-            "id": self.competition_instance.id,
-            "name": self.competition_instance.name,
-            "logo_url": competition_logo_url,
-            "start_date": self.competition_instance.start_date.isoformat(),
-            "end_date": self.competition_instance.end_date.isoformat(),
+            **self.serializer.competition(self.competition_instance, COMPETITION_DETAIL_FIELDS),
             "matches": serialized_matches,
-        } 
\ No newline at end of file
+            "matches_next_cursor": matches_page["next_cursor"],
+            "matches_is_first_page": not self.request.GET.get('cursor'),
+            "standings": standings,
+            "current_user_standing": current_user_standing,
+        }
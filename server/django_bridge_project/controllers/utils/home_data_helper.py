@@ -1,51 +1,30 @@
+import random
+from django.core.cache import cache
 from django.utils import timezone
 from datetime import timedelta
-from django_bridge_project.models import CustomUser, Match, Team, Competition
+from django_bridge_project.models import Match, Team, Competition
+from django_bridge_project.services.leaderboard_service import get_global_leaderboard
+from django_bridge_project.services.version_stamps import VersionStamps
 from django.middleware.csrf import get_token
+from .serializers import PageSerializer, COMPETITION_LIST_FIELDS, TEAM_LIST_FIELDS
 
 class HomeDataHelper:
+    SHARED_PAYLOAD_TIMEOUT = 60 # seconds
+
     def __init__(self, request):
         self.request = request
+        self.serializer = PageSerializer(request)
 
     def _get_general_leaderboard_data(self, limit=10):
-        users = CustomUser.objects.order_by('-score', 'username')[:limit]
-        leaderboard_data = []
-        for user in users:
-            leaderboard_data.append({
-                "user": {"id": user.id, "username": user.username},
-                "score": user.score
-            })
-        return leaderboard_data
-
-    # Common serialization logic for team/competition list items
-    def _serialize_generic_list_item(self, instance, type_name="item"):
-        logo_url = None
-        if instance.logo and hasattr(instance.logo, 'url'):
-            logo_url = self.request.build_absolute_uri(instance.logo.url)
-        return {
-            "id": instance.id,
-            "name": instance.name,
-            "logo_url": logo_url,
-        }
+        return get_global_leaderboard().get_page(limit=limit)["entries"]
 
-    def _serialize_team_list_item(self, team_instance: Team):
-        return self._serialize_generic_list_item(team_instance, "team")
-
-    def _serialize_competition_list_item(self, competition_instance: Competition):
-        return self._serialize_generic_list_item(competition_instance, "competition")
-    
-    # Match list item serialization (similar to what's in other helpers)
-    # Consider centralizing this if it becomes too repetitive
-    def _serialize_match_list_item(self, match_instance: Match):
-        team_one_info = self._serialize_team_list_item(match_instance.team_one) if match_instance.team_one else None
-        team_two_info = self._serialize_team_list_item(match_instance.team_two) if match_instance.team_two else None
-        return {
-            "id": match_instance.id,
-            "team_one": team_one_info,
-            "team_two": team_two_info,
-            "start_datetime": match_instance.start_datetime.isoformat(),
-            "is_finished": match_instance.is_finished, 
-        }
+    def _get_current_user_standing(self, leaderboard):
+        """Rank of the current user with their neighbours, for users outside the top of the board."""
+        if not self.request.user.is_authenticated:
+            return None
+        if any(entry["user"]["id"] == self.request.user.id for entry in leaderboard):
+            return None # Already highlighted in the leaderboard
+        return get_global_leaderboard().get_standing(self.request.user.id)
 
     def _get_upcoming_matches_data(self, limit=5):
         now = timezone.now()
@@ -55,12 +34,20 @@ class HomeDataHelper:
             # start_datetime__lte=now + timedelta(days=7), # Optional: to limit how far in future
             is_finished=False
         ).select_related('team_one', 'team_two').order_by('start_datetime')[:limit]
-        return [self._serialize_match_list_item(match) for match in upcoming_matches_qs]
+        return [self.serializer.match_list_item(match, team_fields=TEAM_LIST_FIELDS) for match in upcoming_matches_qs]
+
+    def _get_featured_teams_pool_data(self, pool_size=24):
+        """
+        Random pool of teams the featured teams are drawn from on each hit.
+        Sampling ids in Python avoids ORDER BY RANDOM(), which sorts the whole table.
+        """
+        team_ids = list(Team.objects.values_list('id', flat=True))
+        sampled_ids = random.sample(team_ids, min(pool_size, len(team_ids)))
+        teams_qs = Team.objects.filter(id__in=sampled_ids)
+        return [self.serializer.team(team, TEAM_LIST_FIELDS) for team in teams_qs]
 
-    def _get_featured_teams_data(self, limit=6):
-        # Simple approach: get some teams, maybe ordered by name or randomly later
-        teams_qs = Team.objects.all().order_by('?')[:limit] # Random order for variety
-        return [self._serialize_team_list_item(team) for team in teams_qs]
+    def _get_featured_teams_data(self, pool, limit=6):
+        return random.sample(pool, min(limit, len(pool))) # Random order for variety
 
     def _get_featured_competitions_data(self, limit=4):
         now = timezone.now()
@@ -68,7 +55,30 @@ class HomeDataHelper:
         competitions_qs = Competition.objects.filter(
             end_date__gte=now
         ).order_by('start_date')[:limit]
-        return [self._serialize_competition_list_item(comp) for comp in competitions_qs]
+        return [self.serializer.competition(comp, COMPETITION_LIST_FIELDS) for comp in competitions_qs]
+
+    def _get_shared_payload(self):
+        """
+        The part of the home page that is the same for every visitor, cached under the
+        "home" version stamp. Match, Team and Competition changes and settlements bump the
+        stamp; the timeout bounds how long upcoming matches can lag behind the clock.
+        Absolute media URLs depend on the scheme and host, so they are part of the key.
+        """
+        cache_key = "home:payload:{version}:{scheme}:{host}".format(
+            version=VersionStamps.get("home"),
+            scheme=self.request.scheme,
+            host=self.request.get_host(),
+        )
+        payload = cache.get(cache_key)
+        if payload is None:
+            payload = {
+                "leaderboard": self._get_general_leaderboard_data(),
+                "upcoming_matches": self._get_upcoming_matches_data(),
+                "featured_teams_pool": self._get_featured_teams_pool_data(),
+                "featured_competitions": self._get_featured_competitions_data(),
+            }
+            cache.set(cache_key, payload, self.SHARED_PAYLOAD_TIMEOUT)
+        return payload
 
     def get_home_page_data(self):
         current_user_id = self.request.user.id if self.request.user.is_authenticated else None
@@ -80,13 +90,15 @@ class HomeDataHelper:
                 "score": self.request.user.score # Assuming CustomUser has a score field
             }
 
+        shared_payload = self._get_shared_payload()
         return {
-            "leaderboard": self._get_general_leaderboard_data(),
-            "upcoming_matches": self._get_upcoming_matches_data(),
-            "featured_teams": self._get_featured_teams_data(),
-            "featured_competitions": self._get_featured_competitions_data(),
+            "leaderboard": shared_payload["leaderboard"],
+            "current_user_standing": self._get_current_user_standing(shared_payload["leaderboard"]),
+            "upcoming_matches": shared_payload["upcoming_matches"],
+            "featured_teams": self._get_featured_teams_data(shared_payload["featured_teams_pool"]),
+            "featured_competitions": shared_payload["featured_competitions"],
             "current_user_id": current_user_id, # Kept for existing GenericLeaderboard logic if needed, but ideally use currentUser directly
             "isAuthenticated": self.request.user.is_authenticated,
             "currentUser": current_user_data,
             "csrfToken": get_token(self.request),
-        } 
\ No newline at end of file
+        }
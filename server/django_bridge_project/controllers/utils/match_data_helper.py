@@ -1,119 +1,79 @@
-from django_bridge_project.models import Match, Bet, Answer, Team, Prediction # Added Bet, Answer, Team, Prediction
-from django.shortcuts import get_object_or_404 # Added for the new method
-from django_bridge_project.services.points_attribution_helper import PointsAttributionHelper # Added import
+from django_bridge_project.models import Match, Bet, Player
+from django_bridge_project.services.bet_placement_service import BetPlacement
+from django.db.models import Prefetch
+from django.core.paginator import Paginator
+from .serializers import PageSerializer, TEAM_DETAIL_FIELDS
 
 class MatchDataHelper:
+    LEADERBOARD_PAGE_SIZE = 50
+
     def __init__(self, request, match_instance: Match):
         self.request = request
         self.match_instance = match_instance
-        # Instantiate PointsAttributionHelper if match is finished for _get_actual_winner_id
-        if self.match_instance.is_finished:
-            self.points_helper = PointsAttributionHelper(self.match_instance)
-        else:
-            self.points_helper = None
-
-    def _get_actual_winner_id(self) -> int | None:
-        """Gets the actual winner ID using PointsAttributionHelper."""
-        if self.points_helper:
-            return self.points_helper._determine_actual_winner_team_id()
-        return None # Should not be called if match not finished / points_helper not init
-
-    def _serialize_competition(self, competition):
-        if not competition:
-            return None
-        logo_url = None
-        if competition.logo and hasattr(competition.logo, 'url'):
-            logo_url = self.request.build_absolute_uri(competition.logo.url)
-        return {
-            "id": competition.id,
-            "name": competition.name,
-            "logo_url": logo_url
-        }
+        self.serializer = PageSerializer(request)
 
-    def _serialize_team(self, team):
-        if not team:
-            return None
-        logo_url = None
-        if team.logo and hasattr(team.logo, 'url'):
-            logo_url = self.request.build_absolute_uri(team.logo.url)
-        
-        players_data = []
-        # Ensure players related name is correct, e.g., team.players.all()
-        for player in team.players.all(): 
-            photo_url = None
-            if player.photo and hasattr(player.photo, 'url'):
-                photo_url = self.request.build_absolute_uri(player.photo.url)
-            players_data.append({
-                "id": player.id,
-                "first_name": player.first_name,
-                "last_name": player.last_name,
-                "nickname": player.nickname,
-                "role": player.role,
-                "photo_url": photo_url
-            })
-
-        return {
-            "id": team.id,
-            "name": team.name,
-            "logo_url": logo_url,
-            "players": players_data
-        }
+    @staticmethod
+    def get_match_detail_queryset():
+        """
+        Loads a match with everything the detail page, the bet form and the user's bet need:
+        competition and teams are joined, both rosters and the predictions are prefetched,
+        so the page costs a fixed number of queries whatever the roster sizes.
+        """
+        players_qs = Player.objects.order_by('last_name', 'first_name')
+        return Match.objects.select_related('competition', 'team_one', 'team_two')\
+                            .prefetch_related(Prefetch('team_one__players', queryset=players_qs),
+                                              Prefetch('team_two__players', queryset=players_qs),
+                                              'predictions')
 
     def _serialize_predictions(self):
-        predictions_data = []
-        for pred in self.match_instance.predictions.all():
-            predictions_data.append({
-                "id": pred.id,
-                "label": pred.label,
-                "prediction_type": pred.prediction_type,
-                "score_points": pred.score_points,
-                "correct_value": pred.correct_value,
-            })
-        return predictions_data
+        return [self.serializer.prediction(pred) for pred in self.match_instance.predictions.all()]
 
-    def _get_match_leaderboard_data(self):
-        if not self.match_instance.points_calculation_done or not self.points_helper:
+    def _get_match_leaderboard_page(self):
+        """
+        Reads the points stored on each bet at settlement, best first, one page at a time.
+        Served by the (match, -points_awarded, user) index.
+        """
+        if not self.match_instance.points_calculation_done:
             return None
 
-        leaderboard = []
-        actual_winner_id = self._get_actual_winner_id()
-        if actual_winner_id is None: # Should not happen if points_calculation_done is True
-            return None 
+        bets = Bet.objects.filter(match=self.match_instance, points_awarded__isnull=False)\
+                          .select_related('user')\
+                          .only('id', 'points_awarded', 'user__id', 'user__username')\
+                          .order_by('-points_awarded', 'user_id')
+        paginator = Paginator(bets, self.LEADERBOARD_PAGE_SIZE)
+        return paginator.get_page(self.request.GET.get('leaderboard_page'))
 
-        bets = Bet.objects.filter(match=self.match_instance)\
-                          .select_related('user', 'winner_team')\
-                          .prefetch_related('answers__prediction')
-
-        for bet in bets:
-            user_total_points_for_this_bet = 0
-            predicted_winner_id = bet.winner_team_id if bet.winner_team else 0
-            
-            user_total_points_for_this_bet += PointsAttributionHelper.calculate_points_for_match_winner(
-                predicted_winner_id,
-                actual_winner_id,
-                self.match_instance.score_points
-            )
+    def _get_match_leaderboard_data(self, leaderboard_page):
+        if leaderboard_page is None:
+            return None
 
-            for answer in bet.answers.all():
-                user_total_points_for_this_bet += PointsAttributionHelper.calculate_points_for_prediction_answer(
-                    str(answer.value) if answer.value is not None else None,
-                    answer.prediction # This is the Prediction instance
-                )
-            
-            leaderboard.append({
+        return [
+            {
                 "user": {"id": bet.user.id, "username": bet.user.username},
-                "total_gained_points": user_total_points_for_this_bet
-            })
-        
-        return sorted(leaderboard, key=lambda x: x['total_gained_points'], reverse=True)
+                "total_gained_points": bet.points_awarded,
+                "rank": leaderboard_page.start_index() + index,
+            }
+            for index, bet in enumerate(leaderboard_page)
+        ]
+
+    def _get_match_leaderboard_pagination(self, leaderboard_page):
+        if leaderboard_page is None:
+            return None
+        return {
+            "page": leaderboard_page.number,
+            "num_pages": leaderboard_page.paginator.num_pages,
+            "has_next": leaderboard_page.has_next(),
+            "has_previous": leaderboard_page.has_previous(),
+        }
 
     def get_match_data(self):
+        leaderboard_page = self._get_match_leaderboard_page()
         match_data = {
             "id": self.match_instance.id,
             "name": str(self.match_instance),
-            "competition": self._serialize_competition(self.match_instance.competition),
-            "team_one": self._serialize_team(self.match_instance.team_one),
-            "team_two": self._serialize_team(self.match_instance.team_two),
+            "competition": self.serializer.competition(self.match_instance.competition),
+            "team_one": self.serializer.team(self.match_instance.team_one, TEAM_DETAIL_FIELDS),
+            "team_two": self.serializer.team(self.match_instance.team_two, TEAM_DETAIL_FIELDS),
             "team_one_score": self.match_instance.team_one_score,
             "team_two_score": self.match_instance.team_two_score,
             "start_datetime": self.match_instance.start_datetime.isoformat(),
@@ -124,40 +84,18 @@ class MatchDataHelper:
             "team_two_draw_score": self.match_instance.team_two_draw_score,
             "score_points": self.match_instance.score_points,
             "predictions": self._serialize_predictions(),
-            "leaderboard": self._get_match_leaderboard_data() # Added leaderboard data
+            "leaderboard": self._get_match_leaderboard_data(leaderboard_page), # Added leaderboard data
+            "leaderboard_pagination": self._get_match_leaderboard_pagination(leaderboard_page),
         }
         return match_data
 
     def save_bet_from_form_data(self, user, cleaned_data):
         """
-        Creates Bet and Answer objects from validated form data.
+        Creates Bet and Answer objects from validated form data in two INSERTs:
+        the bet, then all its answers with one bulk_create (see BetPlacement).
+        Raises Http404 if the winner or a prediction does not belong to the match, ValueError for
+        malformed prediction field names, and BetAlreadyPlacedError if the user already bet on the match.
         Assumes to be called within a transaction.
-        Raises Http404 if related objects (Team, Prediction) are not found.
         """
-        winner_team_id_str = cleaned_data.get('match_winner')
-        winner_team = None
-        if winner_team_id_str:
-            if winner_team_id_str == '0':  # '0' represents Draw
-                winner_team = None
-            else:
-                winner_team = get_object_or_404(Team, pk=int(winner_team_id_str))
-        
-        new_bet = Bet.objects.create(
-            match=self.match_instance,
-            user=user,
-            winner_team=winner_team
-        )
-
-        for field_name, value in cleaned_data.items():
-            if field_name.startswith('prediction_') and value is not None and value != '':
-                prediction_id_str = field_name.split('_')[1]
-                # ValueError or Http404 will propagate up to the controller
-                prediction_id = int(prediction_id_str)
-                prediction_instance = get_object_or_404(Prediction, pk=prediction_id, match=self.match_instance)
-                
-                Answer.objects.create(
-                    bet=new_bet,
-                    prediction=prediction_instance,
-                    value=str(value)
-                )
-        return new_bet # Return the created bet object 
\ No newline at end of file
+        bet_with_answers = BetPlacement.build_bet(self.match_instance, user, cleaned_data)
+        return BetPlacement.save_bets([bet_with_answers])[0] # Return the created bet object
@@ -0,0 +1,121 @@
+from django_bridge_project.models import Competition, Match, Player, Prediction, Team
+from django_bridge_project.services.image_variants import ImageVariants
+
+# Field sets declared per view. Each page sends exactly the fields its React view reads.
+TEAM_LIST_FIELDS = ("id", "name", "logo_url", "logo_srcset") # Home featured teams, home upcoming matches
+MATCH_TEAM_FIELDS = ("name", "logo_url", "logo_srcset") # Teams inside team/competition page match lists
+TEAM_DETAIL_FIELDS = ("id", "name", "logo_url", "logo_srcset", "players") # Match page rosters
+COMPETITION_LIST_FIELDS = ("id", "name", "logo_url", "logo_srcset")
+COMPETITION_DETAIL_FIELDS = ("id", "name", "logo_url", "logo_srcset", "start_date", "end_date")
+PLAYER_FIELDS = ("id", "first_name", "last_name", "nickname", "role", "photo_url", "photo_srcset")
+MATCH_LIST_FIELDS = ("id", "team_one", "team_two", "start_datetime", "is_finished")
+PREDICTION_FIELDS = ("id", "label", "prediction_type", "score_points", "correct_value")
+
+
+class MediaUrlResolver:
+    """
+    Absolute URLs of uploaded files, memoized per request: a team playing hundreds of
+    matches has its logo resolved once, not once per row. Images are sent as their
+    resized variants (ImageVariants) once generated, with a WebP srcset.
+    """
+
+    def __init__(self, request):
+        self.request = request
+        self._urls = {}
+        self._variants_available = {}
+
+    @classmethod
+    def for_request(cls, request):
+        """Returns the resolver attached to the request, creating it on first use."""
+        resolver = getattr(request, '_media_url_resolver', None)
+        if resolver is None:
+            resolver = cls(request)
+            request._media_url_resolver = resolver
+        return resolver
+
+    def _absolute_url(self, storage, name):
+        if name not in self._urls:
+            self._urls[name] = self.request.build_absolute_uri(storage.url(name))
+        return self._urls[name]
+
+    def _has_variants(self, field_file):
+        if field_file.name not in self._variants_available:
+            self._variants_available[field_file.name] = ImageVariants.is_available(field_file)
+        return self._variants_available[field_file.name]
+
+    def url(self, field_file):
+        """The fallback variant of the image, or the original while its variants are not generated."""
+        if not field_file:
+            return None
+        if self._has_variants(field_file):
+            return self._absolute_url(field_file.storage, ImageVariants.fallback_name(field_file.name))
+        return self._absolute_url(field_file.storage, field_file.name)
+
+    def srcset(self, field_file):
+        if not field_file or not self._has_variants(field_file):
+            return None
+        return ", ".join(
+            f"{self._absolute_url(field_file.storage, ImageVariants.webp_name(field_file.name, width))} {width}w"
+            for width in ImageVariants.WIDTHS
+        )
+
+
+class PageSerializer:
+    """
+    Serializes models into page props. Every method takes the field set to output,
+    so the helpers share one implementation while each view keeps its own payload shape.
+    """
+
+    def __init__(self, request):
+        self.request = request
+        self.media = MediaUrlResolver.for_request(request)
+
+    def team(self, team: Team, fields=TEAM_LIST_FIELDS, player_fields=PLAYER_FIELDS):
+        if not team:
+            return None
+        getters = {
+            "id": lambda: team.id,
+            "name": lambda: team.name,
+            "logo_url": lambda: self.media.url(team.logo),
+            "logo_srcset": lambda: self.media.srcset(team.logo),
+            "players": lambda: [self.player(player, player_fields) for player in team.players.all()],
+        }
+        return {field: getters[field]() for field in fields}
+
+    def competition(self, competition: Competition, fields=COMPETITION_LIST_FIELDS):
+        if not competition:
+            return None
+        getters = {
+            "id": lambda: competition.id,
+            "name": lambda: competition.name,
+            "logo_url": lambda: self.media.url(competition.logo),
+            "logo_srcset": lambda: self.media.srcset(competition.logo),
+            "start_date": lambda: competition.start_date.isoformat(),
+            "end_date": lambda: competition.end_date.isoformat(),
+        }
+        return {field: getters[field]() for field in fields}
+
+    def player(self, player: Player, fields=PLAYER_FIELDS):
+        getters = {
+            "id": lambda: player.id,
+            "first_name": lambda: player.first_name,
+            "last_name": lambda: player.last_name,
+            "nickname": lambda: player.nickname,
+            "role": lambda: player.role,
+            "photo_url": lambda: self.media.url(player.photo),
+            "photo_srcset": lambda: self.media.srcset(player.photo),
+        }
+        return {field: getters[field]() for field in fields}
+
+    def match_list_item(self, match: Match, fields=MATCH_LIST_FIELDS, team_fields=MATCH_TEAM_FIELDS):
+        getters = {
+            "id": lambda: match.id,
+            "team_one": lambda: self.team(match.team_one, team_fields),
+            "team_two": lambda: self.team(match.team_two, team_fields),
+            "start_datetime": lambda: match.start_datetime.isoformat(),
+            "is_finished": lambda: match.is_finished,
+        }
+        return {field: getters[field]() for field in fields}
+
+    def prediction(self, prediction: Prediction, fields=PREDICTION_FIELDS):
+        return {field: getattr(prediction, field) for field in fields}
@@ -1,19 +1,15 @@
 from django_bridge_project.models import Bet, Answer, Prediction, Team, Player, Match
 from django_bridge_project.enums.prediction_types import PredictionType
-from django_bridge_project.services.points_attribution_helper import PointsAttributionHelper
+from django_bridge_project.services.player_name_resolver import PlayerNameResolver
 
 class UserBetDataHelper:
     def __init__(self, user, match_instance: Match):
         self.user = user
         self.match_instance = match_instance
+        self.player_names = PlayerNameResolver()
 
     def _get_player_name(self, player_id_str):
-        try:
-            player_id = int(player_id_str)
-            player = Player.objects.get(pk=player_id)
-            return f"{player.first_name} {player.last_name} ({player.nickname})" if player.nickname else f"{player.first_name} {player.last_name}"
-        except (Player.DoesNotExist, ValueError):
-            return "Unknown Player"
+        return self.player_names.get_display_name(player_id_str)
     
     def _get_displayable_correct_value(self, prediction: Prediction):
         if prediction.correct_value is None or prediction.correct_value == '':
@@ -57,7 +53,7 @@ class UserBetDataHelper:
 
     def get_user_bet_details(self):
         try:
-            user_bet = Bet.objects.select_related('winner_team').get(user=self.user, match=self.match_instance)
+            user_bet = Bet.objects.select_related('winner_team').prefetch_related('answers').get(user=self.user, match=self.match_instance)
         except Bet.DoesNotExist:
             return None
 
@@ -72,8 +68,11 @@ class UserBetDataHelper:
             chosen_winner_details = {"id": 0, "name": "Draw", "score_points": self.match_instance.score_points}
         
         serialized_answers = []
-        all_match_predictions = Prediction.objects.filter(match=self.match_instance).order_by('id')
+        all_match_predictions = sorted(self.match_instance.predictions.all(), key=lambda prediction: prediction.id)
         user_answers_for_bet = {ans.prediction_id: ans for ans in user_bet.answers.all()}
+        # All player names shown below are fetched at once; the rosters may already be in memory.
+        self.player_names.add_from_predictions(all_match_predictions, user_answers_for_bet.values())
+        self.player_names.prime(list(self.match_instance.team_one.players.all()) + list(self.match_instance.team_two.players.all()))
 
         points_have_been_calculated = self.match_instance.points_calculation_done
         total_gained_points_for_match = 0
@@ -82,17 +81,9 @@ class UserBetDataHelper:
             actual_match_winner_info = self._determine_actual_winner_team_details()
             chosen_winner_details['actual_winner_details'] = actual_match_winner_info
             
-            predicted_winner_id = user_bet.winner_team_id if user_bet.winner_team else 0
-            actual_winner_id_for_comparison = actual_match_winner_info['id']
-            if actual_match_winner_info['is_draw'] and actual_match_winner_info['id'] is None:
-                 actual_winner_id_for_comparison = 0
-
-            # Use the static method from PointsAttributionHelper for match winner points
-            gained_points_for_winner = PointsAttributionHelper.calculate_points_for_match_winner(
-                predicted_winner_id,
-                actual_winner_id_for_comparison, # Ensure this is 0 for draw
-                self.match_instance.score_points
-            )
+            # Points were stored on the bet and its answers at settlement; the winner's share is what the answers don't explain.
+            answers_points = sum(answer.points_awarded or 0 for answer in user_answers_for_bet.values())
+            gained_points_for_winner = (user_bet.points_awarded or 0) - answers_points
             
             chosen_winner_details['gained_points_for_winner'] = gained_points_for_winner
             total_gained_points_for_match += gained_points_for_winner
@@ -123,11 +114,7 @@ class UserBetDataHelper:
                 answer_data['correct_value_display'] = self._get_displayable_correct_value(pred)
                 gained_points_for_answer = 0
                 if user_answer_instance:
-                    # Use the static method from PointsAttributionHelper
-                    gained_points_for_answer = PointsAttributionHelper.calculate_points_for_prediction_answer(
-                        str(user_answer_instance.value) if user_answer_instance.value is not None else None, 
-                        pred
-                    )
+                    gained_points_for_answer = user_answer_instance.points_awarded or 0
                 answer_data['gained_points'] = gained_points_for_answer
                 total_gained_points_for_match += gained_points_for_answer
             
@@ -0,0 +1,36 @@
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+REPLICA_DB_ALIAS = "replica"
+
+# Set by ReplicaRoutingMiddleware for the requests whose reads may be served by the replica.
+# Everything else (POSTs, pinned sessions, management commands, workers) reads from the primary.
+replica_reads_allowed = ContextVar("replica_reads_allowed", default=False)
+
+
+class ReplicaRouter:
+    """
+    Sends reads to the read replica (DATABASES["replica"], set with DATABASE_REPLICA_URL) when
+    the current request allows it, and everything else to the primary. Reads inside a transaction
+    stay on the primary so they see its writes, and so do sessions, which are read right after
+    login or logout.
+    """
+    PRIMARY_ONLY_APP_LABELS = {"sessions"}
+
+    def db_for_read(self, model, **hints):
+        if REPLICA_DB_ALIAS not in settings.DATABASES or not replica_reads_allowed.get():
+            return DEFAULT_DB_ALIAS
+        if model._meta.app_label in self.PRIMARY_ONLY_APP_LABELS or connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return DEFAULT_DB_ALIAS
+        return REPLICA_DB_ALIAS
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Both databases hold the same rows
+        if {obj1._state.db, obj2._state.db} <= {DEFAULT_DB_ALIAS, REPLICA_DB_ALIAS}:
+            return True
+        return None
@@ -0,0 +1,14 @@
+import enum
+
+class BotStrategy(enum.Enum):
+    RANDOM = "random"
+    FAVOURITE_BY_HISTORY = "favourite_by_history"
+    NUMERICAL_MEAN = "numerical_mean"
+
+    @classmethod
+    def get_choices(cls):
+        return [
+            (cls.RANDOM.value, "Random"),
+            (cls.FAVOURITE_BY_HISTORY.value, "Favourite by history"),
+            (cls.NUMERICAL_MEAN.value, "Numerical mean"),
+        ]
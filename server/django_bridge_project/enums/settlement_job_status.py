@@ -0,0 +1,16 @@
+import enum
+
+class SettlementJobStatus(enum.Enum):
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+    @classmethod
+    def get_choices(cls):
+        return [
+            (cls.PENDING.value, "Pending"),
+            (cls.RUNNING.value, "Running"),
+            (cls.DONE.value, "Done"),
+            (cls.FAILED.value, "Failed"),
+        ]
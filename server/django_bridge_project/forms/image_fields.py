@@ -0,0 +1,12 @@
+from django import forms
+
+class ModelValidatedImageField(forms.ImageField):
+    """
+    Image upload field that leaves the image checks to the model's clean(), which runs
+    CustomImageValidator on the header only. forms.ImageField would first load and verify
+    the whole image with Pillow, and reject an upload dropped by MaxSizeUploadHandler as
+    corrupted instead of too large.
+    """
+
+    def to_python(self, data):
+        return forms.FileField.to_python(self, data)
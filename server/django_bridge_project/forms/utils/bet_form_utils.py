@@ -1,11 +1,98 @@
+import threading
+from collections import OrderedDict
+
 from django import forms
 from django_bridge_project.models import Match, Player # Assuming models.py is accessible
 from django_bridge_project.enums.prediction_types import PredictionType
+from .prepacked_form import PrepackedForm
+
+class BetFormClassCache:
+    """
+    Process-wide LRU of compiled BetForm classes, one entry per match.
+    An entry is reused while the match's form inputs (winner choices, rosters, predictions) are
+    unchanged. They are read from the match as the callers load it, with rosters and predictions
+    prefetched, so an edit made in any process is seen on the next request without relying on
+    version stamps reaching this one.
+    """
+    MAX_SIZE = 256
+
+    _entries = OrderedDict() # match_id -> {"inputs": ..., "form_class": ..., "prepacked": ...}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def get_inputs(match: Match):
+        """Everything build_bet_form_class reads from the match, as a comparable tuple."""
+        return (
+            match.score_points,
+            (match.team_one.id, match.team_one.name),
+            (match.team_two.id, match.team_two.name),
+            tuple((player.id, player.first_name, player.last_name)
+                  for player in list(match.team_one.players.all()) + list(match.team_two.players.all())),
+            tuple((prediction.id, prediction.label, prediction.prediction_type, prediction.score_points)
+                  for prediction in match.predictions.all()),
+        )
+
+    @classmethod
+    def get(cls, match_id, inputs):
+        with cls._lock:
+            entry = cls._entries.get(match_id)
+            if entry is None or entry["inputs"] != inputs:
+                return None
+            cls._entries.move_to_end(match_id)
+            return entry
+
+    @classmethod
+    def put(cls, match_id, inputs, form_class):
+        entry = {"inputs": inputs, "form_class": form_class, "prepacked": None}
+        with cls._lock:
+            cls._entries[match_id] = entry
+            cls._entries.move_to_end(match_id)
+            while len(cls._entries) > cls.MAX_SIZE:
+                cls._entries.popitem(last=False) # Least recently used
+        return entry
+
+    @classmethod
+    def clear(cls):
+        with cls._lock:
+            cls._entries.clear()
+
 
 class BetFormGenerator:
 
+    @staticmethod
+    def _get_cache_entry(match: Match):
+        inputs = BetFormClassCache.get_inputs(match)
+        entry = BetFormClassCache.get(match.id, inputs)
+        if entry is None:
+            entry = BetFormClassCache.put(match.id, inputs, BetFormGenerator.build_bet_form_class(match))
+        return entry
+
     @staticmethod
     def create_bet_form_for_match(match: Match, request=None, *args, **kwargs):
+        """
+        Returns the BetForm class of the match, compiled once and then served from BetFormClassCache.
+        With a request, returns an instance instead: bound to the POST data, or unbound for a GET.
+        """
+        BetForm = BetFormGenerator._get_cache_entry(match)["form_class"]
+
+        # If request is provided (meaning we are instantiating for a POST or initial GET)
+        if request:
+            if request.method == 'POST':
+                return BetForm(request.POST, *args, **kwargs)
+            return BetForm(*args, **kwargs) # For GET
+
+        return BetForm # Return the class itself if no request (e.g. for type hinting)
+
+    @staticmethod
+    def get_prepacked_unbound_form(match: Match) -> PrepackedForm:
+        """An empty BetForm for the props, packed once per form class instead of on every response."""
+        entry = BetFormGenerator._get_cache_entry(match)
+        if entry["prepacked"] is None: # Two requests may pack concurrently; both results are identical
+            entry["prepacked"] = PrepackedForm(entry["form_class"]())
+        return entry["prepacked"]
+
+    @staticmethod
+    def build_bet_form_class(match: Match):
         """
         Dynamically creates a Django Form class for betting on a given match.
         The form will include a field for the match winner and fields for each prediction.
@@ -29,10 +116,10 @@ class BetFormGenerator:
         # 2. Add fields for each prediction associated with the match
         #    Ensure players for ChoiceFields are loaded efficiently.
         #    It's often better to fetch all players for the two teams once.
-        team_one_players = list(match.team_one.players.all().values_list('id', 'first_name', 'last_name'))
-        team_two_players = list(match.team_two.players.all().values_list('id', 'first_name', 'last_name'))
+        #    Iterating .all() reuses the rosters when the match was loaded with them prefetched.
         all_match_players_choices = [
-            (pid, f"{fname} {lname}") for pid, fname, lname in team_one_players + team_two_players
+            (player.id, f"{player.first_name} {player.last_name}")
+            for player in list(match.team_one.players.all()) + list(match.team_two.players.all())
         ]
 
         for prediction in match.predictions.all():
@@ -60,13 +147,4 @@ class BetFormGenerator:
             form_fields[field_name] = field_class(**field_kwargs)
 
         # Dynamically create the Form class
-        # The `request` and `*args, **kwargs` are for initializing the form instance later
-        BetForm = type('BetForm', (forms.Form,), form_fields)
-        
-        # If request is provided (meaning we are instantiating for a POST or initial GET)
-        if request:
-            if request.method == 'POST':
-                return BetForm(request.POST, *args, **kwargs)
-            return BetForm(*args, **kwargs) # For GET
-        
-        return BetForm # Return the class itself if no request (e.g. for type hinting)
+        return type('BetForm', (forms.Form,), form_fields)
@@ -0,0 +1,65 @@
+import copy
+
+from django_bridge.adapters.registry import JSContext, register
+from telepath import BaseAdapter, Node
+
+class PrepackedForm:
+    """
+    An unbound form packed once for django-bridge and reused as is in later responses.
+    Only unbound forms qualify: their packed value carries no request data and no errors.
+    """
+
+    def __init__(self, form):
+        self.packed = JSContext().pack(form)
+        # Internal _id/_ref numbers of the packed value, renumbered when embedded in a response
+        self.id_count = self._max_id(self.packed) + 1
+
+    @staticmethod
+    def _max_id(value):
+        if isinstance(value, dict):
+            own_id = value.get('_id', value.get('_ref', -1))
+            return max([own_id] + [PrepackedForm._max_id(item) for item in value.values()])
+        if isinstance(value, list):
+            return max([-1] + [PrepackedForm._max_id(item) for item in value])
+        return -1
+
+
+class PrepackedNode(Node):
+    """
+    Emits the stored packed value. Its internal ids are shifted past the ids already handed out
+    by the response being packed, so they cannot clash with references elsewhere in the props.
+    """
+
+    def __init__(self, prepacked_form: PrepackedForm, id_offset: int):
+        super().__init__()
+        self.prepacked_form = prepacked_form
+        self.id_offset = id_offset
+
+    def _offset_ids(self, value):
+        if isinstance(value, dict):
+            return {
+                key: item + self.id_offset if key in ('_id', '_ref') else self._offset_ids(item)
+                for key, item in value.items()
+            }
+        if isinstance(value, list):
+            return [self._offset_ids(item) for item in value]
+        return value
+
+    def emit_compact(self):
+        if not self.prepacked_form.id_count:
+            return self.prepacked_form.packed
+        return self._offset_ids(self.prepacked_form.packed)
+
+    def emit_verbose(self):
+        # The caller adds an _id to the result, which must not leak into the shared packed value
+        return copy.copy(self.emit_compact())
+
+
+class PrepackedFormAdapter(BaseAdapter):
+    def build_node(self, obj, context):
+        id_offset = context.next_id
+        context.next_id += obj.id_count # Reserve the ids used inside the packed value
+        return PrepackedNode(obj, id_offset)
+
+
+register(PrepackedFormAdapter(), PrepackedForm)
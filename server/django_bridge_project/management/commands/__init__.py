@@ -0,0 +1 @@
+# This file makes Django recognize this directory as a package.
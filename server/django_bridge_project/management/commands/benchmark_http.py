@@ -0,0 +1,157 @@
+import http.client
+import json
+import os
+import re
+import statistics
+import threading
+import time
+from urllib.parse import urlsplit
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Count
+from django.urls import reverse
+from django.utils import timezone
+
+from django_bridge_project.models import Match
+
+PAGE_CACHE_TIMING = re.compile(r'page-cache;desc="(\w+)"')
+
+
+class Command(BaseCommand):
+    help = ("Load-tests a running server over HTTP (by default the page of the busiest open match) with "
+            "concurrent keep-alive clients and reports requests/sec and latency percentiles. Run it once per "
+            "server configuration (worker model, connection pooling) with a --label, then compare the runs "
+            "with --compare. Requests are anonymous: unless the server runs with "
+            "DJANGO_ANONYMOUS_PAGE_CACHE_SECONDS=0, most of them replay the anonymous page cache.")
+
+    def add_arguments(self, parser):
+        parser.add_argument('--base-url', default="http://localhost:8000", help="URL of the running server.")
+        parser.add_argument('--path', help="Path to request. Defaults to the page of the open match with the most bets.")
+        parser.add_argument('--concurrency', type=int, default=8, help="Concurrent clients.")
+        parser.add_argument('--duration', type=float, default=20, help="Seconds of measurement.")
+        parser.add_argument('--warmup', type=float, default=3, help="Seconds of unmeasured load first.")
+        parser.add_argument('--label', default="", help="Name of the configuration under test, e.g. gthread-pool.")
+        parser.add_argument('--output', default="benchmark_http_results.json",
+                            help="JSON file the results are appended to.")
+        parser.add_argument('--compare', action='store_true',
+                            help="Run no load: compare the latest result of each label in --output instead.")
+        parser.add_argument('--baseline', help="Label the others are compared to with --compare. Defaults to the first one.")
+
+    def handle(self, *args, **options):
+        if options['compare']:
+            return self._compare(options['output'], options['baseline'])
+        if options['concurrency'] < 1 or options['duration'] <= 0:
+            raise CommandError("--concurrency and --duration must be positive.")
+        base_url = urlsplit(options['base_url'])
+        path = options['path'] or self._busiest_match_path()
+
+        self.stdout.write(f"{options['concurrency']} clients on {options['base_url']}{path} for {options['duration']}s...")
+        self._load(base_url, path, options['concurrency'], options['warmup'])
+        latencies, errors, page_cache, elapsed = self._load(base_url, path, options['concurrency'], options['duration'])
+        if not latencies:
+            raise CommandError(f"No successful request ({errors} errors). Is the server running?")
+
+        percentiles = statistics.quantiles(latencies, n=100, method='inclusive') if len(latencies) > 1 else latencies * 99
+        result = {
+            "label": options['label'],
+            "timestamp": timezone.now().isoformat(),
+            "url": f"{options['base_url']}{path}",
+            "concurrency": options['concurrency'],
+            "requests": len(latencies),
+            "errors": errors,
+            "requests_per_second": round(len(latencies) / elapsed, 1),
+            "p50_ms": round(percentiles[49], 2),
+            "p90_ms": round(percentiles[89], 2),
+            "p99_ms": round(percentiles[98], 2),
+            "max_ms": round(max(latencies), 2),
+            "page_cache": page_cache, # Outcomes reported in Server-Timing, empty when the server does not send it
+        }
+        self.stdout.write(f"{result['label'] or 'result'}: {result['requests_per_second']} req/s, p50 {result['p50_ms']} ms, "
+                          f"p99 {result['p99_ms']} ms, {errors} errors")
+        if page_cache:
+            self.stdout.write("  anonymous page cache: " + ", ".join(f"{count} {outcome}" for outcome, count in sorted(page_cache.items())))
+
+        results = []
+        if os.path.exists(options['output']):
+            with open(options['output']) as previous:
+                results = json.load(previous)
+        results.append(result)
+        with open(options['output'], 'w') as output:
+            json.dump(results, output, indent=2)
+        self.stdout.write(self.style.SUCCESS(f"Result appended to {options['output']}."))
+
+    def _compare(self, output, baseline_label):
+        """Prints the latest result of each label next to the baseline's."""
+        latest = {}
+        if os.path.exists(output):
+            with open(output) as results_file:
+                latest = {result["label"]: result for result in json.load(results_file)} # Later runs replace earlier ones
+        if not latest:
+            raise CommandError(f"No results in {output}. Run the benchmark once per configuration first.")
+        if baseline_label is None:
+            baseline_label = next(iter(latest))
+        if baseline_label not in latest:
+            raise CommandError(f"No result labelled {baseline_label!r} in {output}.")
+
+        baseline = latest[baseline_label]
+        self.stdout.write(f"{'label':<20} {'req/s':>8} {'vs base':>8} {'p50 ms':>8} {'p99 ms':>8} {'errors':>7}  url")
+        for label, result in latest.items():
+            ratio = result["requests_per_second"] / baseline["requests_per_second"] if baseline["requests_per_second"] else 0
+            self.stdout.write(f"{label or '-':<20} {result['requests_per_second']:>8} {ratio:>7.2f}x "
+                              f"{result['p50_ms']:>8} {result['p99_ms']:>8} {result['errors']:>7}  {result['url']}")
+        if len({result["url"] for result in latest.values()}) > 1:
+            self.stdout.write(self.style.WARNING("The runs requested different URLs, their numbers do not compare."))
+
+    @staticmethod
+    def _busiest_match_path():
+        match = Match.objects.filter(is_finished=False).annotate(bets_count=Count('bets')).order_by('-bets_count', 'id').first()
+        if match is None:
+            raise CommandError("No open match to request. Run seed_data first or pass --path.")
+        return reverse('match_detail', kwargs={'match_id': match.id})
+
+    def _load(self, base_url, path, concurrency, duration):
+        """
+        Runs the clients for `duration` seconds. Returns (latencies in ms, error count,
+        {page cache outcome: count}, elapsed seconds).
+        """
+        latencies, errors, page_cache = [], [0], {}
+        lock = threading.Lock()
+        deadline = time.perf_counter() + duration
+
+        def client():
+            connection_class = http.client.HTTPSConnection if base_url.scheme == 'https' else http.client.HTTPConnection
+            connection = connection_class(base_url.netloc, timeout=30)
+            # django-bridge JSON responses, as the React app requests them
+            headers = {"X-Requested-With": "DjangoBridge", "Host": base_url.netloc}
+            own_latencies, own_errors, own_page_cache = [], 0, {}
+            while time.perf_counter() < deadline:
+                started = time.perf_counter()
+                try:
+                    connection.request("GET", path, headers=headers)
+                    response = connection.getresponse()
+                    response.read()
+                except (OSError, http.client.HTTPException):
+                    own_errors += 1
+                    connection.close() # Reconnects on the next request
+                    continue
+                if response.status == 200:
+                    own_latencies.append((time.perf_counter() - started) * 1000)
+                    outcome = PAGE_CACHE_TIMING.search(response.getheader("Server-Timing", ""))
+                    if outcome:
+                        own_page_cache[outcome[1]] = own_page_cache.get(outcome[1], 0) + 1
+                else:
+                    own_errors += 1
+            connection.close()
+            with lock:
+                latencies.extend(own_latencies)
+                errors[0] += own_errors
+                for outcome, count in own_page_cache.items():
+                    page_cache[outcome] = page_cache.get(outcome, 0) + count
+
+        started = time.perf_counter()
+        threads = [threading.Thread(target=client) for _i in range(concurrency)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return latencies, errors[0], page_cache, time.perf_counter() - started
@@ -0,0 +1,84 @@
+import statistics
+import time
+from datetime import date, timedelta
+
+from django.contrib.auth.models import AnonymousUser
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test import RequestFactory, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from django_bridge_project.controllers.utils.competition_data_helper import CompetitionDataHelper
+from django_bridge_project.controllers.utils.home_data_helper import HomeDataHelper
+from django_bridge_project.controllers.utils.match_data_helper import MatchDataHelper
+from django_bridge_project.controllers.utils.team_data_helper import TeamDataHelper
+from django_bridge_project.models import Competition, Match, Player, Team
+
+
+class _Rollback(Exception):
+    """Raised to discard the seeded benchmark data."""
+
+
+class Command(BaseCommand):
+    help = ("Seeds a team with many matches and reports the time each page's data helper spends "
+            "outside SQL (serialization), averaged over several runs.")
+
+    def add_arguments(self, parser):
+        parser.add_argument('--matches', type=int, default=500, help="Number of matches played by the benchmark team.")
+        parser.add_argument('--runs', type=int, default=20, help="Runs per page.")
+
+    # The home payload cache would hide the serialization work after the first run.
+    @override_settings(CACHES={"default": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}})
+    def handle(self, *args, **options):
+        try:
+            with transaction.atomic():
+                team, competition, match = self._seed(options['matches'])
+                request = RequestFactory().get('/', HTTP_HOST='localhost')
+                request.user = AnonymousUser()
+                pages = {
+                    "home": lambda: HomeDataHelper(request).get_home_page_data(),
+                    "team_detail": lambda: TeamDataHelper(request, team).get_team_data(),
+                    "competition_detail": lambda: CompetitionDataHelper(request, competition).get_competition_data(),
+                    "match_detail": lambda: MatchDataHelper(request, match).get_match_data(),
+                }
+                for name, build_page in pages.items():
+                    self._measure(name, build_page, options['runs'])
+                raise _Rollback()
+        except _Rollback:
+            pass
+
+    def _seed(self, matches_count):
+        suffix = f"{timezone.now():%Y%m%d%H%M%S%f}"
+        competition = Competition.objects.create(name=f"Benchmark {suffix}", logo=f"competition_logos/bench_{suffix}.png",
+                                                 start_date=date.today(), end_date=date.today() + timedelta(days=365))
+        team = Team.objects.create(name=f"Benchmark Team {suffix}", logo=f"team_logos/bench_{suffix}.png")
+        opponents = Team.objects.bulk_create([
+            Team(name=f"Benchmark Opponent {suffix} {i}", logo=f"team_logos/bench_{suffix}_{i}.png") for i in range(20)
+        ])
+        Player.objects.bulk_create([
+            Player(team=t, first_name="Player", last_name=str(i), photo=f"player_photos/bench_{suffix}_{t.pk}_{i}.png")
+            for t in [team] + opponents[:1] for i in range(25)
+        ])
+        start = timezone.now() - timedelta(days=matches_count)
+        matches = Match.objects.bulk_create([
+            Match(competition=competition, team_one=team, team_two=opponents[i % len(opponents)],
+                  start_datetime=start + timedelta(days=i))
+            for i in range(matches_count)
+        ])
+        match = MatchDataHelper.get_match_detail_queryset().get(pk=matches[0].pk)
+        return team, competition, match
+
+    def _measure(self, name, build_page, runs):
+        serialization_ms = []
+        queries = 0
+        for _ in range(runs):
+            with CaptureQueriesContext(connection) as captured:
+                started = time.perf_counter()
+                build_page()
+                elapsed = time.perf_counter() - started
+            sql_time = sum(float(query['time']) for query in captured.captured_queries)
+            serialization_ms.append((elapsed - sql_time) * 1000)
+            queries = len(captured)
+        self.stdout.write(f"{name:<20} serialization {statistics.median(serialization_ms):8.2f} ms (median), "
+                          f"{queries} queries")
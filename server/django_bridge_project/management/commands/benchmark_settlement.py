@@ -0,0 +1,112 @@
+import random
+import time
+from datetime import date
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from django_bridge_project.enums.prediction_types import PredictionType
+from django_bridge_project.models import Answer, Bet, Competition, CustomUser, Match, Player, Prediction, Team
+from django_bridge_project.services.points_attribution_helper import PointsAttributionHelper
+
+
+class _Rollback(Exception):
+    """Raised to discard the seeded benchmark data."""
+
+
+class Command(BaseCommand):
+    help = "Seeds N bets on a single match, settles it and reports settlement time and query count."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--bets', type=int, default=10000, help="Number of bets (and users) to seed.")
+        parser.add_argument('--seed', type=int, default=42, help="Random seed for the generated answers.")
+        parser.add_argument('--verify', action='store_true',
+                            help="Check the settled scores against a per-bet evaluation of the calculate_* methods.")
+        parser.add_argument('--keep', action='store_true', help="Keep the seeded data instead of rolling it back.")
+
+    def handle(self, *args, **options):
+        rng = random.Random(options['seed'])
+        try:
+            with transaction.atomic():
+                match = self._seed(options['bets'], rng)
+                self._settle(match, options['verify'])
+                if not options['keep']:
+                    raise _Rollback()
+        except _Rollback:
+            self.stdout.write("Seeded data rolled back.")
+
+    def _seed(self, bets_count, rng):
+        started = time.perf_counter()
+        suffix = f"{timezone.now():%Y%m%d%H%M%S%f}"
+        competition = Competition.objects.create(name=f"Benchmark {suffix}", start_date=date.today(), end_date=date.today())
+        team_one = Team.objects.create(name=f"Benchmark Home {suffix}")
+        team_two = Team.objects.create(name=f"Benchmark Away {suffix}")
+        players = Player.objects.bulk_create([
+            Player(team=team, first_name="Player", last_name=str(i))
+            for team in (team_one, team_two) for i in range(11)
+        ])
+        player_ids = [str(player.id) for player in players]
+
+        match = Match.objects.create(competition=competition, team_one=team_one, team_two=team_two,
+                                     team_one_score=2, team_two_score=1, start_datetime=timezone.now())
+        predictions = Prediction.objects.bulk_create([
+            Prediction(match=match, label="Total goals", prediction_type=PredictionType.NUMERICAL.value, correct_value="3"),
+            Prediction(match=match, label="First scorer", prediction_type=PredictionType.PLAYER.value, correct_value=player_ids[0]),
+            Prediction(match=match, label="Penalty awarded", prediction_type=PredictionType.BOOLEAN.value, correct_value="True"),
+        ])
+
+        users = CustomUser.objects.bulk_create([
+            CustomUser(username=f"bench_{suffix}_{i}") for i in range(bets_count)
+        ], batch_size=1000)
+        winner_choices = [team_one, team_two, None]
+        bets = Bet.objects.bulk_create([
+            Bet(match=match, user=user, winner_team=rng.choice(winner_choices)) for user in users
+        ], batch_size=1000)
+
+        answers = []
+        for bet in bets:
+            answers.append(Answer(bet=bet, prediction=predictions[0], value=str(rng.randint(0, 6))))
+            answers.append(Answer(bet=bet, prediction=predictions[1], value=rng.choice(player_ids)))
+            answers.append(Answer(bet=bet, prediction=predictions[2], value=rng.choice(["True", "False"])))
+        Answer.objects.bulk_create(answers, batch_size=1000)
+
+        # Marked finished with a queryset update so the post_save signal does not settle it early.
+        Match.objects.filter(pk=match.pk).update(is_finished=True)
+        match.refresh_from_db()
+        self.stdout.write(f"Seeded {len(bets)} bets and {len(answers)} answers in {time.perf_counter() - started:.2f}s.")
+        return match
+
+    def _settle(self, match, verify):
+        helper = PointsAttributionHelper(match)
+        with CaptureQueriesContext(connection) as queries:
+            started = time.perf_counter()
+            result = helper.process_match_bets_and_attribute_points()
+            elapsed = time.perf_counter() - started
+
+        self.stdout.write(f"Settlement: {elapsed * 1000:.1f} ms, {len(queries)} queries, "
+                          f"{result.get('users_updated_count', 0)} users updated.")
+
+        if verify:
+            expected = self._reference_points(match, helper)
+            actual = dict(CustomUser.objects.filter(bets__match=match).values_list('id', 'score'))
+            mismatches = [user_id for user_id, score in actual.items() if expected.get(user_id, 0) != score]
+            if mismatches:
+                self.stderr.write(self.style.ERROR(f"{len(mismatches)} users have unexpected scores."))
+            else:
+                self.stdout.write(self.style.SUCCESS("Scores match the per-bet reference evaluation."))
+
+    @staticmethod
+    def _reference_points(match, helper):
+        """Per-bet evaluation of the calculate_* methods, as the settlement loop used to do it."""
+        actual_winner_id = helper._determine_actual_winner_team_id()
+        points_by_user = {}
+        for bet in Bet.objects.filter(match=match).prefetch_related('answers__prediction'):
+            points = PointsAttributionHelper.calculate_points_for_match_winner(
+                bet.winner_team_id or 0, actual_winner_id, match.score_points
+            )
+            for answer in bet.answers.all():
+                points += PointsAttributionHelper.calculate_points_for_prediction_answer(str(answer.value), answer.prediction)
+            points_by_user[bet.user_id] = points
+        return points_by_user
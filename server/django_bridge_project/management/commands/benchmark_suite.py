@@ -0,0 +1,248 @@
+import json
+import platform
+import statistics
+import time
+
+import django
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.db.models import Count
+from django.test import Client, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import URLPattern, reverse
+from django.utils import timezone
+
+from django_bridge_project import urls as project_urls
+from django_bridge_project.enums.prediction_types import PredictionType
+from django_bridge_project.models import Answer, Bet, Competition, CustomUser, Match, Team
+from django_bridge_project.services.points_attribution_helper import PointsAttributionHelper
+
+# Routes not measured: the admin is Django's own, the request metrics endpoint is a diagnostic
+# and media and static serve files rather than pages
+EXCLUDED_ROUTES = {"admin", "request_metrics", "media", "static"}
+
+
+class Command(BaseCommand):
+    help = ("Measures every view of urls.py and the settlement path against the current database "
+            "(see seed_data): latency percentiles and query counts per scenario, written as JSON so "
+            "runs can be compared. Writes are rolled back.")
+
+    def add_arguments(self, parser):
+        parser.add_argument('--runs', type=int, default=30, help="Measured requests per scenario.")
+        parser.add_argument('--warmup', type=int, default=3, help="Unmeasured requests per scenario (fills caches).")
+        parser.add_argument('--settlement-runs', type=int, default=5, help="Measured settlements of the busiest finished match.")
+        parser.add_argument('--output', default="benchmark_results.json", help="Path of the JSON report.")
+        parser.add_argument('--anonymous-page-cache', action='store_true',
+                            help="Keep the anonymous page cache on. By default it is off, so the anonymous "
+                                 "scenarios measure building the page rather than replaying a cached copy.")
+
+    def handle(self, *args, **options):
+        if options['runs'] < 1:
+            raise CommandError("--runs must be positive.")
+        fixtures = self._pick_fixtures()
+        scenarios = self._scenarios(fixtures)
+
+        covered = {scenario['route'] for scenario in scenarios}
+        named_routes = {pattern.name for pattern in project_urls.urlpatterns if isinstance(pattern, URLPattern) and pattern.name}
+        for route in sorted(named_routes - covered - EXCLUDED_ROUTES):
+            self.stderr.write(self.style.WARNING(f"No benchmark scenario for the '{route}' route."))
+
+        report = {
+            "meta": self._meta(options),
+            "views": {},
+            "settlement": None,
+        }
+        # Server-Timing carries the serialization time measured per scenario
+        with override_settings(ALLOWED_HOSTS=list(settings.ALLOWED_HOSTS) + ['testserver'], SERVER_TIMING_HEADER=True,
+                               ANONYMOUS_PAGE_CACHE_SECONDS=report["meta"]["anonymous_page_cache_seconds"]):
+            for scenario in scenarios:
+                report["views"][scenario['name']] = self._measure_scenario(scenario, options['runs'], options['warmup'])
+                self._print_stats(scenario['name'], report["views"][scenario['name']])
+        if fixtures['finished_match'] and options['settlement_runs'] > 0:
+            report["settlement"] = self._measure_settlement(fixtures['finished_match'], options['settlement_runs'])
+            self._print_stats("settlement", report["settlement"])
+
+        with open(options['output'], 'w') as output:
+            json.dump(report, output, indent=2)
+        self.stdout.write(self.style.SUCCESS(f"Results written to {options['output']}."))
+
+    def _pick_fixtures(self):
+        """The busiest objects of each kind: the pages the heaviest traffic lands on."""
+        open_matches = Match.objects.filter(is_finished=False).annotate(bets_count=Count('bets')).order_by('-bets_count', 'id')
+        open_match = open_matches.first()
+        finished_match = Match.objects.filter(is_finished=True).annotate(bets_count=Count('bets')).order_by('-bets_count', 'id').first()
+        if open_match is None or finished_match is None:
+            raise CommandError("The database needs open and finished matches. Run seed_data first.")
+        user = CustomUser.objects.filter(is_bot=False, is_active=True).order_by('-score', 'id').first()
+        bettor = CustomUser.objects.filter(is_bot=False, is_active=True).exclude(bets__match=open_match).order_by('id').first()
+        team = Team.objects.annotate(matches_count=Count('home_matches', distinct=True) + Count('away_matches', distinct=True))\
+                           .order_by('-matches_count', 'id').first()
+        competition = Competition.objects.annotate(matches_count=Count('matches')).order_by('-matches_count', 'id').first()
+        slip_matches = list(open_matches.exclude(bets__user=bettor).select_related('team_one').prefetch_related('predictions')[:5]) if bettor else []
+        return {
+            "open_match": open_match, "finished_match": finished_match, "user": user, "bettor": bettor,
+            "team": team, "competition": competition, "slip_matches": slip_matches,
+        }
+
+    @staticmethod
+    def _bet_form_data(match):
+        """A valid bet form submission for the match."""
+        first_player_id = match.team_one.players.values_list('id', flat=True).first()
+        answers = {
+            PredictionType.NUMERICAL.value: "1",
+            PredictionType.PLAYER.value: str(first_player_id),
+            PredictionType.BOOLEAN.value: "on",
+        }
+        data = {"match_winner": str(match.team_one_id)}
+        for prediction in match.predictions.all():
+            data[f"prediction_{prediction.id}"] = answers[prediction.prediction_type]
+        return data
+
+    def _scenarios(self, fixtures):
+        """
+        One entry per measured request: route name (checked against urls.py), method, URL, who
+        sends it and whether its writes must be rolled back.
+        """
+        open_match, finished_match = fixtures['open_match'], fixtures['finished_match']
+        user, bettor = fixtures['user'], fixtures['bettor']
+        scenarios = [
+            {"name": "home_anonymous", "route": "home", "url": reverse('home')},
+            {"name": "home_user", "route": "home", "url": reverse('home'), "user": user},
+            {"name": "login_form", "route": "login", "url": reverse('login')},
+            {"name": "register_form", "route": "register", "url": reverse('register')},
+            {"name": "logout", "route": "logout", "url": reverse('logout'), "user": user, "relogin": True},
+            {"name": "match_open_anonymous", "route": "match_detail",
+             "url": reverse('match_detail', kwargs={'match_id': open_match.id})},
+            {"name": "match_open_user", "route": "match_detail",
+             "url": reverse('match_detail', kwargs={'match_id': open_match.id}), "user": user},
+            {"name": "match_finished_user", "route": "match_detail",
+             "url": reverse('match_detail', kwargs={'match_id': finished_match.id}), "user": user},
+            {"name": "leaderboard_global", "route": "leaderboard", "url": reverse('leaderboard')},
+            {"name": "leaderboard_around_me", "route": "leaderboard", "url": f"{reverse('leaderboard')}?around_me=1", "user": user},
+            {"name": "leaderboard_week", "route": "leaderboard", "url": f"{reverse('leaderboard')}?scope=week"},
+        ]
+        if fixtures['team']:
+            scenarios.append({"name": "team_detail", "route": "team_detail",
+                              "url": reverse('team_detail', kwargs={'team_id': fixtures['team'].id})})
+        if fixtures['competition']:
+            scenarios.append({"name": "competition_detail", "route": "competition_detail",
+                              "url": reverse('competition_detail', kwargs={'competition_id': fixtures['competition'].id}),
+                              "user": user})
+        if bettor:
+            match = Match.objects.select_related('team_one').prefetch_related('predictions').get(pk=open_match.pk)
+            scenarios.append({"name": "match_place_bet", "route": "match_detail", "method": "post", "rollback": True,
+                              "url": reverse('match_detail', kwargs={'match_id': open_match.id}), "user": bettor,
+                              "data": self._bet_form_data(match)})
+        if fixtures['slip_matches']:
+            slip = {"bets": []}
+            for match in fixtures['slip_matches']:
+                form_data = self._bet_form_data(match)
+                slip["bets"].append({
+                    "match_id": match.id,
+                    "match_winner": form_data.pop("match_winner"),
+                    "predictions": {field_name.split('_')[1]: value for field_name, value in form_data.items()},
+                })
+            scenarios.append({"name": "bet_slip", "route": "bet_slip", "method": "post", "rollback": True,
+                              "url": reverse('bet_slip'), "user": bettor, "json": slip})
+        return [scenario for scenario in scenarios if scenario.get('user', True) is not None]
+
+    def _request(self, client, scenario):
+        if scenario.get('method') == 'post':
+            if 'json' in scenario:
+                return client.post(scenario['url'], json.dumps(scenario['json']), content_type='application/json')
+            return client.post(scenario['url'], scenario.get('data', {}))
+        return client.get(scenario['url'])
+
+    def _measure_scenario(self, scenario, runs, warmup):
+        client = Client(HTTP_X_REQUESTED_WITH='DjangoBridge') # django-bridge JSON responses, as the React app requests them
+        if scenario.get('user'):
+            client.force_login(scenario['user'])
+
+        latencies, query_counts, sizes, statuses, serialization = [], [], [], set(), []
+        for run in range(warmup + runs):
+            if scenario.get('relogin') and run:
+                client.force_login(scenario['user'])
+            with transaction.atomic():
+                with CaptureQueriesContext(connection) as queries:
+                    started = time.perf_counter()
+                    response = self._request(client, scenario)
+                    elapsed = time.perf_counter() - started
+                if scenario.get('rollback'):
+                    transaction.set_rollback(True)
+            if run >= warmup:
+                latencies.append(elapsed * 1000)
+                query_counts.append(len(queries))
+                sizes.append(len(response.content))
+                statuses.add(response.status_code)
+                serialization_ms = self._server_timing_duration(response, "ser")
+                if serialization_ms is not None:
+                    serialization.append(serialization_ms)
+        return {**self._stats(latencies), "queries": statistics.median(query_counts),
+                "serialization_p50_ms": round(statistics.median(serialization), 3) if serialization else None,
+                "response_bytes": statistics.median(sizes), "status_codes": sorted(statuses)}
+
+    @staticmethod
+    def _server_timing_duration(response, name):
+        """Duration of a Server-Timing entry set by RequestMetricsMiddleware, in ms."""
+        for entry in response.get('Server-Timing', '').split(','):
+            parts = entry.strip().split(';')
+            if parts[0] == name:
+                for part in parts[1:]:
+                    if part.startswith('dur='):
+                        return float(part[4:])
+        return None
+
+    def _measure_settlement(self, match, runs):
+        """Full settlement of the busiest finished match: its points are revoked first, all in a rolled-back transaction."""
+        latencies, query_counts = [], []
+        for _run in range(runs):
+            with transaction.atomic():
+                PointsAttributionHelper.revoke_match_points(match)
+                with CaptureQueriesContext(connection) as queries:
+                    started = time.perf_counter()
+                    PointsAttributionHelper(match).settle_bets()
+                    elapsed = time.perf_counter() - started
+                transaction.set_rollback(True)
+            latencies.append(elapsed * 1000)
+            query_counts.append(len(queries))
+        return {**self._stats(latencies), "queries": statistics.median(query_counts),
+                "match_id": match.id, "bets": Bet.objects.filter(match=match).count(),
+                "answers": Answer.objects.filter(bet__match=match).count()}
+
+    @staticmethod
+    def _stats(latencies):
+        percentiles = statistics.quantiles(latencies, n=100, method='inclusive') if len(latencies) > 1 else latencies * 99
+        return {
+            "runs": len(latencies),
+            "mean_ms": round(statistics.fmean(latencies), 3),
+            "min_ms": round(min(latencies), 3),
+            "p50_ms": round(percentiles[49], 3),
+            "p90_ms": round(percentiles[89], 3),
+            "p95_ms": round(percentiles[94], 3),
+            "p99_ms": round(percentiles[98], 3),
+            "max_ms": round(max(latencies), 3),
+        }
+
+    def _print_stats(self, name, stats):
+        self.stdout.write(f"{name:<24} p50 {stats['p50_ms']:8.2f} ms  p90 {stats['p90_ms']:8.2f} ms  "
+                          f"p99 {stats['p99_ms']:8.2f} ms  {stats['queries']:>5} queries")
+
+    @staticmethod
+    def _meta(options):
+        return {
+            "timestamp": timezone.now().isoformat(),
+            "database": connection.vendor,
+            "python": platform.python_version(),
+            "django": django.get_version(),
+            "runs": options['runs'],
+            "warmup": options['warmup'],
+            "anonymous_page_cache_seconds": settings.ANONYMOUS_PAGE_CACHE_SECONDS if options['anonymous_page_cache'] else 0,
+            "dataset": {
+                "users": CustomUser.objects.count(),
+                "matches": Match.objects.count(),
+                "open_matches": Match.objects.filter(is_finished=False).count(),
+                "bets": Bet.objects.count(),
+                "answers": Answer.objects.count(),
+            },
+        }
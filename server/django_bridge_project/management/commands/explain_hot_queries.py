@@ -0,0 +1,58 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from django_bridge_project.models import Competition, CustomUser, Match
+
+# (name, queryset builder, index the plan must use). Keep in line with the queries of the views and services.
+HOT_QUERIES = [
+    ("home upcoming matches",
+     lambda now: Match.objects.filter(start_datetime__gte=now, is_finished=False).order_by('start_datetime')[:5],
+     "match_upcoming_idx"),
+    ("home featured competitions",
+     lambda now: Competition.objects.filter(end_date__gte=now.date()).order_by('start_date')[:4],
+     "competition_end_date_idx"),
+    ("unsettled finished matches",
+     lambda now: Match.objects.filter(is_finished=True, points_calculation_done=False).order_by('start_datetime'),
+     "match_unsettled_idx"),
+    ("global leaderboard",
+     lambda now: CustomUser.objects.order_by(F('score').desc(), 'username')[:50],
+     "user_score_rank_idx"),
+    ("team match list",
+     lambda now: Match.objects.filter(team_one_id=1).order_by('-start_datetime', '-id')[:20],
+     "match_team_one_start_idx"),
+    ("competition match list",
+     lambda now: Match.objects.filter(competition_id=1).order_by('start_datetime', 'id')[:20],
+     "match_competition_start_idx"),
+]
+
+
+class Command(BaseCommand):
+    help = ("Runs EXPLAIN on the hot queries of the app and fails if the plan of one of them does not use "
+            "its index. On PostgreSQL sequential scans are disabled for the check, so small tables do not "
+            "hide an index the planner cannot use.")
+
+    def add_arguments(self, parser):
+        parser.add_argument('--verbose-plans', action='store_true', help="Print the full plan of every query.")
+
+    def handle(self, *args, **options):
+        now = timezone.now()
+        missing = []
+        with transaction.atomic():
+            if connection.vendor == 'postgresql':
+                with connection.cursor() as cursor:
+                    cursor.execute("SET LOCAL enable_seqscan = off")
+            for name, build_queryset, index_name in HOT_QUERIES:
+                plan = build_queryset(now).explain()
+                if index_name in plan:
+                    self.stdout.write(f"  ok       {name:<28} {index_name}")
+                else:
+                    missing.append(name)
+                    self.stdout.write(self.style.ERROR(f"  no index {name:<28} expected {index_name}"))
+                if options['verbose_plans'] or index_name not in plan:
+                    self.stdout.write("    " + plan.replace("\n", "\n    "))
+
+        if missing:
+            raise CommandError(f"{len(missing)} hot query(ies) do not use their index: {', '.join(missing)}.")
+        self.stdout.write(self.style.SUCCESS(f"All {len(HOT_QUERIES)} hot queries use their index."))
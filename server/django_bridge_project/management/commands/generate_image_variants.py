@@ -0,0 +1,50 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand
+
+from django_bridge_project.models import Competition, Player, Team
+from django_bridge_project.services.image_variants import ImageVariants
+from django_bridge_project.services.version_stamps import VersionStamps
+
+
+class Command(BaseCommand):
+    help = ("Generates the resized variants of every team logo, competition logo and player photo that "
+            "does not have them yet, e.g. images uploaded before variants existed.")
+
+    def add_arguments(self, parser):
+        parser.add_argument('--force', action='store_true', help="Regenerate the variants that already exist.")
+        parser.add_argument('--workers', type=int, default=4, help="Images processed in parallel.")
+
+    def handle(self, *args, **options):
+        images = [] # (field_file, version stamps of the pages showing it)
+        for team in Team.objects.exclude(logo='').exclude(logo=None):
+            images.append((team.logo, ("home", "teams", f"team:{team.id}")))
+        for competition in Competition.objects.exclude(logo='').exclude(logo=None):
+            images.append((competition.logo, ("home", f"competition:{competition.id}")))
+        for player in Player.objects.exclude(photo='').exclude(photo=None):
+            images.append((player.photo, (f"team:{player.team_id}",)))
+
+        def generate(image):
+            field_file, _stamps = image
+            try:
+                return ImageVariants.generate(field_file, force=options['force']), None
+            except Exception as e: # Missing or unreadable original
+                return False, f"{field_file.name}: {e}"
+
+        with ThreadPoolExecutor(max_workers=max(1, options['workers'])) as executor:
+            results = list(executor.map(generate, images))
+
+        stamps = set()
+        generated = 0
+        for (_field_file, image_stamps), (was_generated, error) in zip(images, results):
+            if error:
+                self.stderr.write(self.style.WARNING(f"Skipped {error}"))
+            elif was_generated:
+                generated += 1
+                stamps.update(image_stamps)
+        VersionStamps.bump(*stamps)
+
+        errors = sum(1 for _generated, error in results if error)
+        self.stdout.write(self.style.SUCCESS(
+            f"Variants generated for {generated} of {len(images)} image(s), {errors} skipped."
+        ))
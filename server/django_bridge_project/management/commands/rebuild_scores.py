@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from django_bridge_project.models import Match
+from django_bridge_project.services.leaderboard_service import GlobalRanks
+from django_bridge_project.services.points_attribution_helper import PointsAttributionHelper
+from django_bridge_project.services.points_ledger import PointsLedger
+from django_bridge_project.services.scoped_leaderboards import ScopedLeaderboards
+
+
+class Command(BaseCommand):
+    help = "Recomputes every user's score, the stored global ranks and the scoped leaderboards from the points ledger."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--resettle', action='store_true',
+                            help="Rewrite the ledger entries and awarded points of every settled match from its bets first "
+                                 "(needed once for matches settled before the ledger existed).")
+
+    @transaction.atomic
+    def handle(self, *args, **options):
+        if options['resettle']:
+            settled_matches = Match.objects.filter(is_finished=True, points_calculation_done=True)
+            for match in settled_matches.iterator():
+                PointsAttributionHelper(match_instance=match).settle_bets(update_scores=False)
+            self.stdout.write(f"Ledger and awarded points rewritten for {settled_matches.count()} settled match(es).")
+
+        updated = PointsLedger.rebuild_scores()
+        self.stdout.write(self.style.SUCCESS(f"Scores rebuilt for {updated} user(s)."))
+        ranked = GlobalRanks.refresh()
+        if ranked is None:
+            self.stdout.write("Global ranks are being refreshed by another process, which will pick up the new scores.")
+        else:
+            self.stdout.write(self.style.SUCCESS(f"Global ranks rebuilt for {ranked} user(s)."))
+        entries = ScopedLeaderboards.rebuild()
+        self.stdout.write(self.style.SUCCESS(f"Scoped leaderboards rebuilt with {entries} entries."))
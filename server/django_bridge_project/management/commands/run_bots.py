@@ -0,0 +1,81 @@
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from django.core.management.base import BaseCommand, CommandError
+
+from django_bridge_project.enums.bot_strategy import BotStrategy
+from django_bridge_project.services.bot_runner import BotRunner
+from django_bridge_project.services.bot_strategies import decide_bets
+
+
+class Command(BaseCommand):
+    help = ("Makes bot accounts bet on every open match. Decisions are computed in a process pool and "
+            "written with bulk inserts; reports per-phase timings and bets/sec, so it also serves as a "
+            "load generator for the betting write path.")
+
+    def add_arguments(self, parser):
+        parser.add_argument('--bots', type=int, default=1000, help="Number of bots to run (missing ones are created).")
+        parser.add_argument('--strategy', choices=[value for value, _label in BotStrategy.get_choices()], default=None,
+                            help="Strategy of newly created bots. By default they cycle through all strategies.")
+        parser.add_argument('--workers', type=int, default=4, help="Decision processes. 0 decides in this process.")
+        parser.add_argument('--chunk-size', type=int, default=250, help="Bots per decision task.")
+        parser.add_argument('--seed', type=int, default=None, help="Seed for reproducible decisions.")
+
+    def handle(self, *args, **options):
+        if options['bots'] < 1 or options['chunk_size'] < 1:
+            raise CommandError("--bots and --chunk-size must be positive.")
+        timings = {}
+
+        started = time.perf_counter()
+        bots = BotRunner.ensure_bots(options['bots'], options['strategy'])
+        timings['bots'] = time.perf_counter() - started
+
+        started = time.perf_counter()
+        matches = BotRunner.get_open_matches()
+        history = BotRunner.get_history()
+        already_placed = BotRunner.get_already_placed([user_id for user_id, _strategy in bots],
+                                                      [match['id'] for match in matches])
+        timings['load'] = time.perf_counter() - started
+        if not matches:
+            self.stdout.write("No open matches to bet on.")
+            return
+
+        started = time.perf_counter()
+        base_seed = options['seed'] if options['seed'] is not None else time.time_ns()
+        chunks = [bots[i:i + options['chunk_size']] for i in range(0, len(bots), options['chunk_size'])]
+        placed_by_user = {}
+        for user_id, match_id in already_placed:
+            placed_by_user.setdefault(user_id, set()).add((user_id, match_id))
+        tasks = [
+            (chunk, matches, history, base_seed + index,
+             frozenset().union(*(placed_by_user.get(user_id, ()) for user_id, _strategy in chunk)))
+            for index, chunk in enumerate(chunks)
+        ]
+        decisions = []
+        if options['workers'] > 0:
+            with ProcessPoolExecutor(max_workers=options['workers']) as pool:
+                for chunk_decisions in pool.map(decide_bets, *zip(*tasks)):
+                    decisions.extend(chunk_decisions)
+        else:
+            for task in tasks:
+                decisions.extend(decide_bets(*task))
+        timings['decide'] = time.perf_counter() - started
+
+        started = time.perf_counter()
+        written, skipped = BotRunner.save_decisions(decisions)
+        timings['write'] = time.perf_counter() - started
+
+        total = sum(timings.values())
+        skipped_bets = set(skipped)
+        answers = sum(len(decision[3]) for decision in decisions if (decision[0], decision[1]) not in skipped_bets)
+        self.stdout.write(f"{len(bots)} bots, {len(matches)} open matches: {written} bets and {answers} answers placed "
+                          f"({len(already_placed)} already placed).")
+        if skipped:
+            self.stdout.write(self.style.WARNING(f"{len(skipped)} bet(s) skipped: placed concurrently by another run or "
+                                                 f"session on the same bot account."))
+        for phase, seconds in timings.items():
+            self.stdout.write(f"  {phase:<8} {seconds * 1000:10.1f} ms")
+        if timings['write'] > 0:
+            self.stdout.write(f"Write throughput: {written / timings['write']:.0f} bets/sec")
+        if total > 0:
+            self.stdout.write(f"Overall throughput: {written / total:.0f} bets/sec")
@@ -0,0 +1,210 @@
+import random
+import time
+from datetime import date, timedelta
+from itertools import accumulate
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+
+from django_bridge_project.enums.prediction_types import PredictionType
+from django_bridge_project.models import Answer, Bet, Competition, CustomUser, Match, Player, Prediction, Team
+from django_bridge_project.services.leaderboard_service import GlobalRanks
+from django_bridge_project.services.points_attribution_helper import PointsAttributionHelper
+
+PREDICTION_TEMPLATES = [
+    ("Total goals", PredictionType.NUMERICAL.value),
+    ("First scorer", PredictionType.PLAYER.value),
+    ("Penalty awarded", PredictionType.BOOLEAN.value),
+    ("Corners", PredictionType.NUMERICAL.value),
+    ("Player of the match", PredictionType.PLAYER.value),
+    ("Red card shown", PredictionType.BOOLEAN.value),
+]
+ROLES = ["Goalkeeper", "Defender", "Midfielder", "Forward"]
+
+
+class Command(BaseCommand):
+    help = ("Seeds a synthetic dataset (competitions, teams, players, matches with predictions, users, bets "
+            "and answers) with bulk inserts. Match popularity and user activity are skewed like real traffic: "
+            "a few matches and a few users account for most bets.")
+
+    def add_arguments(self, parser):
+        parser.add_argument('--prefix', default="seed", help="Prefix of every seeded name, used by --flush.")
+        parser.add_argument('--flush', action='store_true', help="Delete the data previously seeded with --prefix first.")
+        parser.add_argument('--competitions', type=int, default=5)
+        parser.add_argument('--teams', type=int, default=40)
+        parser.add_argument('--players-per-team', type=int, default=15)
+        parser.add_argument('--matches', type=int, default=400)
+        parser.add_argument('--predictions-per-match', type=int, default=3, choices=range(0, len(PREDICTION_TEMPLATES) + 1))
+        parser.add_argument('--users', type=int, default=2000)
+        parser.add_argument('--bets-per-user', type=float, default=40, help="Average number of matches a user bets on.")
+        parser.add_argument('--finished-ratio', type=float, default=0.6, help="Share of matches already played.")
+        parser.add_argument('--skew', type=float, default=1.1, help="Zipf exponent of match popularity (0 = uniform).")
+        parser.add_argument('--no-settle', action='store_true', help="Leave finished matches unsettled.")
+        parser.add_argument('--batch-size', type=int, default=5000, help="Rows per bulk insert.")
+        parser.add_argument('--seed', type=int, default=42, help="Random seed.")
+
+    def handle(self, *args, **options):
+        if options['teams'] < 2:
+            raise CommandError("At least two teams are needed.")
+        self.rng = random.Random(options['seed'])
+        self.prefix = options['prefix']
+        self.batch_size = options['batch_size']
+
+        if options['flush']:
+            self._timed("flush", self._flush)
+        elif Team.objects.filter(name__startswith=f"{self.prefix} ").exists():
+            raise CommandError(f"Data seeded with prefix '{self.prefix}' already exists. Use --flush or another --prefix.")
+
+        competitions, players_by_team = self._timed("catalogue", self._seed_catalogue, options)
+        matches, predictions_by_match = self._timed("matches", self._seed_matches, options, competitions, players_by_team)
+        users = self._timed("users", self._seed_users, options['users'])
+        bets_count, answers_count = self._timed("bets", self._seed_bets, options, matches, users,
+                                                predictions_by_match, players_by_team)
+        if not options['no_settle']:
+            self._timed("settlement", self._settle, [match for match in matches if match.is_finished])
+        self._timed("ranks", GlobalRanks.refresh)
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Seeded {len(competitions)} competitions, {len(players_by_team)} teams, {len(matches)} matches, "
+            f"{len(users)} users, {bets_count} bets and {answers_count} answers."
+        ))
+
+    def _timed(self, phase, function, *args):
+        started = time.perf_counter()
+        result = function(*args)
+        self.stdout.write(f"  {phase:<11} {time.perf_counter() - started:8.2f}s")
+        return result
+
+    def _flush(self):
+        # Deleting competitions cascades to matches, predictions, bets and answers
+        Competition.objects.filter(name__startswith=f"{self.prefix} ").delete()
+        Team.objects.filter(name__startswith=f"{self.prefix} ").delete()
+        CustomUser.objects.filter(username__startswith=f"{self.prefix}_").delete()
+
+    @transaction.atomic
+    def _seed_catalogue(self, options):
+        today = date.today()
+        competitions = Competition.objects.bulk_create([
+            Competition(name=f"{self.prefix} Competition {i}", logo=f"competition_logos/{self.prefix}_{i}.png",
+                        start_date=today - timedelta(days=365), end_date=today + timedelta(days=180))
+            for i in range(options['competitions'])
+        ])
+        teams = Team.objects.bulk_create([
+            Team(name=f"{self.prefix} Team {i}", logo=f"team_logos/{self.prefix}_{i}.png") for i in range(options['teams'])
+        ])
+        players = Player.objects.bulk_create([
+            Player(team=team, first_name=f"Player{i}", last_name=f"T{team.pk}", role=ROLES[i % len(ROLES)],
+                   photo=f"player_photos/{self.prefix}_{team.pk}_{i}.png" if i % 3 else None)
+            for team in teams for i in range(options['players_per_team'])
+        ], batch_size=self.batch_size)
+        players_by_team = {team.pk: [] for team in teams}
+        for player in players:
+            players_by_team[player.team_id].append(player.pk)
+        return competitions, players_by_team
+
+    @transaction.atomic
+    def _seed_matches(self, options, competitions, players_by_team):
+        rng = self.rng
+        now = timezone.now()
+        team_ids = list(players_by_team)
+        finished_count = int(options['matches'] * options['finished_ratio'])
+        matches = []
+        for i in range(options['matches']):
+            team_one_id, team_two_id = rng.sample(team_ids, 2)
+            is_finished = i < finished_count
+            # Finished matches are spread over the past year, open ones over the coming months
+            days = -rng.uniform(1, 365) if is_finished else rng.uniform(0.1, 120)
+            matches.append(Match(
+                competition=rng.choice(competitions), team_one_id=team_one_id, team_two_id=team_two_id,
+                start_datetime=now + timedelta(days=days), is_finished=is_finished,
+                team_one_score=rng.randint(0, 4) if is_finished else 0,
+                team_two_score=rng.randint(0, 4) if is_finished else 0,
+            ))
+        # bulk_create skips the post_save signal, so no settlement job is queued here
+        matches = Match.objects.bulk_create(matches, batch_size=self.batch_size)
+
+        predictions = []
+        for match in matches:
+            roster = players_by_team[match.team_one_id] + players_by_team[match.team_two_id]
+            for label, prediction_type in PREDICTION_TEMPLATES[:options['predictions_per_match']]:
+                correct_value = None
+                if match.is_finished:
+                    correct_value = self._random_answer(prediction_type, roster)
+                predictions.append(Prediction(match_id=match.pk, label=label, prediction_type=prediction_type,
+                                              correct_value=correct_value))
+        predictions = Prediction.objects.bulk_create(predictions, batch_size=self.batch_size)
+        predictions_by_match = {}
+        for prediction in predictions:
+            predictions_by_match.setdefault(prediction.match_id, []).append(prediction)
+        return matches, predictions_by_match
+
+    def _seed_users(self, count):
+        unusable_password = make_password(None)
+        return CustomUser.objects.bulk_create([
+            CustomUser(username=f"{self.prefix}_user_{i}", password=unusable_password) for i in range(count)
+        ], batch_size=self.batch_size)
+
+    def _random_answer(self, prediction_type, roster):
+        if prediction_type == PredictionType.NUMERICAL.value:
+            return str(min(int(self.rng.expovariate(0.4)), 15)) # Mostly small numbers
+        if prediction_type == PredictionType.PLAYER.value:
+            return str(self.rng.choice(roster))
+        return self.rng.choice(["True", "False"])
+
+    def _pick_matches(self, matches, cum_weights, count):
+        """`count` distinct matches drawn by popularity."""
+        if count >= len(matches):
+            return list(matches)
+        picked = {}
+        for _attempt in range(10):
+            for match in self.rng.choices(matches, cum_weights=cum_weights, k=(count - len(picked)) * 2):
+                picked[match.pk] = match
+                if len(picked) == count:
+                    return list(picked.values())
+        remaining = [match for match in matches if match.pk not in picked]
+        return list(picked.values()) + self.rng.sample(remaining, count - len(picked))
+
+    def _seed_bets(self, options, matches, users, predictions_by_match, players_by_team):
+        rng = self.rng
+        popularity_order = list(matches)
+        rng.shuffle(popularity_order)
+        cum_weights = list(accumulate(1 / (rank + 1) ** options['skew'] for rank in range(len(popularity_order))))
+
+        bets_count = answers_count = 0
+        pending = []
+        for user in users:
+            # Pareto activity (mean 3 for alpha 1.5): most users bet a little, a few bet on nearly everything
+            bets_for_user = max(1, round(rng.paretovariate(1.5) * options['bets_per_user'] / 3))
+            for match in self._pick_matches(popularity_order, cum_weights, bets_for_user):
+                pending.append((user, match))
+            if len(pending) >= self.batch_size:
+                written = self._write_bets(pending, predictions_by_match, players_by_team)
+                bets_count, answers_count = bets_count + written[0], answers_count + written[1]
+                pending = []
+        if pending:
+            written = self._write_bets(pending, predictions_by_match, players_by_team)
+            bets_count, answers_count = bets_count + written[0], answers_count + written[1]
+        return bets_count, answers_count
+
+    @transaction.atomic
+    def _write_bets(self, pending, predictions_by_match, players_by_team):
+        rng = self.rng
+        bets = Bet.objects.bulk_create([
+            Bet(user_id=user.pk, match_id=match.pk, winner_team_id=rng.choice([match.team_one_id, match.team_two_id, None]))
+            for user, match in pending
+        ], batch_size=self.batch_size)
+        answers = []
+        for bet, (_user, match) in zip(bets, pending):
+            roster = players_by_team[match.team_one_id] + players_by_team[match.team_two_id]
+            for prediction in predictions_by_match.get(match.pk, []):
+                answers.append(Answer(bet_id=bet.pk, prediction_id=prediction.pk,
+                                      value=self._random_answer(prediction.prediction_type, roster)))
+        Answer.objects.bulk_create(answers, batch_size=self.batch_size)
+        return len(bets), len(answers)
+
+    def _settle(self, finished_matches):
+        for match in finished_matches:
+            PointsAttributionHelper(match).settle_bets()
+        Match.objects.filter(pk__in=[match.pk for match in finished_matches]).update(points_calculation_done=True)
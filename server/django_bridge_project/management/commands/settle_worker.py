@@ -0,0 +1,55 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from django_bridge_project.services.leaderboard_service import GlobalRanks
+from django_bridge_project.services.settlement_queue import SettlementQueue
+
+
+class Command(BaseCommand):
+    help = ("Processes queued match settlements and keeps the stored global ranks up to date. "
+            "Several workers can run side by side.")
+
+    def add_arguments(self, parser):
+        parser.add_argument('--poll-interval', type=float, default=2.0,
+                            help="Seconds to wait before polling again when the queue is empty.")
+        parser.add_argument('--once', action='store_true', help="Exit as soon as the queue is empty.")
+        parser.add_argument('--enqueue-unsettled', action='store_true',
+                            help="First queue the finished matches that were never settled.")
+        parser.add_argument('--max-jobs', type=int, default=None, help="Exit after processing this many jobs.")
+        parser.add_argument('--rank-refresh-interval', type=float, default=10.0,
+                            help="Minimum seconds between two refreshes of the global ranks.")
+
+    def handle(self, *args, **options):
+        if options['enqueue_unsettled']:
+            self.stdout.write(f"Queued {SettlementQueue.enqueue_unsettled()} unsettled match(es).")
+
+        processed = 0
+        self.next_rank_refresh = 0
+        while options['max_jobs'] is None or processed < options['max_jobs']:
+            self._refresh_ranks(options['rank_refresh_interval'])
+            job = SettlementQueue.claim_next()
+            if job is None:
+                if options['once']:
+                    self.next_rank_refresh = 0 # Leaves the ranks current on exit
+                    self._refresh_ranks(options['rank_refresh_interval'])
+                    break
+                time.sleep(options['poll_interval'])
+                continue
+
+            job = SettlementQueue.run(job)
+            processed += 1
+            self.stdout.write(f"Job {job.id} (match {job.match_id}): {job.status} "
+                              f"in {job.duration_seconds:.2f}s, attempt {job.attempts}.")
+
+        self.stdout.write(f"Processed {processed} settlement job(s).")
+
+    def _refresh_ranks(self, interval):
+        """Rebuilds the global ranks when scores or users changed, at most once per interval."""
+        if time.monotonic() < self.next_rank_refresh or not GlobalRanks.is_stale():
+            return
+        self.next_rank_refresh = time.monotonic() + interval
+        started = time.perf_counter()
+        ranked = GlobalRanks.refresh()
+        if ranked is not None:
+            self.stdout.write(f"Global ranks refreshed for {ranked} user(s) in {time.perf_counter() - started:.2f}s.")
@@ -0,0 +1,44 @@
+import time
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django_bridge_project.db_routers import REPLICA_DB_ALIAS, replica_reads_allowed
+
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+
+class ReplicaRoutingMiddleware:
+    """
+    Lets the reads of safe requests go to the read replica. A successful write by a logged-in
+    user pins their session to the primary for REPLICA_PIN_SECONDS, so the page they are
+    redirected to (e.g. the match with the bet just placed) does not lag behind the replica.
+    Not used when no replica is configured.
+    """
+    PIN_SESSION_KEY = "_replica_pinned_until"
+
+    def __init__(self, get_response):
+        if REPLICA_DB_ALIAS not in settings.DATABASES:
+            raise MiddlewareNotUsed()
+        self.get_response = get_response
+
+    def __call__(self, request):
+        use_replica = request.method in SAFE_METHODS and not self._is_pinned(request)
+        token = replica_reads_allowed.set(use_replica)
+        try:
+            response = self.get_response(request)
+        finally:
+            replica_reads_allowed.reset(token)
+
+        user = getattr(request, 'user', None)
+        if request.method not in SAFE_METHODS and response.status_code < 400 and user and user.is_authenticated:
+            request.session[self.PIN_SESSION_KEY] = time.time() + settings.REPLICA_PIN_SECONDS
+        return response
+
+    def _is_pinned(self, request):
+        pinned_until = request.session.get(self.PIN_SESSION_KEY)
+        if pinned_until is None:
+            return False
+        if pinned_until > time.time():
+            return True
+        del request.session[self.PIN_SESSION_KEY]
+        return False
@@ -0,0 +1,48 @@
+import time
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.db import connections
+from django_bridge_project.services.request_metrics import RequestMetrics, RequestMetricsHistogram
+
+class QueryBudgetExceeded(AssertionError):
+    """A view ran more queries than its budget in settings.VIEW_QUERY_BUDGETS (strict mode only)."""
+
+
+class RequestMetricsMiddleware:
+    """
+    Counts and times the SQL queries of every request, adds a Server-Timing header
+    (sql, ser for serialization, total) when settings.SERVER_TIMING_HEADER is set, and feeds
+    the rolling histogram served by the staff-only metrics endpoint. Views over their query
+    budget are reported.
+    """
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        metrics = RequestMetrics()
+        request._request_metrics = metrics
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(metrics))
+            response = self.get_response(request)
+        total_seconds = time.perf_counter() - metrics.started
+
+        if getattr(settings, 'SERVER_TIMING_HEADER', False):
+            response['Server-Timing'] = metrics.server_timing(total_seconds)
+
+        view_name = request.resolver_match.view_name if request.resolver_match else None
+        if view_name:
+            RequestMetricsHistogram.record(view_name, metrics, total_seconds)
+            self._check_query_budget(view_name, metrics.query_count)
+        return response
+
+    @staticmethod
+    def _check_query_budget(view_name, query_count):
+        budget = getattr(settings, 'VIEW_QUERY_BUDGETS', {}).get(view_name)
+        if budget is None or query_count <= budget:
+            return
+        message = f"View '{view_name}' ran {query_count} queries, over its budget of {budget}."
+        if getattr(settings, 'VIEW_QUERY_BUDGETS_STRICT', False):
+            raise QueryBudgetExceeded(message)
+        print(f"Warning: {message}")
@@ -0,0 +1,36 @@
+# Generated by Django 5.1.15 on 2026-10-18 17:18
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('django_bridge_project', '0004_match_points_calculation_done'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SettlementJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('running', 'Running'), ('done', 'Done'), ('failed', 'Failed')], default='pending', max_length=20)),
+                ('attempts', models.PositiveIntegerField(default=0, help_text='Number of times a worker picked up this job.')),
+                ('available_at', models.DateTimeField(default=django.utils.timezone.now, help_text='The job is not picked up before this time (retry backoff).')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('started_at', models.DateTimeField(blank=True, null=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+                ('duration_seconds', models.FloatField(blank=True, help_text='Duration of the last run.', null=True)),
+                ('result_message', models.TextField(blank=True, help_text='Outcome of the last run, or the error that made it fail.')),
+                ('match', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='settlement_jobs', to='django_bridge_project.match')),
+            ],
+            options={
+                'verbose_name': 'Settlement Job',
+                'verbose_name_plural': 'Settlement Jobs',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['status', 'available_at'], name='settlementjob_claim_idx')],
+            },
+        ),
+    ]
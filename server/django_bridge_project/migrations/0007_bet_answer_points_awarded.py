@@ -0,0 +1,27 @@
+# Generated by Django 5.1.15 on 2026-10-18 17:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('django_bridge_project', '0006_pointsledgerentry'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='answer',
+            name='points_awarded',
+            field=models.IntegerField(blank=True, help_text='Points this answer earned, set when the match is settled.', null=True),
+        ),
+        migrations.AddField(
+            model_name='bet',
+            name='points_awarded',
+            field=models.IntegerField(blank=True, help_text='Total points this bet earned, set when the match is settled.', null=True),
+        ),
+        migrations.AddIndex(
+            model_name='bet',
+            index=models.Index(fields=['match', '-points_awarded', 'user'], name='bet_match_points_idx'),
+        ),
+    ]
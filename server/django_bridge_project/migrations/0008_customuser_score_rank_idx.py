@@ -0,0 +1,18 @@
+# Generated by Django 5.1.15 on 2026-10-18 17:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('django_bridge_project', '0007_bet_answer_points_awarded'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='customuser',
+            index=models.Index(fields=['-score', 'username'], name='user_score_rank_idx'),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.1.15 on 2026-10-18 17:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('django_bridge_project', '0009_leaderboardentry'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='match',
+            index=models.Index(fields=['team_one', 'start_datetime', 'id'], name='match_team_one_start_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='match',
+            index=models.Index(fields=['team_two', 'start_datetime', 'id'], name='match_team_two_start_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='match',
+            index=models.Index(fields=['competition', 'start_datetime', 'id'], name='match_competition_start_idx'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.1.15 on 2026-10-18 17:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('django_bridge_project', '0010_match_start_datetime_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='customuser',
+            name='bot_strategy',
+            field=models.CharField(blank=True, choices=[('random', 'Random'), ('favourite_by_history', 'Favourite by history'), ('numerical_mean', 'Numerical mean')], help_text='How this bot picks its answers. Only used when is_bot is set.', max_length=30),
+        ),
+        migrations.AddField(
+            model_name='customuser',
+            name='is_bot',
+            field=models.BooleanField(default=False, help_text='Bot accounts bet automatically through the run_bots command.'),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.1.15 on 2026-10-18 17:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('django_bridge_project', '0011_customuser_bot_fields'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='competition',
+            index=models.Index(fields=['end_date'], name='competition_end_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='match',
+            index=models.Index(condition=models.Q(('is_finished', False)), fields=['start_datetime'], name='match_upcoming_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='match',
+            index=models.Index(condition=models.Q(('is_finished', True), ('points_calculation_done', False)), fields=['start_datetime'], name='match_unsettled_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='match',
+            constraint=models.CheckConstraint(condition=models.Q(('team_one', models.F('team_two')), _negated=True), name='match_teams_differ', violation_error_message='A team cannot play against itself.'),
+        ),
+    ]
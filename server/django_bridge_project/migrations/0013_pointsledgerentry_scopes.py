@@ -0,0 +1,31 @@
+# Generated by Django 5.1.15 on 2026-10-18 18:03
+
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def record_current_scopes(apps, schema_editor):
+    """Entries settled before scopes were recorded count towards the match's current leaderboards."""
+    PointsLedgerEntry = apps.get_model('django_bridge_project', 'PointsLedgerEntry')
+    Match = apps.get_model('django_bridge_project', 'Match')
+    for match in Match.objects.filter(points_ledger_entries__isnull=False).distinct().iterator():
+        kickoff = timezone.localtime(match.start_datetime)
+        iso_year, iso_week, _weekday = kickoff.isocalendar()
+        scopes = f"competition:{match.competition_id} week:{iso_year}-W{iso_week:02d} month:{kickoff.year}-{kickoff.month:02d}"
+        PointsLedgerEntry.objects.filter(match=match).update(scopes=scopes)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('django_bridge_project', '0012_hot_query_indexes_and_constraints'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='pointsledgerentry',
+            name='scopes',
+            field=models.CharField(blank=True, default='', help_text='Space-separated scoped leaderboards the points count towards.', max_length=200),
+        ),
+        migrations.RunPython(record_current_scopes, migrations.RunPython.noop),
+    ]
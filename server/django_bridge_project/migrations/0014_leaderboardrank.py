@@ -0,0 +1,27 @@
+# Generated by Django 5.1.15 on 2026-10-18 18:28
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('django_bridge_project', '0013_pointsledgerentry_scopes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LeaderboardRank',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='leaderboard_rank', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('rank', models.PositiveIntegerField(unique=True)),
+            ],
+            options={
+                'verbose_name': 'Leaderboard Rank',
+                'verbose_name_plural': 'Leaderboard Ranks',
+                'ordering': ['rank'],
+            },
+        ),
+    ]
@@ -1,17 +1,29 @@
 from django.db import models
+from django.utils import timezone
 from django.conf import settings # Import settings to get AUTH_USER_MODEL
 from django.contrib.auth.models import AbstractUser # Import AbstractUser
 from .enums.prediction_types import PredictionType # Import the enum
+from .enums.settlement_job_status import SettlementJobStatus
+from .enums.bot_strategy import BotStrategy
 from .validators.image_validators import CustomImageValidator # Added import
 
 class CustomUser(AbstractUser):
     # Add any additional fields here. For example:
     # bio = models.TextField(blank=True)
     score = models.IntegerField(default=0, help_text="The user's current score in the betting game.")
+    is_bot = models.BooleanField(default=False, help_text="Bot accounts bet automatically through the run_bots command.")
+    bot_strategy = models.CharField(max_length=30, blank=True, choices=BotStrategy.get_choices(),
+                                    help_text="How this bot picks its answers. Only used when is_bot is set.")
 
     def __str__(self):
         return self.username
 
+    class Meta(AbstractUser.Meta):
+        indexes = [
+            # Leaderboard order: highest score first, ties broken by username
+            models.Index(fields=['-score', 'username'], name='user_score_rank_idx'),
+        ]
+
 class Competition(models.Model):
     name = models.CharField(max_length=200, unique=True)
     logo = models.ImageField(upload_to='competition_logos/', blank=True, null=True)
@@ -23,13 +35,16 @@ class Competition(models.Model):
 
     def clean(self):
         super().clean()
-        if self.logo and hasattr(self.logo, 'file'): # Check if file exists
-            CustomImageValidator.validate(self.logo.file, "Logo")
+        CustomImageValidator.validate_field(self.logo, "Logo")
 
     class Meta:
         ordering = ['start_date', 'name']
         verbose_name = "Competition"
         verbose_name_plural = "Competitions"
+        indexes = [
+            # Home page: competitions that are not over yet
+            models.Index(fields=['end_date'], name='competition_end_date_idx'),
+        ]
 
 
 class Team(models.Model):
@@ -41,8 +56,7 @@ class Team(models.Model):
 
     def clean(self):
         super().clean()
-        if self.logo and hasattr(self.logo, 'file'): # Check if file exists
-            CustomImageValidator.validate(self.logo.file, "Logo")
+        CustomImageValidator.validate_field(self.logo, "Logo")
 
     class Meta:
         ordering = ['name']
@@ -64,8 +78,7 @@ class Player(models.Model):
 
     def clean(self):
         super().clean()
-        if self.photo and hasattr(self.photo, 'file'): # Check if file exists
-            CustomImageValidator.validate(self.photo.file, "Photo")
+        CustomImageValidator.validate_field(self.photo, "Photo")
 
     class Meta:
         ordering = ['last_name', 'first_name']
@@ -98,7 +111,22 @@ class Match(models.Model):
         ordering = ['start_datetime']
         verbose_name = "Match"
         verbose_name_plural = "Matches"
-        # A team cannot play against itself. We can add a custom validation for this in the form/admin.
+        indexes = [
+            # Keyset pagination of the team and competition match lists (MatchList)
+            models.Index(fields=['team_one', 'start_datetime', 'id'], name='match_team_one_start_idx'),
+            models.Index(fields=['team_two', 'start_datetime', 'id'], name='match_team_two_start_idx'),
+            models.Index(fields=['competition', 'start_datetime', 'id'], name='match_competition_start_idx'),
+            # Partial indexes only hold the rows their query looks for: the home page upcoming
+            # matches and the finished matches still waiting for their settlement.
+            models.Index(fields=['start_datetime'], condition=models.Q(is_finished=False), name='match_upcoming_idx'),
+            models.Index(fields=['start_datetime'], condition=models.Q(is_finished=True, points_calculation_done=False),
+                         name='match_unsettled_idx'),
+        ]
+        constraints = [
+            # A team cannot play against itself. Also checked by full_clean, so the admin reports it on the form.
+            models.CheckConstraint(condition=~models.Q(team_one=models.F('team_two')), name='match_teams_differ',
+                                   violation_error_message="A team cannot play against itself."),
+        ]
 
 
 class Prediction(models.Model):
@@ -132,6 +160,7 @@ class Bet(models.Model):
     match = models.ForeignKey(Match, on_delete=models.CASCADE, related_name='bets')
     user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='bets')
     winner_team = models.ForeignKey(Team, on_delete=models.CASCADE, related_name='winner_bets', blank=True, null=True)
+    points_awarded = models.IntegerField(blank=True, null=True, help_text="Total points this bet earned, set when the match is settled.")
     created_at = models.DateTimeField(auto_now_add=True)
     # updated_at = models.DateTimeField(auto_now=True)
 
@@ -141,6 +170,10 @@ class Bet(models.Model):
     class Meta:
         ordering = ['match', 'user']
         unique_together = (('match', 'user'),) # Ensures a user can only have one Bet instance per match
+        indexes = [
+            # Match leaderboard: settled bets of a match ordered by points
+            models.Index(fields=['match', '-points_awarded', 'user'], name='bet_match_points_idx'),
+        ]
         verbose_name = "Bet Slip"
         verbose_name_plural = "Bet Slips"
 
@@ -150,6 +183,7 @@ class Answer(models.Model):
     prediction = models.ForeignKey(Prediction, on_delete=models.CASCADE, related_name='user_answers')
     
     value = models.CharField(max_length=255) 
+    points_awarded = models.IntegerField(blank=True, null=True, help_text="Points this answer earned, set when the match is settled.")
 
     def __str__(self):
         return f"Answer by {self.bet.user.username} for '{self.prediction.label}': {self.value}"
@@ -158,4 +192,101 @@ class Answer(models.Model):
         unique_together = (('bet', 'prediction'),)
         ordering = ['bet', 'prediction']
         verbose_name = "User's Answer"
-        verbose_name_plural = "User's Answers"
\ No newline at end of file
+        verbose_name_plural = "User's Answers"
+
+
+class PointsLedgerEntry(models.Model):
+    """
+    Points a user earned on a settled match. There is at most one entry per (user, match):
+    settling again replaces it and un-settling deletes it, so CustomUser.score is just a
+    cached sum of these entries and can be rebuilt from them at any time.
+
+    The scoped leaderboards the points were added to are recorded with them, so they are
+    taken back from the same leaderboards even if the match has moved to another
+    competition or date since.
+    """
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='points_ledger_entries')
+    match = models.ForeignKey(Match, on_delete=models.CASCADE, related_name='points_ledger_entries')
+    points = models.IntegerField(default=0)
+    scopes = models.CharField(max_length=200, blank=True, default="", help_text="Space-separated scoped leaderboards the points count towards.")
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.points} pts for user {self.user_id} on Match {self.match_id}"
+
+    class Meta:
+        ordering = ['match', 'user']
+        unique_together = (('user', 'match'),)
+        verbose_name = "Points Ledger Entry"
+        verbose_name_plural = "Points Ledger Entries"
+
+
+class LeaderboardEntry(models.Model):
+    """
+    A user's points on a scoped leaderboard: a competition ("competition:<id>"),
+    an ISO week ("week:2025-W07") or a month ("month:2025-02"). Kept up to date
+    incrementally by the points ledger at settlement.
+    """
+    scope = models.CharField(max_length=50)
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='leaderboard_entries')
+    points = models.IntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.points} pts for user {self.user_id} on {self.scope}"
+
+    class Meta:
+        ordering = ['scope', '-points', 'user']
+        unique_together = (('scope', 'user'),)
+        indexes = [
+            # Scoped leaderboard order: highest points first, ties broken by user id
+            models.Index(fields=['scope', '-points', 'user'], name='leaderboard_scope_rank_idx'),
+        ]
+        verbose_name = "Leaderboard Entry"
+        verbose_name_plural = "Leaderboard Entries"
+
+
+class LeaderboardRank(models.Model):
+    """
+    A user's position on the global leaderboard (score desc, username) as of the last refresh
+    of GlobalRanks. A user's rank and neighbours are then index lookups instead of a count of
+    everyone ranked above them.
+    """
+    user = models.OneToOneField(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, primary_key=True, related_name='leaderboard_rank')
+    rank = models.PositiveIntegerField(unique=True)
+
+    def __str__(self):
+        return f"#{self.rank}: user {self.user_id}"
+
+    class Meta:
+        ordering = ['rank']
+        verbose_name = "Leaderboard Rank"
+        verbose_name_plural = "Leaderboard Ranks"
+
+
+class SettlementJob(models.Model):
+    """
+    A queued points settlement for a match, processed by the settle_worker management command.
+    """
+    match = models.ForeignKey(Match, on_delete=models.CASCADE, related_name='settlement_jobs')
+    status = models.CharField(
+        max_length=20,
+        choices=SettlementJobStatus.get_choices(),
+        default=SettlementJobStatus.PENDING.value,
+    )
+    attempts = models.PositiveIntegerField(default=0, help_text="Number of times a worker picked up this job.")
+    available_at = models.DateTimeField(default=timezone.now, help_text="The job is not picked up before this time (retry backoff).")
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(blank=True, null=True)
+    finished_at = models.DateTimeField(blank=True, null=True)
+    duration_seconds = models.FloatField(blank=True, null=True, help_text="Duration of the last run.")
+    result_message = models.TextField(blank=True, help_text="Outcome of the last run, or the error that made it fail.")
+
+    def __str__(self):
+        return f"Settlement of Match {self.match_id} ({self.get_status_display()})"
+
+    class Meta:
+        ordering = ['-created_at']
+        indexes = [models.Index(fields=['status', 'available_at'], name='settlementjob_claim_idx')]
+        verbose_name = "Settlement Job"
+        verbose_name_plural = "Settlement Jobs"
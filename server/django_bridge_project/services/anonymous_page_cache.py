@@ -0,0 +1,136 @@
+import time
+from functools import wraps
+
+from django.conf import settings
+from django.contrib import messages
+from django.core.cache import cache
+from django.middleware.csrf import get_token
+from django.utils.http import quote_etag
+from django_bridge_project.controllers.utils.bridge_response import ReplayedResponse, Response
+from django_bridge_project.services.page_etags import PageETags
+from django_bridge_project.services.request_metrics import RequestMetrics
+from django_bridge_project.services.version_stamps import VersionStamps
+
+class AnonymousPageCache:
+    """
+    Whole django-bridge responses of a page, shared by every anonymous visitor. An entry holds
+    the encoded body and the version stamps it was built from. It is fresh for
+    settings.ANONYMOUS_PAGE_CACHE_SECONDS and while its stamps are current. Past that it is
+    stale: one request, holding a lock taken with cache.add, rebuilds it while the others are
+    sent the stale copy for up to STALE_SECONDS more. When there is no copy at all, the others
+    wait up to COLD_WAIT_SECONDS for the entry being built before building the page themselves.
+
+    The CSRF token is stored as a placeholder and replaced by the visitor's own token on every
+    hit, which also has CsrfViewMiddleware set the cookie. Requests with pending messages,
+    authenticated users and query strings bypass the cache. Each response reports "hit",
+    "stale", "wait", "miss" or "bypass" in the page-cache entry of Server-Timing.
+    """
+    STALE_SECONDS = 60
+    LOCK_SECONDS = 30 # Lets another request rebuild if the one holding the lock died
+    COLD_WAIT_SECONDS = 2
+    POLL_SECONDS = 0.05
+    CSRF_PLACEHOLDER = b"__csrf_token__"
+
+    @staticmethod
+    def _key(request, path):
+        # Absolute media URLs depend on the scheme and host
+        return f"page:anonymous:{request.scheme}:{request.get_host()}:{path}"
+
+    @staticmethod
+    def _is_cacheable(request):
+        return (
+            settings.ANONYMOUS_PAGE_CACHE_SECONDS > 0
+            and request.method in ('GET', 'HEAD')
+            and not request.GET
+            and not request.user.is_authenticated
+            and not len(messages.get_messages(request)) # Delivered with the page, they must not be cached or skipped
+        )
+
+    @staticmethod
+    def _report(request, outcome):
+        metrics = RequestMetrics.for_request(request)
+        if metrics is not None:
+            metrics.add_timing("page-cache", description=outcome)
+
+    @classmethod
+    def _replay(cls, request, entry, stamps):
+        response = ReplayedResponse(entry["content"].replace(cls.CSRF_PLACEHOLDER, get_token(request).encode()))
+        if entry["stamps"] != stamps and PageETags.is_enabled(request):
+            # A stale copy gets the ETag of the data it shows, so it is not revalidated as the current page
+            response['ETag'] = quote_etag(PageETags.for_stamps(request, entry["stamps"]))
+        return response
+
+    @classmethod
+    def _store(cls, key, response, stamps):
+        if response.status_code != 200 or not isinstance(response, Response) or response.messages:
+            return
+        content = response.content
+        for token in {response.props.get("csrfToken"), response.context.get("csrf_token")} - {None}:
+            content = content.replace(token.encode(), cls.CSRF_PLACEHOLDER)
+        entry = {"content": content, "stamps": stamps, "fresh_until": time.time() + settings.ANONYMOUS_PAGE_CACHE_SECONDS}
+        cache.set(key, entry, settings.ANONYMOUS_PAGE_CACHE_SECONDS + cls.STALE_SECONDS)
+
+    @classmethod
+    def _wait_for_entry(cls, key, lock_key):
+        """The entry another request is building, or None once it gave up or COLD_WAIT_SECONDS passed."""
+        deadline = time.monotonic() + cls.COLD_WAIT_SECONDS
+        while time.monotonic() < deadline:
+            time.sleep(cls.POLL_SECONDS)
+            entry = cache.get(key)
+            if entry is not None or cache.get(lock_key) is None: # Built, or the build failed or was not storable
+                return entry
+        return None
+
+    @classmethod
+    def serve(cls, request, get_stamp_names, build_response):
+        """
+        The cached response of the page for anonymous visitors, or build_response() when there
+        is none to send. get_stamp_names() returns the stamps of the data the page shows, or None
+        when it must not be cached.
+        """
+        stamp_names = get_stamp_names() if cls._is_cacheable(request) else None
+        if stamp_names is None:
+            cls._report(request, "bypass")
+            return build_response()
+
+        stamps = VersionStamps.get_many(stamp_names)
+        key = cls._key(request, request.path)
+        entry = cache.get(key)
+        if entry is not None and entry["stamps"] == stamps and time.time() < entry["fresh_until"]:
+            cls._report(request, "hit")
+            return cls._replay(request, entry, stamps)
+
+        lock_key = f"{key}:lock"
+        if not cache.add(lock_key, True, cls.LOCK_SECONDS):
+            if entry is not None: # Another request is rebuilding it
+                cls._report(request, "stale")
+                return cls._replay(request, entry, stamps)
+            entry = cls._wait_for_entry(key, lock_key) # Nothing to send yet
+            if entry is not None:
+                cls._report(request, "wait")
+                return cls._replay(request, entry, stamps)
+            cls._report(request, "miss")
+            return build_response()
+
+        try:
+            cls._report(request, "miss")
+            response = build_response()
+            cls._store(key, response, stamps)
+            return response
+        finally:
+            cache.delete(lock_key)
+
+
+def cached_for_anonymous(stamp_names_func):
+    """
+    Serves the view from AnonymousPageCache. stamp_names_func(**view_kwargs) returns the
+    stamps of the data the page shows, or None when the page must not be cached.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(request, *args, **kwargs):
+            return AnonymousPageCache.serve(
+                request, lambda: stamp_names_func(**kwargs), lambda: view(request, *args, **kwargs),
+            )
+        return wrapper
+    return decorator
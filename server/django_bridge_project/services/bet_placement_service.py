@@ -0,0 +1,150 @@
+from django.db import IntegrityError, transaction
+from django.http import Http404
+from django_bridge_project.forms.utils.bet_form_utils import BetFormGenerator
+from django_bridge_project.models import Answer, Bet, Match
+from django_bridge_project.services.version_stamps import VersionStamps
+
+class BetAlreadyPlacedError(Exception):
+    """The user already has a bet on one of the matches."""
+
+
+class BetPlacement:
+    """
+    Turns validated bet form data into Bet and Answer rows and writes any number of bets
+    with one bulk INSERT for the bets and one for all their answers.
+    """
+    MAX_SLIP_SIZE = 100 # Matches per slip
+
+    @staticmethod
+    def build_bet(match: Match, user, cleaned_data):
+        """
+        Returns an unsaved (bet, answers) pair. The winner and the predictions are checked
+        against the loaded match and its prefetched predictions, so this runs no query.
+        Raises Http404 if they do not belong to the match, ValueError for malformed
+        prediction field names.
+        """
+        winner_team_id_str = cleaned_data.get('match_winner')
+        winner_team = None
+        if winner_team_id_str and str(winner_team_id_str) != '0':  # '0' represents Draw
+            winner_team = {match.team_one_id: match.team_one, match.team_two_id: match.team_two}.get(int(winner_team_id_str))
+            if winner_team is None:
+                raise Http404("The winner must be one of the match's teams.")
+
+        predictions_by_id = {prediction.id: prediction for prediction in match.predictions.all()}
+        answers = []
+        for field_name, value in cleaned_data.items():
+            if field_name.startswith('prediction_') and value is not None and value != '':
+                prediction_id = int(field_name.split('_')[1])
+                prediction_instance = predictions_by_id.get(prediction_id)
+                if prediction_instance is None:
+                    raise Http404("Prediction not found for this match.")
+                answers.append(Answer(prediction=prediction_instance, value=str(value)))
+
+        return Bet(match=match, user=user, winner_team=winner_team), answers
+
+    @staticmethod
+    def _any_already_placed(bets):
+        """True if one of the unsaved bets conflicts with a stored bet of the same (match, user)."""
+        placed = set(Bet.objects.filter(match_id__in={bet.match_id for bet in bets}, user_id__in={bet.user_id for bet in bets})
+                                .values_list('match_id', 'user_id'))
+        return any((bet.match_id, bet.user_id) in placed for bet in bets)
+
+    @staticmethod
+    def save_bets(bets_with_answers):
+        """
+        Inserts [(bet, answers), ...] and returns the saved bets.
+        The (match, user) unique constraint rejects bets already placed: the INSERT runs in a
+        savepoint so the surrounding transaction stays usable, and BetAlreadyPlacedError is raised.
+        Any other integrity error (e.g. a missing user or team) is raised as is.
+        """
+        bets = [bet for bet, _answers in bets_with_answers]
+        try:
+            with transaction.atomic():
+                Bet.objects.bulk_create(bets)
+        except IntegrityError:
+            if BetPlacement._any_already_placed(bets):
+                raise BetAlreadyPlacedError()
+            raise
+
+        answers = []
+        for bet, bet_answers in bets_with_answers:
+            for answer in bet_answers:
+                answer.bet = bet
+                answers.append(answer)
+        Answer.objects.bulk_create(answers)
+        # Match pages show each user their own bet
+        VersionStamps.bump_on_commit(*{f"bets:user:{bet.user_id}" for bet in bets})
+        return bets
+
+    @staticmethod
+    def _slip_entry_form_data(match, entry):
+        """
+        Maps {"match_winner": ..., "predictions": {prediction_id: value}} to BetForm field names.
+        Raises ValueError naming the prediction ids that are not the match's, which the form
+        would otherwise ignore and their answers be lost.
+        """
+        form_data = {"match_winner": entry.get("match_winner")}
+        predictions = entry.get("predictions") or {}
+        if not isinstance(predictions, dict):
+            raise ValueError("predictions must be an object keyed by prediction id.")
+        match_prediction_ids = {str(prediction.id) for prediction in match.predictions.all()}
+        foreign_ids = [str(prediction_id) for prediction_id in predictions if str(prediction_id) not in match_prediction_ids]
+        if foreign_ids:
+            raise ValueError(f"Predictions {', '.join(foreign_ids)} do not belong to this match.")
+        for prediction_id, value in predictions.items():
+            form_data[f"prediction_{prediction_id}"] = value
+        return form_data
+
+    @staticmethod
+    @transaction.atomic
+    def place_slip(user, entries):
+        """
+        Places a bet on every match of the slip, or on none of them.
+        entries is a list of {"match_id": int, "match_winner": str, "predictions": {prediction_id: value}}.
+        Each entry is validated by the match's cached BetForm class.
+
+        Returns (bets, errors): the saved bets, or {match_id: error} with nothing written.
+        """
+        match_ids = [entry.get("match_id") for entry in entries]
+        if any(not isinstance(match_id, int) for match_id in match_ids):
+            return [], {"slip": "Every entry needs an integer match_id."}
+        if len(set(match_ids)) != len(match_ids):
+            return [], {"slip": "A slip can contain only one bet per match."}
+
+        matches = Match.objects.filter(pk__in=match_ids)\
+                               .select_related('team_one', 'team_two')\
+                               .prefetch_related('team_one__players', 'team_two__players', 'predictions')\
+                               .in_bulk()
+        already_bet_match_ids = set(
+            Bet.objects.filter(user=user, match_id__in=match_ids).values_list('match_id', flat=True)
+        )
+
+        errors = {}
+        bets_with_answers = []
+        for entry in entries:
+            match_id = entry["match_id"]
+            match = matches.get(match_id)
+            if match is None:
+                errors[match_id] = "Match not found."
+                continue
+            if match.is_finished:
+                errors[match_id] = "This match has already finished. Betting is closed."
+                continue
+            if match_id in already_bet_match_ids:
+                errors[match_id] = "You have already placed a bet on this match."
+                continue
+            try:
+                bet_form = BetFormGenerator.create_bet_form_for_match(match)(BetPlacement._slip_entry_form_data(match, entry))
+                if not bet_form.is_valid():
+                    errors[match_id] = bet_form.errors.get_json_data()
+                    continue
+                bets_with_answers.append(BetPlacement.build_bet(match, user, bet_form.cleaned_data))
+            except (Http404, ValueError) as e:
+                errors[match_id] = str(e)
+
+        if errors:
+            return [], errors
+        try:
+            return BetPlacement.save_bets(bets_with_answers), {}
+        except BetAlreadyPlacedError: # A concurrent request placed one of the bets in the meantime
+            return [], {"slip": "You have already placed a bet on one of these matches."}
@@ -0,0 +1,140 @@
+import statistics
+from collections import Counter
+
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+from django.db.models import Count
+from django_bridge_project.enums.bot_strategy import BotStrategy
+from django_bridge_project.enums.prediction_types import PredictionType
+from django_bridge_project.models import Answer, Bet, CustomUser, Match, Player, Prediction
+from django_bridge_project.services.bet_placement_service import BetAlreadyPlacedError, BetPlacement
+from django_bridge_project.services.points_attribution_helper import PointsAttributionHelper
+from django_bridge_project.services.version_stamps import VersionStamps
+
+class BotRunner:
+    """
+    Database side of the bot players: creates bot accounts, snapshots the open matches and
+    the past results the strategies (services/bot_strategies.py) decide from, and writes
+    the decided bets in bulk.
+    """
+    USERNAME_PREFIX = "bot_"
+    BATCH_SIZE = 1000 # Bets per transaction
+
+    @staticmethod
+    def ensure_bots(count: int, strategy: str | None = None):
+        """
+        Creates bot accounts until there are at least `count`, and returns [(user_id, strategy)] for `count` of them.
+        New bots get `strategy`, or the strategies in turn when none is given. Bots cannot log in.
+        """
+        existing = CustomUser.objects.filter(is_bot=True).count()
+        if existing < count:
+            strategies = [strategy] if strategy else [value for value, _label in BotStrategy.get_choices()]
+            unusable_password = make_password(None)
+            CustomUser.objects.bulk_create([
+                CustomUser(username=f"{BotRunner.USERNAME_PREFIX}{index}", password=unusable_password, is_bot=True,
+                           bot_strategy=strategies[index % len(strategies)])
+                for index in range(existing, count)
+            ], batch_size=BotRunner.BATCH_SIZE, ignore_conflicts=True) # Usernames taken by humans are skipped
+            VersionStamps.bump_on_commit("users") # bulk_create sends no post_save (see GlobalRanks)
+        return list(CustomUser.objects.filter(is_bot=True).order_by('id').values_list('id', 'bot_strategy')[:count])
+
+    @staticmethod
+    def get_open_matches():
+        """Matches still open for betting, as plain dicts the strategies can use in another process."""
+        matches = list(Match.objects.filter(is_finished=False).order_by('start_datetime', 'id')
+                                    .values('id', 'team_one_id', 'team_two_id'))
+        match_ids = [match['id'] for match in matches]
+        team_ids = {match[field] for match in matches for field in ('team_one_id', 'team_two_id')}
+
+        players_by_team = {}
+        for player_id, team_id in Player.objects.filter(team_id__in=team_ids).values_list('id', 'team_id'):
+            players_by_team.setdefault(team_id, []).append(player_id)
+        predictions_by_match = {}
+        for prediction in Prediction.objects.filter(match_id__in=match_ids).order_by('id')\
+                                            .values('id', 'match_id', 'label', 'prediction_type'):
+            predictions_by_match.setdefault(prediction.pop('match_id'), []).append(prediction)
+
+        for match in matches:
+            match['player_ids'] = players_by_team.get(match['team_one_id'], []) + players_by_team.get(match['team_two_id'], [])
+            match['predictions'] = predictions_by_match.get(match['id'], [])
+        return matches
+
+    @staticmethod
+    def get_history():
+        """Aggregates of the finished matches the strategies decide from."""
+        team_wins, team_played = Counter(), Counter()
+        finished_matches = Match.objects.filter(is_finished=True).only(
+            'id', 'is_finished', 'team_one_id', 'team_two_id', 'team_one_score', 'team_two_score',
+            'is_winner_needed', 'team_one_draw_score', 'team_two_draw_score',
+        )
+        for match in finished_matches.iterator():
+            team_played.update([match.team_one_id, match.team_two_id])
+            winner_id = PointsAttributionHelper(match)._determine_actual_winner_team_id()
+            if winner_id:
+                team_wins[winner_id] += 1
+
+        settled = Prediction.objects.filter(match__is_finished=True, correct_value__isnull=False).exclude(correct_value='')
+
+        values_by_label = {}
+        for label, value in settled.filter(prediction_type=PredictionType.NUMERICAL.value).values_list('label', 'correct_value'):
+            try:
+                values_by_label.setdefault(label, []).append(float(value))
+            except ValueError:
+                continue
+        all_values = [value for values in values_by_label.values() for value in values]
+
+        player_hits = {}
+        for value, hits in settled.filter(prediction_type=PredictionType.PLAYER.value)\
+                                  .values('correct_value').annotate(hits=Count('id')).values_list('correct_value', 'hits'):
+            if value.isdigit():
+                player_hits[int(value)] = hits
+
+        boolean_values = [value.lower() == 'true' for value in
+                          settled.filter(prediction_type=PredictionType.BOOLEAN.value).values_list('correct_value', flat=True)]
+
+        return {
+            "team_wins": dict(team_wins),
+            "team_played": dict(team_played),
+            "numerical_means": {label: statistics.fmean(values) for label, values in values_by_label.items()},
+            "numerical_mean": statistics.fmean(all_values) if all_values else None,
+            "player_hits": player_hits,
+            "boolean_true_rate": sum(boolean_values) / len(boolean_values) if boolean_values else None,
+        }
+
+    @staticmethod
+    def get_already_placed(user_ids, match_ids):
+        """(user_id, match_id) pairs the bots already bet on."""
+        return set(Bet.objects.filter(user_id__in=user_ids, match_id__in=match_ids).values_list('user_id', 'match_id'))
+
+    @staticmethod
+    def _bets_with_answers(decisions):
+        return [
+            (Bet(user_id=user_id, match_id=match_id, winner_team_id=winner_team_id or None),
+             [Answer(prediction_id=prediction_id, value=value) for prediction_id, value in answers])
+            for user_id, match_id, winner_team_id, answers in decisions
+        ]
+
+    @staticmethod
+    def save_decisions(decisions):
+        """
+        Writes [(user_id, match_id, winner_team_id or 0, [(prediction_id, value)])] in batches,
+        each one a transaction with a bulk INSERT of bets and one of answers.
+        A bet placed in the meantime (another run, or someone using a bot account) only drops
+        that decision: the batch is written again without it.
+        Returns (bets written, [(user_id, match_id)] skipped).
+        """
+        written, skipped = 0, []
+        for i in range(0, len(decisions), BotRunner.BATCH_SIZE):
+            batch = decisions[i:i + BotRunner.BATCH_SIZE]
+            while batch:
+                try:
+                    with transaction.atomic():
+                        written += len(BetPlacement.save_bets(BotRunner._bets_with_answers(batch)))
+                    break
+                except BetAlreadyPlacedError:
+                    placed = set(Bet.objects.filter(user_id__in={decision[0] for decision in batch},
+                                                    match_id__in={decision[1] for decision in batch})
+                                            .values_list('user_id', 'match_id'))
+                    skipped.extend((user_id, match_id) for user_id, match_id, *_rest in batch if (user_id, match_id) in placed)
+                    batch = [decision for decision in batch if (decision[0], decision[1]) not in placed]
+        return written, skipped
@@ -0,0 +1,108 @@
+import random
+
+from django_bridge_project.enums.bot_strategy import BotStrategy
+from django_bridge_project.enums.prediction_types import PredictionType
+
+# Strategies only work on plain dicts (see BotRunner.get_open_matches and BotRunner.get_history)
+# and never touch the database, so decisions can be computed in worker processes.
+#
+# match:   {"id", "team_one_id", "team_two_id", "player_ids": [...],
+#           "predictions": [{"id", "label", "prediction_type"}, ...]}
+# history: {"team_wins": {team_id: wins}, "team_played": {team_id: matches},
+#           "numerical_means": {label: mean}, "numerical_mean": float | None,
+#           "player_hits": {player_id: times correct}, "boolean_true_rate": float | None}
+
+class RandomBotStrategy:
+    """Uniformly random winner (draw included) and answers."""
+    NUMERICAL_RANGE = (0, 5)
+
+    def __init__(self, history):
+        self.history = history
+
+    def pick_winner(self, match, rng):
+        return rng.choice([match["team_one_id"], match["team_two_id"], 0]) # 0 is a draw
+
+    def pick_numerical(self, prediction, match, rng):
+        return rng.randint(*self.NUMERICAL_RANGE)
+
+    def pick_player(self, prediction, match, rng):
+        return rng.choice(match["player_ids"]) if match["player_ids"] else None
+
+    def pick_boolean(self, prediction, match, rng):
+        return rng.random() < 0.5
+
+    def decide(self, match, rng):
+        """Returns (winner_team_id or 0, [(prediction_id, answer value as stored in Answer.value)])."""
+        pickers = {
+            PredictionType.NUMERICAL.value: self.pick_numerical,
+            PredictionType.PLAYER.value: self.pick_player,
+            PredictionType.BOOLEAN.value: self.pick_boolean,
+        }
+        answers = []
+        for prediction in match["predictions"]:
+            value = pickers[prediction["prediction_type"]](prediction, match, rng)
+            if value is not None:
+                answers.append((prediction["id"], str(value)))
+        return self.pick_winner(match, rng), answers
+
+
+class FavouriteByHistoryBotStrategy(RandomBotStrategy):
+    """Backs the team with the best win rate, the player most often right and the most frequent boolean outcome."""
+
+    def _win_rate(self, team_id):
+        played = self.history["team_played"].get(team_id, 0)
+        return self.history["team_wins"].get(team_id, 0) / played if played else 0.0
+
+    def pick_winner(self, match, rng):
+        rate_one, rate_two = self._win_rate(match["team_one_id"]), self._win_rate(match["team_two_id"])
+        if rate_one == rate_two:
+            return super().pick_winner(match, rng)
+        return match["team_one_id"] if rate_one > rate_two else match["team_two_id"]
+
+    def pick_player(self, prediction, match, rng):
+        player_hits = self.history["player_hits"]
+        best_player_id = max(match["player_ids"], key=lambda player_id: player_hits.get(player_id, 0), default=None)
+        if best_player_id is None or not player_hits.get(best_player_id):
+            return super().pick_player(prediction, match, rng)
+        return best_player_id
+
+    def pick_boolean(self, prediction, match, rng):
+        if self.history["boolean_true_rate"] is None:
+            return super().pick_boolean(prediction, match, rng)
+        return self.history["boolean_true_rate"] >= 0.5
+
+
+class NumericalMeanBotStrategy(RandomBotStrategy):
+    """Answers numerical predictions with the rounded mean of past outcomes of the same question."""
+
+    def pick_numerical(self, prediction, match, rng):
+        mean = self.history["numerical_means"].get(prediction["label"], self.history["numerical_mean"])
+        if mean is None:
+            return super().pick_numerical(prediction, match, rng)
+        return max(round(mean), 0) # The bet form only accepts numbers >= 0
+
+
+STRATEGIES = {
+    BotStrategy.RANDOM.value: RandomBotStrategy,
+    BotStrategy.FAVOURITE_BY_HISTORY.value: FavouriteByHistoryBotStrategy,
+    BotStrategy.NUMERICAL_MEAN.value: NumericalMeanBotStrategy,
+}
+
+
+def decide_bets(bots, matches, history, seed, already_placed=frozenset()):
+    """
+    Picks the bets of a chunk of bots: bots is [(user_id, strategy name)]. Matches a bot already
+    bet on, listed as (user_id, match_id) pairs in already_placed, are skipped.
+    Returns [(user_id, match_id, winner_team_id or 0, answers)]. Top-level so a process pool can pickle it.
+    """
+    rng = random.Random(seed)
+    strategies = {name: strategy_class(history) for name, strategy_class in STRATEGIES.items()}
+    decisions = []
+    for user_id, strategy_name in bots:
+        strategy = strategies.get(strategy_name, strategies[BotStrategy.RANDOM.value])
+        for match in matches:
+            if (user_id, match["id"]) in already_placed:
+                continue
+            winner_team_id, answers = strategy.decide(match, rng)
+            decisions.append((user_id, match["id"], winner_team_id, answers))
+    return decisions
@@ -0,0 +1,130 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.db import transaction
+from PIL import Image, ImageOps
+
+from django_bridge_project.services.version_stamps import VersionStamps
+
+class ImageVariants:
+    """
+    Resized renditions of uploaded images, stored next to the original: team_logos/club.png gets
+    team_logos/club_64w.webp, club_128w.webp, club_256w.webp for the srcset and club_128w.png as
+    the plain src. The fallback is a PNG for PNG and WebP originals, which may be transparent, and
+    a JPEG otherwise. Images narrower than a width are not upscaled.
+
+    Variants are generated by a thread pool once the upload is committed (see signals) or by the
+    generate_image_variants command. Until they exist, pages keep sending the original.
+
+    Whether the variants exist is memoized in the cache, so pages do not hit the storage for every
+    image on every build: for good once they exist, for MISSING_SECONDS while they do not.
+    Generating the variants records them at once.
+    """
+    WIDTHS = (64, 128, 256) # Avatars are shown at 32 to 128 CSS pixels, at up to 2x density
+    FALLBACK_WIDTH = 128
+    WEBP_QUALITY = 80
+    JPEG_QUALITY = 85
+    MAX_WORKERS = 2
+    MISSING_SECONDS = 60 # Bounds how long a process that missed the generation keeps sending the original
+
+    _executor = None
+    _executor_lock = threading.Lock()
+    _generated = set() # Original names whose variants are known to exist (this process)
+
+    @staticmethod
+    def webp_name(name, width):
+        return f"{os.path.splitext(name)[0]}_{width}w.webp"
+
+    @staticmethod
+    def fallback_name(name):
+        stem, extension = os.path.splitext(name)
+        fallback_extension = ".png" if extension.lower() in (".png", ".webp") else ".jpg"
+        return f"{stem}_{ImageVariants.FALLBACK_WIDTH}w{fallback_extension}"
+
+    @staticmethod
+    def _cache_key(name):
+        return f"image-variants:{name}"
+
+    @classmethod
+    def _record(cls, name, available):
+        if available:
+            cls._generated.add(name)
+        cache.set(cls._cache_key(name), available, None if available else cls.MISSING_SECONDS)
+
+    @classmethod
+    def is_available(cls, field_file) -> bool:
+        """True once every variant of the file is stored. The fallback is written last."""
+        if field_file.name in cls._generated:
+            return True
+        available = cache.get(cls._cache_key(field_file.name))
+        if available is None:
+            available = field_file.storage.exists(cls.fallback_name(field_file.name))
+            cls._record(field_file.name, available)
+        elif available:
+            cls._generated.add(field_file.name)
+        return available
+
+    @staticmethod
+    def _resize(image, width):
+        if image.width <= width:
+            return image
+        return image.resize((width, max(1, round(image.height * width / image.width))), Image.Resampling.LANCZOS)
+
+    @staticmethod
+    def _store(storage, name, image, image_format, **save_options):
+        buffer = BytesIO()
+        image.save(buffer, image_format, **save_options)
+        if hasattr(storage, 'save_derived'): # ContentAddressedStorage would rename the file after its content
+            storage.save_derived(name, ContentFile(buffer.getvalue()))
+            return
+        if storage.exists(name): # save() would pick another name
+            storage.delete(name)
+        storage.save(name, ContentFile(buffer.getvalue()))
+
+    @classmethod
+    def generate(cls, field_file, force=False) -> bool:
+        """Writes the variants of the file. Returns False when they already existed."""
+        if not force and cls.is_available(field_file):
+            return False
+        storage, name = field_file.storage, field_file.name
+        with storage.open(name, 'rb') as original:
+            image = ImageOps.exif_transpose(Image.open(original))
+            has_alpha = image.mode in ('RGBA', 'LA') or (image.mode == 'P' and 'transparency' in image.info)
+            image = image.convert('RGBA' if has_alpha else 'RGB')
+
+        for width in cls.WIDTHS:
+            cls._store(storage, cls.webp_name(name, width), cls._resize(image, width), 'WEBP', quality=cls.WEBP_QUALITY)
+        fallback_name = cls.fallback_name(name)
+        fallback = cls._resize(image, cls.FALLBACK_WIDTH)
+        if fallback_name.endswith(".png"):
+            cls._store(storage, fallback_name, fallback, 'PNG', optimize=True)
+        else:
+            cls._store(storage, fallback_name, fallback.convert('RGB'), 'JPEG', quality=cls.JPEG_QUALITY, optimize=True)
+        cls._record(name, True)
+        return True
+
+    @classmethod
+    def get_executor(cls) -> ThreadPoolExecutor:
+        with cls._executor_lock:
+            if cls._executor is None:
+                cls._executor = ThreadPoolExecutor(max_workers=cls.MAX_WORKERS, thread_name_prefix="image-variants")
+            return cls._executor
+
+    @classmethod
+    def schedule(cls, field_file, stamps=()):
+        """
+        Generates the variants in the background once the current transaction commits, then
+        bumps the version stamps of the pages showing the image so they send the new URLs.
+        """
+        def run():
+            try:
+                if cls.generate(field_file):
+                    VersionStamps.bump(*stamps)
+            except Exception as e:
+                print(f"Error: could not generate the image variants of {field_file.name}: {e}")
+
+        transaction.on_commit(lambda: cls.get_executor().submit(run))
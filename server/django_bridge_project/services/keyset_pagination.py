@@ -0,0 +1,28 @@
+import base64
+import json
+
+class KeysetCursor:
+    """
+    Opaque cursors for keyset ("seek") pagination: the client sends back the sort key of
+    the last row it received and the next page starts right after it, using an index
+    range scan instead of OFFSET.
+    """
+
+    @staticmethod
+    def encode(values: list) -> str:
+        payload = json.dumps(values, separators=(',', ':'), default=str)
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+    @staticmethod
+    def decode(cursor: str | None, length: int) -> list | None:
+        """Returns the cursor values, or None if the cursor is missing or malformed."""
+        if not cursor:
+            return None
+        try:
+            payload = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+            values = json.loads(payload)
+        except (ValueError, TypeError):
+            return None
+        if not isinstance(values, list) or len(values) != length:
+            return None
+        return values
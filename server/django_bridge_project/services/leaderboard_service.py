@@ -0,0 +1,186 @@
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.db import connection, transaction
+from django.db.models import F, Q, Window
+from django.db.models.functions import RowNumber
+from django_bridge_project.models import CustomUser, LeaderboardRank
+from django_bridge_project.services.keyset_pagination import KeysetCursor
+from django_bridge_project.services.version_stamps import VersionStamps
+
+class Leaderboard:
+    """
+    Ranking of users over a queryset, ordered by score (highest first) then by a unique tie-breaker.
+    Pages are read with keyset pagination, so no request sorts the whole table. A user's rank
+    is read from rank_field, a stored rank (see GlobalRanks), when the board has one and the
+    user is ranked; otherwise it is a count over the index range above them.
+    """
+    DEFAULT_PAGE_SIZE = 25
+    MAX_PAGE_SIZE = 100
+
+    def __init__(self, queryset, score_field='score', tiebreak_field='username',
+                 user_id_field='id', username_field='username', rank_field=None):
+        self.queryset = queryset
+        self.score_field = score_field
+        self.tiebreak_field = tiebreak_field
+        self.user_id_field = user_id_field
+        self.username_field = username_field
+        self.rank_field = rank_field
+
+    def _ordered(self):
+        return self.queryset.order_by(F(self.score_field).desc(), self.tiebreak_field)
+
+    def _rows(self, queryset):
+        return queryset.values_list(self.user_id_field, self.username_field, self.score_field, self.tiebreak_field)
+
+    def _ranked_above(self, score, tiebreak):
+        """Rows ranked strictly above (score, tiebreak)."""
+        return Q(**{f'{self.score_field}__gt': score}) | \
+               Q(**{self.score_field: score, f'{self.tiebreak_field}__lt': tiebreak})
+
+    def _ranked_below(self, score, tiebreak):
+        """Rows ranked strictly below (score, tiebreak)."""
+        return Q(**{f'{self.score_field}__lt': score}) | \
+               Q(**{self.score_field: score, f'{self.tiebreak_field}__gt': tiebreak})
+
+    def _decode_cursor(self, cursor):
+        """(score, tiebreak, rank) of a cursor, or None if it is missing or malformed."""
+        cursor_values = KeysetCursor.decode(cursor, 3)
+        if not cursor_values:
+            return None
+        score, tiebreak, rank = cursor_values
+        # bool is an int subclass, but no score or rank is ever encoded as one
+        if not isinstance(score, int) or isinstance(score, bool) or not isinstance(rank, int) \
+                or isinstance(rank, bool) or rank < 1 or not isinstance(tiebreak, (int, str)):
+            return None
+        try: # The tiebreak is a username or a user id depending on the leaderboard
+            tiebreak = self.queryset.model._meta.get_field(self.tiebreak_field).to_python(tiebreak)
+        except ValidationError:
+            return None
+        return score, tiebreak, rank
+
+    @staticmethod
+    def _serialize_entry(row, rank):
+        user_id, username, score, _tiebreak = row
+        return {
+            "user": {"id": user_id, "username": username},
+            "score": score,
+            "rank": rank,
+        }
+
+    def get_page(self, cursor: str | None = None, limit: int | None = None):
+        """
+        Returns {"entries": [...], "next_cursor": str | None}.
+        The cursor carries the last (score, tiebreak, rank) so the next page needs no count.
+        A missing or malformed cursor returns the first page.
+        """
+        limit = min(limit or self.DEFAULT_PAGE_SIZE, self.MAX_PAGE_SIZE)
+        queryset = self._ordered()
+        first_rank = 1
+        cursor_values = self._decode_cursor(cursor)
+        if cursor_values:
+            last_score, last_tiebreak, last_rank = cursor_values
+            queryset = queryset.filter(self._ranked_below(last_score, last_tiebreak))
+            first_rank = last_rank + 1
+
+        rows = list(self._rows(queryset)[:limit + 1])
+        entries = [self._serialize_entry(row, first_rank + index) for index, row in enumerate(rows[:limit])]
+
+        next_cursor = None
+        if len(rows) > limit:
+            last_row = rows[limit - 1]
+            next_cursor = KeysetCursor.encode([last_row[2], last_row[3], entries[-1]["rank"]])
+        return {"entries": entries, "next_cursor": next_cursor}
+
+    def get_standing(self, user_id: int, neighbours: int = 2):
+        """
+        Returns the user's rank with the entries just above and below them,
+        or None if the user is not on this leaderboard.
+
+        With a stored rank, the user and their neighbours are two lookups on the rank index,
+        O(log n) whatever the rank; the ranks are those of the last refresh. Without one, the
+        rank is a count of the rows above the user, whose cost grows with the rank.
+        """
+        if self.rank_field:
+            row = self.queryset.filter(**{self.user_id_field: user_id})\
+                               .values_list(self.user_id_field, self.username_field, self.score_field,
+                                            self.tiebreak_field, self.rank_field).first()
+            if row is None:
+                return None
+            if row[4] is not None:
+                return self._standing_from_stored_ranks(row, neighbours)
+            row = row[:4] # Not ranked since the last refresh
+        else:
+            row = self._rows(self.queryset.filter(**{self.user_id_field: user_id})).first()
+            if row is None:
+                return None
+        score, tiebreak = row[2], row[3]
+
+        rank = self.queryset.filter(self._ranked_above(score, tiebreak)).count() + 1
+        above = list(self._rows(
+            self.queryset.filter(self._ranked_above(score, tiebreak))
+                         .order_by(F(self.score_field).asc(), F(self.tiebreak_field).desc())
+        )[:neighbours])
+        below = list(self._rows(self._ordered().filter(self._ranked_below(score, tiebreak)))[:neighbours])
+
+        entries = [self._serialize_entry(r, rank - index - 1) for index, r in enumerate(above)][::-1]
+        entries.append(self._serialize_entry(row, rank))
+        entries.extend(self._serialize_entry(r, rank + index + 1) for index, r in enumerate(below))
+        return {"rank": rank, "score": score, "entries": entries}
+
+    def _standing_from_stored_ranks(self, row, neighbours):
+        rank = row[4]
+        rows = self.queryset.filter(**{f'{self.rank_field}__range': (rank - neighbours, rank + neighbours)})\
+                            .order_by(self.rank_field)\
+                            .values_list(self.user_id_field, self.username_field, self.score_field,
+                                         self.tiebreak_field, self.rank_field)
+        entries = [self._serialize_entry(r[:4], r[4]) for r in rows]
+        return {"rank": rank, "score": row[2], "entries": entries}
+
+
+class GlobalRanks:
+    """
+    Stored ranks of the global leaderboard (LeaderboardRank), rebuilt in one INSERT ... SELECT
+    ROW_NUMBER() pass over the (-score, username) index. They are stale once the "scores" or
+    "users" stamp moved since the last refresh; the settle worker refreshes them between jobs.
+    Until then a user keeps their previous rank, and a new user is ranked with a count.
+    """
+    REFRESHED_STAMPS_KEY = "leaderboard:ranks:stamps"
+    LOCK_KEY = "leaderboard:ranks:lock"
+    LOCK_SECONDS = 300
+    STAMP_NAMES = ("scores", "users")
+
+    @staticmethod
+    def is_stale() -> bool:
+        return cache.get(GlobalRanks.REFRESHED_STAMPS_KEY) != VersionStamps.get_many(GlobalRanks.STAMP_NAMES)
+
+    @staticmethod
+    def refresh():
+        """Rebuilds the ranks. Returns the number of ranked users, or None if another process is refreshing them."""
+        if not cache.add(GlobalRanks.LOCK_KEY, True, GlobalRanks.LOCK_SECONDS):
+            return None
+        try:
+            stamps = VersionStamps.get_many(GlobalRanks.STAMP_NAMES) # Read first: a bump during the rebuild triggers another
+            ranked = CustomUser.objects.order_by().annotate(
+                position=Window(RowNumber(), order_by=[F('score').desc(), F('username').asc()]),
+            ).values_list('id', 'position')
+            select_sql, params = ranked.query.sql_with_params()
+            quote = connection.ops.quote_name
+            with transaction.atomic():
+                LeaderboardRank.objects.all().delete()
+                with connection.cursor() as cursor:
+                    cursor.execute(
+                        f"INSERT INTO {quote(LeaderboardRank._meta.db_table)} "
+                        f"({quote(LeaderboardRank._meta.get_field('user').column)}, {quote(LeaderboardRank._meta.get_field('rank').column)}) "
+                        f"{select_sql}",
+                        params,
+                    )
+                    count = cursor.rowcount
+            cache.set(GlobalRanks.REFRESHED_STAMPS_KEY, stamps, None)
+            return count
+        finally:
+            cache.delete(GlobalRanks.LOCK_KEY)
+
+
+def get_global_leaderboard() -> Leaderboard:
+    """Lifetime ranking on CustomUser.score, served by the (-score, username) index and the stored ranks."""
+    return Leaderboard(CustomUser.objects.all(), rank_field='leaderboard_rank__rank')
@@ -0,0 +1,73 @@
+from datetime import datetime
+
+from django.db.models import Q
+from django_bridge_project.models import Match
+from django_bridge_project.services.keyset_pagination import KeysetCursor
+
+class MatchList:
+    """
+    Keyset-paginated list of matches ordered by (start_datetime, id).
+    Each filter is read with its own ordered, limited query so it can walk a
+    (<fk>, start_datetime, id) index; the pages are then merged in Python. A page costs
+    at most one query per filter whatever the length of the history.
+    """
+    DEFAULT_PAGE_SIZE = 20
+    MAX_PAGE_SIZE = 100
+
+    def __init__(self, filters: list[Q], descending=False):
+        self.filters = filters
+        self.descending = descending
+
+    def _ordering(self):
+        return ('-start_datetime', '-id') if self.descending else ('start_datetime', 'id')
+
+    def _after(self, start_datetime, match_id):
+        """Matches listed strictly after (start_datetime, match_id)."""
+        lookup = 'lt' if self.descending else 'gt'
+        return Q(**{f'start_datetime__{lookup}': start_datetime}) | \
+               Q(start_datetime=start_datetime, **{f'id__{lookup}': match_id})
+
+    @staticmethod
+    def _decode_cursor(cursor):
+        cursor_values = KeysetCursor.decode(cursor, 2)
+        if not cursor_values:
+            return None
+        try:
+            return datetime.fromisoformat(cursor_values[0]), int(cursor_values[1])
+        except (TypeError, ValueError):
+            return None
+
+    def get_page(self, cursor: str | None = None, limit: int | None = None):
+        """
+        Returns {"matches": [Match, ...], "next_cursor": str | None}.
+        A missing or malformed cursor returns the first page.
+        """
+        limit = min(limit or self.DEFAULT_PAGE_SIZE, self.MAX_PAGE_SIZE)
+        after = self._decode_cursor(cursor)
+
+        matches_by_id = {}
+        for match_filter in self.filters:
+            queryset = Match.objects.filter(match_filter)\
+                                    .select_related('team_one', 'team_two')\
+                                    .order_by(*self._ordering())
+            if after:
+                queryset = queryset.filter(self._after(*after))
+            for match in queryset[:limit + 1]:
+                matches_by_id[match.id] = match
+
+        matches = sorted(matches_by_id.values(), key=lambda match: (match.start_datetime, match.id), reverse=self.descending)
+        next_cursor = None
+        if len(matches) > limit:
+            last_match = matches[limit - 1]
+            next_cursor = KeysetCursor.encode([last_match.start_datetime.isoformat(), last_match.id])
+        return {"matches": matches[:limit], "next_cursor": next_cursor}
+
+
+def get_team_match_list(team_id: int):
+    """Matches of a team, most recent first: one index scan on each side of the fixture."""
+    return MatchList([Q(team_one_id=team_id), Q(team_two_id=team_id)], descending=True)
+
+
+def get_competition_match_list(competition_id: int):
+    """Matches of a competition in schedule order."""
+    return MatchList([Q(competition_id=competition_id)])
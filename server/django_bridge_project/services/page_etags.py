@@ -0,0 +1,121 @@
+import hashlib
+import time
+from functools import wraps
+
+from django.conf import settings
+from django.contrib import messages
+from django.core.cache import cache
+from django.utils.cache import patch_vary_headers
+from django.views.decorators.http import condition
+from django_bridge_project.controllers.utils.home_data_helper import HomeDataHelper
+from django_bridge_project.db_routers import REPLICA_DB_ALIAS, replica_reads_allowed
+from django_bridge_project.models import Match
+from django_bridge_project.services.version_stamps import VersionStamps
+
+class PageETags:
+    """
+    ETags of the django-bridge pages, for django.views.decorators.http.condition. Each one is
+    built from the version stamps of the data the page shows plus what tells two visitors apart
+    (user, CSRF cookie, JSON or HTML response, query string), so a matching If-None-Match is
+    answered with a 304 before any data helper runs. Stamps are bumped by the signals and services
+    that change the data: "match:<id>", "team:<id>", "competition:<id>", "teams", "scores",
+    "bets:user:<id>" and "home".
+
+    No ETag is sent when a stale page could be revalidated as current: when the stamps are not
+    shared by every process (VersionStamps.is_shared), and when the request reads from the
+    replica, which may not have the rows of a stamp bumped on the primary yet.
+    """
+    MATCH_REFS_TIMEOUT = 24 * 60 * 60
+
+    @staticmethod
+    def is_enabled(request) -> bool:
+        if not VersionStamps.is_shared():
+            return False
+        if REPLICA_DB_ALIAS in settings.DATABASES and replica_reads_allowed.get():
+            return False
+        # Pending messages are delivered with the page, and a 304 would leave them queued
+        return request.method in ('GET', 'HEAD') and not len(messages.get_messages(request))
+
+    @staticmethod
+    def _etag(request, stamp_names, **extra_parts):
+        if not PageETags.is_enabled(request):
+            return None
+        return PageETags.for_stamps(request, {**VersionStamps.get_many(stamp_names), **extra_parts})
+
+    @staticmethod
+    def for_stamps(request, stamps):
+        """ETag of the page for the given {stamp name: stamp}, also used for a page built from older stamps."""
+        parts = [
+            request.headers.get('X-Requested-With', ''),
+            str(request.user.id),
+            request.COOKIES.get(settings.CSRF_COOKIE_NAME, ''), # The page embeds a token for this cookie
+            request.get_full_path(),
+            *(f"{name}={stamps[name]}" for name in sorted(stamps)),
+        ]
+        return hashlib.sha256("|".join(parts).encode()).hexdigest()[:32]
+
+    @staticmethod
+    def _match_refs(match_id):
+        """(team_one_id, team_two_id, competition_id) of the match, cached under the match stamp."""
+        cache_key = f"match:refs:{match_id}:{VersionStamps.get(f'match:{match_id}')}"
+        refs = cache.get(cache_key)
+        if refs is None:
+            refs = Match.objects.filter(pk=match_id).values_list('team_one_id', 'team_two_id', 'competition_id').first()
+            if refs is not None:
+                cache.set(cache_key, refs, PageETags.MATCH_REFS_TIMEOUT)
+        return refs
+
+    @staticmethod
+    def home(request):
+        # Upcoming matches and featured competitions also change with the time, without a bump:
+        # the ETag changes with each period of the shared home payload
+        period = int(time.time() // HomeDataHelper.SHARED_PAYLOAD_TIMEOUT)
+        return PageETags._etag(request, ["home"], period=period)
+
+    @staticmethod
+    def match_stamp_names(match_id):
+        """Stamps of the data a match page shows to every visitor, or None for an unknown match."""
+        refs = PageETags._match_refs(match_id)
+        if refs is None:
+            return None
+        team_one_id, team_two_id, competition_id = refs
+        return [f"match:{match_id}", f"team:{team_one_id}", f"team:{team_two_id}",
+                f"competition:{competition_id}", "scores"] # The page shows the user's score
+
+    @staticmethod
+    def match_detail(request, match_id):
+        stamp_names = PageETags.match_stamp_names(match_id)
+        if stamp_names is None: # The view answers 404
+            return None
+        if request.user.is_authenticated:
+            stamp_names.append(f"bets:user:{request.user.id}")
+        return PageETags._etag(request, stamp_names)
+
+    @staticmethod
+    def team_detail(request, team_id):
+        return PageETags._etag(request, [f"team:{team_id}", "teams"])
+
+    @staticmethod
+    def competition_detail(request, competition_id):
+        return PageETags._etag(request, [f"competition:{competition_id}", "teams", "scores"])
+
+
+def conditional_page(etag_func):
+    """
+    condition(etag_func=...) for a django-bridge page, with the headers that make browsers
+    revalidate it on each navigation. django-bridge marks its responses no-store, so that the
+    JSON response is never shown in place of the HTML page; Vary: X-Requested-With keeps the
+    two apart instead.
+    """
+    def decorator(view):
+        conditional_view = condition(etag_func=etag_func)(view)
+
+        @wraps(view)
+        def wrapper(request, *args, **kwargs):
+            response = conditional_view(request, *args, **kwargs)
+            if response.has_header('ETag'):
+                response['Cache-Control'] = "private, no-cache"
+            patch_vary_headers(response, ('X-Requested-With',))
+            return response
+        return wrapper
+    return decorator
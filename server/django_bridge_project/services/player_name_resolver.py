@@ -0,0 +1,69 @@
+from django_bridge_project.enums.prediction_types import PredictionType
+from django_bridge_project.models import Player
+
+class PlayerNameResolver:
+    """
+    Resolves the player ids stored as strings in PLAYER-type answers and correct values.
+    Ids are collected first and fetched together with a single in_bulk query on first lookup;
+    players already in memory (e.g. prefetched rosters) can be primed to skip the query.
+    """
+
+    def __init__(self, player_ids=()):
+        self._players = {}
+        self._pending_ids = set()
+        self.add(*player_ids)
+
+    @staticmethod
+    def _parse_id(player_id):
+        try:
+            return int(player_id)
+        except (TypeError, ValueError):
+            return None
+
+    def add(self, *player_ids):
+        """Registers ids to fetch on the next lookup. Values that are not ids are ignored."""
+        for player_id in player_ids:
+            parsed_id = self._parse_id(player_id)
+            if parsed_id is not None and parsed_id not in self._players:
+                self._pending_ids.add(parsed_id)
+        return self
+
+    def add_from_predictions(self, predictions, answers=()):
+        """Registers the correct values of PLAYER predictions and the answers given to them."""
+        player_prediction_ids = {
+            prediction.id for prediction in predictions
+            if prediction.prediction_type == PredictionType.PLAYER.value
+        }
+        self.add(*(prediction.correct_value for prediction in predictions if prediction.id in player_prediction_ids))
+        self.add(*(answer.value for answer in answers if answer.prediction_id in player_prediction_ids))
+        return self
+
+    def prime(self, players):
+        """Makes already loaded players available without a query."""
+        for player in players:
+            self._players[player.id] = player
+            self._pending_ids.discard(player.id)
+        return self
+
+    def _load_pending(self):
+        if self._pending_ids:
+            found_players = Player.objects.in_bulk(list(self._pending_ids))
+            for player_id in self._pending_ids: # Unknown ids are remembered as None, so they are not fetched again
+                self._players[player_id] = found_players.get(player_id)
+            self._pending_ids.clear()
+
+    def get_player(self, player_id) -> Player | None:
+        parsed_id = self._parse_id(player_id)
+        if parsed_id is None:
+            return None
+        if parsed_id not in self._players:
+            self._pending_ids.add(parsed_id)
+            self._load_pending()
+        return self._players.get(parsed_id)
+
+    def get_display_name(self, player_id, default="Unknown Player") -> str:
+        """'First Last (Nickname)', or 'First Last' for players without a nickname."""
+        player = self.get_player(player_id)
+        if player is None:
+            return default
+        return f"{player.first_name} {player.last_name} ({player.nickname})" if player.nickname else f"{player.first_name} {player.last_name}"
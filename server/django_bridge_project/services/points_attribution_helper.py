@@ -1,6 +1,9 @@
 from django.db import transaction
+from django.db.models import Case, IntegerField, Q, Sum, Value, When
+from django.db.models.functions import Coalesce
 from django_bridge_project.models import Match, Bet, Answer, Prediction, Team, CustomUser
 from django_bridge_project.enums.prediction_types import PredictionType
+from django_bridge_project.services.points_ledger import PointsLedger
 
 class PointsAttributionHelper:
     def __init__(self, match_instance: Match):
@@ -67,58 +70,130 @@ class PointsAttributionHelper:
                     return 0 # Draw
             return 0 # Draw if winner not needed or draw scores not set
 
+    def _get_correct_answer_values(self, predictions):
+        """
+        Returns {prediction_id: [answer values scoring points]} for the match.
+        Correctness is evaluated once per distinct answer value with
+        calculate_points_for_prediction_answer, so the SQL side only has to match strings.
+        """
+        predictions_by_id = {prediction.id: prediction for prediction in predictions}
+        distinct_answers = Answer.objects.filter(bet__match=self.match_instance, prediction__in=predictions)\
+                                         .values_list('prediction_id', 'value')\
+                                         .distinct()
+
+        correct_values = {}
+        for prediction_id, value in distinct_answers:
+            prediction = predictions_by_id[prediction_id]
+            if PointsAttributionHelper.calculate_points_for_prediction_answer(str(value), prediction) > 0:
+                correct_values.setdefault(prediction_id, []).append(value)
+        return correct_values
+
+    def _get_winner_points_expression(self, actual_winner_id):
+        """SQL equivalent of calculate_points_for_match_winner for a Bet row."""
+        if actual_winner_id == 0: # A draw is predicted with an empty winner_team
+            predicted_correctly = Q(winner_team__isnull=True)
+        else:
+            predicted_correctly = Q(winner_team_id=actual_winner_id)
+        return Case(
+            When(predicted_correctly, then=Value(self.match_instance.score_points)),
+            default=Value(0),
+            output_field=IntegerField(),
+        )
+
+    def _get_answer_points_expression(self, predictions, correct_values):
+        """SQL sum of calculate_points_for_prediction_answer over the answers of a Bet row."""
+        whens = [
+            When(Q(answers__prediction_id=prediction.id, answers__value__in=correct_values[prediction.id]),
+                 then=Value(prediction.score_points))
+            for prediction in predictions if prediction.id in correct_values
+        ]
+        if not whens:
+            return Value(0, output_field=IntegerField())
+        return Coalesce(Sum(Case(*whens, default=Value(0), output_field=IntegerField())), 0)
+
+    def score_bets(self, predictions=None, correct_values=None):
+        """
+        Scores every bet of the match with a single aggregation query.
+        Returns a list of (bet_id, user_id, points) tuples.
+        """
+        actual_winner_id = self._determine_actual_winner_team_id()
+        if predictions is None:
+            predictions = list(self.match_instance.predictions.all())
+        if correct_values is None:
+            correct_values = self._get_correct_answer_values(predictions)
+
+        bets_points = Bet.objects.filter(match=self.match_instance)\
+                                 .values('id', 'user_id')\
+                                 .annotate(winner_points=self._get_winner_points_expression(actual_winner_id),
+                                           answer_points=self._get_answer_points_expression(predictions, correct_values))\
+                                 .order_by()
+        return [
+            (row['id'], row['user_id'], row['winner_points'] + row['answer_points'])
+            for row in bets_points
+        ]
+
+    def _store_awarded_points(self, predictions, correct_values, scored_bets):
+        """
+        Persists points_awarded on the answers and bets of the match, so pages showing
+        settled results read them instead of scoring again. One UPDATE per prediction
+        for answers and one per distinct total for bets.
+        """
+        Answer.objects.filter(prediction__in=predictions).update(points_awarded=0)
+        for prediction in predictions:
+            if prediction.id in correct_values:
+                Answer.objects.filter(prediction=prediction, value__in=correct_values[prediction.id])\
+                              .update(points_awarded=prediction.score_points)
+
+        bet_ids_by_points = {}
+        for bet_id, _user_id, points in scored_bets:
+            bet_ids_by_points.setdefault(points, []).append(bet_id)
+        for points, bet_ids in bet_ids_by_points.items():
+            for i in range(0, len(bet_ids), PointsLedger.BATCH_SIZE):
+                Bet.objects.filter(pk__in=bet_ids[i:i + PointsLedger.BATCH_SIZE]).update(points_awarded=points)
+
+    @transaction.atomic
+    def settle_bets(self, update_scores=True):
+        """
+        Scores the bets, stores points_awarded and writes the points ledger.
+        The ledger holds one entry per bettor; running this again only applies the difference.
+        Returns the scored (bet_id, user_id, points) tuples.
+        """
+        predictions = list(self.match_instance.predictions.all())
+        correct_values = self._get_correct_answer_values(predictions)
+        scored_bets = self.score_bets(predictions, correct_values)
+        self._store_awarded_points(predictions, correct_values, scored_bets)
+
+        points_by_user = {user_id: points for _bet_id, user_id, points in scored_bets}
+        PointsLedger.record_match_points(self.match_instance, points_by_user, update_scores=update_scores)
+        return scored_bets
+
+    @staticmethod
+    @transaction.atomic
+    def revoke_match_points(match_instance: Match):
+        """Takes back the points of a match that is no longer finished and clears points_awarded."""
+        Answer.objects.filter(prediction__match=match_instance).update(points_awarded=None)
+        Bet.objects.filter(match=match_instance).update(points_awarded=None)
+        return PointsLedger.revoke_match_points(match_instance)
+
     @transaction.atomic
     def process_match_bets_and_attribute_points(self):
-        """Processes all bets for the match and attributes points to users."""
+        """
+        Processes all bets for the match and attributes points to users.
+        Idempotent: the points ledger makes a second run a no-op for unchanged results.
+        """
         if not self.match_instance.is_finished:
             print(f"Match {self.match_instance.id} is not finished. Points will not be attributed.")
             return {"status": "error", "message": "Match not finished."}
 
-        bets = Bet.objects.filter(match=self.match_instance).select_related('user', 'winner_team').prefetch_related('answers__prediction')
-        
-        if not bets.exists():
+        scored_bets = self.settle_bets()
+        points_by_user = {user_id: points for _bet_id, user_id, points in scored_bets}
+
+        if not scored_bets:
             print(f"No bets found for match {self.match_instance.id}.")
             return {"status": "info", "message": "No bets to process."}
 
-        actual_winner_id = self._determine_actual_winner_team_id()
-        match_predictions = list(self.match_instance.predictions.all())
-        
-        processed_users = {} # To batch user score updates if needed, or just update one by one
-        total_points_awarded_for_match = 0
-
-        for bet in bets:
-            user_total_points_for_this_bet = 0 # Renamed for clarity within this loop
-            user = bet.user
-
-            # 1. Check predicted winner
-            predicted_winner_id = bet.winner_team_id if bet.winner_team else 0 # 0 for predicted draw
-            
-            # Use the new static method for match winner points
-            user_total_points_for_this_bet += PointsAttributionHelper.calculate_points_for_match_winner(
-                predicted_winner_id,
-                actual_winner_id,
-                self.match_instance.score_points
-            )
-
-            # 2. Check answers for each prediction
-            answers_map = {answer.prediction_id: answer for answer in bet.answers.all()}
-            for prediction in match_predictions:
-                user_answer = answers_map.get(prediction.id)
-                if user_answer:
-                    # Use the new static method
-                    points_for_this_answer = PointsAttributionHelper.calculate_points_for_prediction_answer(
-                        str(user_answer.value), # Ensure it's a string
-                        prediction
-                    )
-                    user_total_points_for_this_bet += points_for_this_answer
-            
-            if user_total_points_for_this_bet > 0:
-                user.score = (user.score or 0) + user_total_points_for_this_bet # Ensure user.score is not None
-                user.save(update_fields=['score'])
-                total_points_awarded_for_match += user_total_points_for_this_bet
-                if user.id not in processed_users:
-                    processed_users[user.id] = 0
-                processed_users[user.id] += user_total_points_for_this_bet
+        processed_users = {user_id: points for user_id, points in points_by_user.items() if points > 0}
+        total_points_awarded_for_match = sum(processed_users.values())
 
         print(f"Points attribution completed for match {self.match_instance.id}. Total points awarded: {total_points_awarded_for_match}")
         return {
@@ -126,4 +201,4 @@ class PointsAttributionHelper:
             "message": f"Points processed. {total_points_awarded_for_match} total points awarded.", 
             "users_updated_count": len(processed_users),
             "processed_users_points": processed_users
-        } 
\ No newline at end of file
+        } 
@@ -0,0 +1,104 @@
+from django.db import transaction
+from django.db.models import F, IntegerField, OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+from django_bridge_project.models import CustomUser, Match, PointsLedgerEntry
+from django_bridge_project.services.scoped_leaderboards import ScopedLeaderboards
+from django_bridge_project.services.version_stamps import VersionStamps
+
+class PointsLedger:
+    """
+    Writes the per-(user, match) points ledger and keeps CustomUser.score in sync with it.
+    Recording the same points twice, or revoking twice, leaves scores unchanged.
+    """
+    BATCH_SIZE = 1000 # Max rows per bulk statement / ids per IN (...) clause
+
+    @staticmethod
+    def _apply_score_deltas(deltas_by_user):
+        """
+        Adds deltas to user scores with one UPDATE ... SET score = score + delta per distinct delta.
+        The increment happens in the database, so concurrent settlements cannot lose updates.
+        """
+        users_by_delta = {}
+        for user_id, delta in deltas_by_user.items():
+            if delta:
+                users_by_delta.setdefault(delta, []).append(user_id)
+
+        for delta, user_ids in users_by_delta.items():
+            for i in range(0, len(user_ids), PointsLedger.BATCH_SIZE):
+                CustomUser.objects.filter(pk__in=user_ids[i:i + PointsLedger.BATCH_SIZE])\
+                                  .update(score=F('score') + delta)
+
+    @staticmethod
+    @transaction.atomic
+    def record_match_points(match: Match, points_by_user: dict, update_scores=True):
+        """
+        Makes the ledger entries of the match equal to points_by_user ({user_id: points})
+        and moves user scores and scoped leaderboards by the difference with what was recorded before.
+        Previous points are taken back from the scoped leaderboards recorded on their entries.
+        Returns the applied {user_id: delta}.
+        """
+        previous_entries = {
+            user_id: (points, scopes.split())
+            for user_id, points, scopes in PointsLedgerEntry.objects.filter(match=match).values_list('user_id', 'points', 'scopes')
+        }
+        scopes = ScopedLeaderboards.scopes_for_match(match)
+
+        removed_user_ids = [user_id for user_id in previous_entries if user_id not in points_by_user]
+        for i in range(0, len(removed_user_ids), PointsLedger.BATCH_SIZE):
+            PointsLedgerEntry.objects.filter(match=match, user_id__in=removed_user_ids[i:i + PointsLedger.BATCH_SIZE]).delete()
+
+        now = timezone.now()
+        changed_entries = [
+            PointsLedgerEntry(user_id=user_id, match=match, points=points, scopes=" ".join(scopes), updated_at=now)
+            for user_id, points in points_by_user.items()
+            if previous_entries.get(user_id) != (points, scopes)
+        ]
+        PointsLedgerEntry.objects.bulk_create(
+            changed_entries,
+            batch_size=PointsLedger.BATCH_SIZE,
+            update_conflicts=True,
+            unique_fields=['user', 'match'],
+            update_fields=['points', 'scopes', 'updated_at'],
+        )
+
+        deltas = {user_id: -points for user_id, (points, _scopes) in previous_entries.items() if user_id not in points_by_user}
+        for user_id, points in points_by_user.items():
+            deltas[user_id] = points - previous_entries.get(user_id, (0, []))[0]
+        deltas = {user_id: delta for user_id, delta in deltas.items() if delta}
+
+        # Points are taken back from the leaderboards they were added to, and added to the match's current ones
+        scope_deltas = {}
+        for user_id, (points, previous_scopes) in previous_entries.items():
+            for scope in previous_scopes:
+                scope_deltas.setdefault(scope, {})[user_id] = -points
+        for user_id, points in points_by_user.items():
+            for scope in scopes:
+                scope_deltas.setdefault(scope, {})
+                scope_deltas[scope][user_id] = scope_deltas[scope].get(user_id, 0) + points
+
+        if update_scores:
+            PointsLedger._apply_score_deltas(deltas)
+            ScopedLeaderboards.apply_deltas(scope_deltas)
+            if changed_entries or removed_user_ids:
+                VersionStamps.bump_on_commit("home", "scores") # The home page shows the global leaderboard
+        return deltas
+
+    @staticmethod
+    def revoke_match_points(match: Match):
+        """Deletes the ledger entries of the match and takes the points back from users."""
+        return PointsLedger.record_match_points(match, {})
+
+    @staticmethod
+    def rebuild_scores():
+        """Recomputes every CustomUser.score from the ledger in a single UPDATE statement."""
+        ledger_total = PointsLedgerEntry.objects.filter(user=OuterRef('pk'))\
+                                                .order_by()\
+                                                .values('user')\
+                                                .annotate(total=Sum('points'))\
+                                                .values('total')
+        updated = CustomUser.objects.update(
+            score=Coalesce(Subquery(ledger_total, output_field=IntegerField()), 0)
+        )
+        VersionStamps.bump_on_commit("home", "scores")
+        return updated
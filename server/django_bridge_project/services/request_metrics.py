@@ -0,0 +1,103 @@
+import threading
+import time
+from collections import deque
+
+class RequestMetrics:
+    """
+    Timings of a single request. Installed as a database execute wrapper, it counts and
+    times every query; other code adds serialization time or custom timings to it.
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.query_count = 0
+        self.sql_seconds = 0.0
+        self.serialization_seconds = 0.0
+        self.extra_timings = [] # [(name, seconds or None, description)]
+
+    @staticmethod
+    def for_request(request):
+        """The metrics of the request, or None when RequestMetricsMiddleware is not installed."""
+        return getattr(request, '_request_metrics', None)
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.query_count += 1
+            self.sql_seconds += time.perf_counter() - started
+
+    def add_timing(self, name, seconds=None, description=""):
+        """Adds an entry to the Server-Timing header, e.g. a cache hit or miss."""
+        self.extra_timings.append((name, seconds, description))
+
+    def server_timing(self, total_seconds):
+        entries = [
+            ("sql", self.sql_seconds, f"{self.query_count} queries"),
+            ("ser", self.serialization_seconds, "serialization"),
+            *self.extra_timings,
+            ("total", total_seconds, ""),
+        ]
+        parts = []
+        for name, seconds, description in entries:
+            part = name
+            if seconds is not None:
+                part += f";dur={seconds * 1000:.2f}"
+            if description:
+                part += f';desc="{description}"'
+            parts.append(part)
+        return ", ".join(parts)
+
+
+class RequestMetricsHistogram:
+    """
+    Process-wide rolling window of the latest requests of each view, summarised on demand
+    as latency buckets and percentiles. Each worker process keeps its own window.
+    """
+    WINDOW_SIZE = 1000 # Requests kept per view
+    BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500)
+
+    _samples = {} # view name -> deque of (total_ms, sql_ms, serialization_ms, query_count)
+    _lock = threading.Lock()
+
+    @classmethod
+    def record(cls, view_name, metrics: RequestMetrics, total_seconds):
+        sample = (total_seconds * 1000, metrics.sql_seconds * 1000, metrics.serialization_seconds * 1000, metrics.query_count)
+        with cls._lock:
+            cls._samples.setdefault(view_name, deque(maxlen=cls.WINDOW_SIZE)).append(sample)
+
+    @staticmethod
+    def _percentile(sorted_values, fraction):
+        return sorted_values[min(int(len(sorted_values) * fraction), len(sorted_values) - 1)]
+
+    @classmethod
+    def _summarise(cls, samples):
+        totals = sorted(sample[0] for sample in samples)
+        buckets = {f"le_{bound}ms": sum(1 for total in totals if total <= bound) for bound in cls.BUCKETS_MS}
+        buckets["le_inf"] = len(totals)
+        return {
+            "count": len(samples),
+            "total_ms": {
+                "p50": round(cls._percentile(totals, 0.50), 2),
+                "p90": round(cls._percentile(totals, 0.90), 2),
+                "p99": round(cls._percentile(totals, 0.99), 2),
+                "max": round(totals[-1], 2),
+            },
+            "sql_ms_mean": round(sum(sample[1] for sample in samples) / len(samples), 2),
+            "serialization_ms_mean": round(sum(sample[2] for sample in samples) / len(samples), 2),
+            "queries_mean": round(sum(sample[3] for sample in samples) / len(samples), 2),
+            "queries_max": max(sample[3] for sample in samples),
+            "histogram": buckets, # Cumulative counts, Prometheus style
+        }
+
+    @classmethod
+    def snapshot(cls):
+        with cls._lock:
+            samples_by_view = {view_name: list(samples) for view_name, samples in cls._samples.items()}
+        return {view_name: cls._summarise(samples) for view_name, samples in sorted(samples_by_view.items()) if samples}
+
+    @classmethod
+    def reset(cls):
+        with cls._lock:
+            cls._samples.clear()
@@ -0,0 +1,97 @@
+import re
+from datetime import datetime
+
+from django.db import transaction
+from django.db.models import F, Sum
+from django.utils import timezone
+from django_bridge_project.models import LeaderboardEntry, Match, PointsLedgerEntry
+from django_bridge_project.services.leaderboard_service import Leaderboard
+
+class ScopedLeaderboards:
+    """
+    Competition, weekly and monthly leaderboards stored as LeaderboardEntry rows.
+    Settlement moves them by the same deltas as CustomUser.score, so serving one is a
+    keyset read on the (scope, -points, user) index, never an aggregation over bets.
+    """
+    BATCH_SIZE = 1000
+    SCOPE_PATTERN = re.compile(r'^(competition:\d+|week:\d{4}-W\d{2}|month:\d{4}-\d{2})$')
+
+    @staticmethod
+    def competition_scope(competition_id: int) -> str:
+        return f"competition:{competition_id}"
+
+    @staticmethod
+    def week_scope(moment: datetime) -> str:
+        iso_year, iso_week, _weekday = timezone.localtime(moment).isocalendar()
+        return f"week:{iso_year}-W{iso_week:02d}"
+
+    @staticmethod
+    def month_scope(moment: datetime) -> str:
+        local_moment = timezone.localtime(moment)
+        return f"month:{local_moment.year}-{local_moment.month:02d}"
+
+    @staticmethod
+    def scopes_for_match(match: Match) -> list[str]:
+        """The leaderboards a match's points count towards. Periods follow the kickoff time."""
+        return [
+            ScopedLeaderboards.competition_scope(match.competition_id),
+            ScopedLeaderboards.week_scope(match.start_datetime),
+            ScopedLeaderboards.month_scope(match.start_datetime),
+        ]
+
+    @staticmethod
+    def is_valid_scope(scope: str) -> bool:
+        return bool(scope and ScopedLeaderboards.SCOPE_PATTERN.match(scope))
+
+    @staticmethod
+    def get_leaderboard(scope: str) -> Leaderboard:
+        return Leaderboard(
+            LeaderboardEntry.objects.filter(scope=scope),
+            score_field='points',
+            tiebreak_field='user_id',
+            user_id_field='user_id',
+            username_field='user__username',
+        )
+
+    @staticmethod
+    def apply_deltas(deltas_by_scope: dict):
+        """
+        Adds {scope: {user_id: delta}} to the leaderboards. Entries that drop to 0 points
+        are deleted, so users whose points were all taken back leave the board.
+        """
+        users_by_delta = {} # (delta, scope) -> [user_id, ...]
+        for scope, deltas_by_user in deltas_by_scope.items():
+            for user_id, delta in deltas_by_user.items():
+                if delta:
+                    users_by_delta.setdefault((delta, scope), []).append(user_id)
+        if not users_by_delta:
+            return
+
+        LeaderboardEntry.objects.bulk_create(
+            [LeaderboardEntry(scope=scope, user_id=user_id) for (_delta, scope), user_ids in users_by_delta.items() for user_id in user_ids],
+            batch_size=ScopedLeaderboards.BATCH_SIZE,
+            ignore_conflicts=True,
+        )
+        for (delta, scope), user_ids in users_by_delta.items():
+            for i in range(0, len(user_ids), ScopedLeaderboards.BATCH_SIZE):
+                entries = LeaderboardEntry.objects.filter(scope=scope, user_id__in=user_ids[i:i + ScopedLeaderboards.BATCH_SIZE])
+                entries.update(points=F('points') + delta)
+                if delta < 0:
+                    entries.filter(points=0).delete()
+
+    @staticmethod
+    @transaction.atomic
+    def rebuild():
+        """Recreates every scoped leaderboard from the points ledger and the scopes it recorded."""
+        LeaderboardEntry.objects.all().delete()
+        points = {} # (scope, user_id) -> points
+        ledger_totals = PointsLedgerEntry.objects.order_by().values('user_id', 'scopes').annotate(total=Sum('points'))
+        for row in ledger_totals:
+            for scope in row['scopes'].split():
+                points[(scope, row['user_id'])] = points.get((scope, row['user_id']), 0) + row['total']
+
+        LeaderboardEntry.objects.bulk_create(
+            [LeaderboardEntry(scope=scope, user_id=user_id, points=total) for (scope, user_id), total in points.items() if total],
+            batch_size=ScopedLeaderboards.BATCH_SIZE,
+        )
+        return sum(1 for total in points.values() if total)
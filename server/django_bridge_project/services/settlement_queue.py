@@ -0,0 +1,113 @@
+import time
+import traceback
+from datetime import timedelta
+
+from django.db import transaction
+from django.utils import timezone
+
+from django_bridge_project.enums.settlement_job_status import SettlementJobStatus
+from django_bridge_project.models import Match, SettlementJob
+from django_bridge_project.services.points_attribution_helper import PointsAttributionHelper
+from django_bridge_project.services.version_stamps import VersionStamps
+
+class SettlementQueue:
+    """
+    Durable queue of match settlements backed by the SettlementJob table.
+    The match post_save signal only enqueues; settle_worker processes the jobs.
+    """
+    MAX_ATTEMPTS = 5
+    RETRY_BACKOFF_SECONDS = 30 # Multiplied by the number of attempts already made
+    STALE_AFTER_SECONDS = 15 * 60 # A running job older than this is assumed to belong to a dead worker
+
+    @staticmethod
+    def enqueue(match: Match) -> SettlementJob:
+        """Creates a pending job for the match unless one is already waiting."""
+        pending_job = SettlementJob.objects.filter(match=match, status=SettlementJobStatus.PENDING.value).first()
+        if pending_job:
+            return pending_job
+        return SettlementJob.objects.create(match=match)
+
+    @staticmethod
+    def enqueue_unsettled() -> int:
+        """
+        Queues every finished match whose points were never calculated, e.g. matches written with
+        bulk_create or a queryset update, which skip the post_save signal. Returns the number of matches.
+        """
+        matches = Match.objects.filter(is_finished=True, points_calculation_done=False).order_by('start_datetime').only('id')
+        count = 0
+        for match in matches.iterator():
+            SettlementQueue.enqueue(match)
+            count += 1
+        return count
+
+    @staticmethod
+    def claim_next() -> SettlementJob | None:
+        """
+        Claims the oldest available job with SELECT ... FOR UPDATE SKIP LOCKED,
+        so several workers can poll the table without picking the same job.
+        """
+        now = timezone.now()
+        stale_before = now - timedelta(seconds=SettlementQueue.STALE_AFTER_SECONDS)
+        with transaction.atomic():
+            job = SettlementJob.objects.select_for_update(skip_locked=True)\
+                                       .filter(status=SettlementJobStatus.PENDING.value, available_at__lte=now)\
+                                       .order_by('available_at', 'id')\
+                                       .first()
+            if job is None:
+                job = SettlementJob.objects.select_for_update(skip_locked=True)\
+                                           .filter(status=SettlementJobStatus.RUNNING.value, started_at__lt=stale_before)\
+                                           .order_by('started_at', 'id')\
+                                           .first()
+            if job is None:
+                return None
+
+            job.status = SettlementJobStatus.RUNNING.value
+            job.attempts += 1
+            job.started_at = now
+            job.finished_at = None
+            job.save(update_fields=['status', 'attempts', 'started_at', 'finished_at'])
+        return job
+
+    @staticmethod
+    def _settle_match(match_id: int) -> str:
+        """
+        Brings the points of the match in line with its current state, with the match row locked:
+        a finished match is (re-)settled, an unfinished one has its points taken back.
+        Both operations are idempotent thanks to the points ledger.
+        """
+        with transaction.atomic():
+            match = Match.objects.select_for_update().get(pk=match_id)
+            # The match page shows the settlement state, the leaderboard and the points of each bet
+            VersionStamps.bump_on_commit(f"match:{match_id}")
+            if not match.is_finished:
+                deltas = PointsAttributionHelper.revoke_match_points(match)
+                # Queryset updates: saving the instance would send post_save and enqueue a new job.
+                Match.objects.filter(pk=match_id).update(points_calculation_done=False)
+                return f"Match is not finished. Points taken back from {len(deltas)} user(s)."
+
+            result = PointsAttributionHelper(match_instance=match).process_match_bets_and_attribute_points()
+            if result.get("status") not in ("success", "info"):
+                raise RuntimeError(result.get("message", "Points attribution failed."))
+
+            Match.objects.filter(pk=match_id).update(points_calculation_done=True)
+            return result.get("message", "")
+
+    @staticmethod
+    def run(job: SettlementJob) -> SettlementJob:
+        """Processes a claimed job and records its outcome, scheduling a retry on failure."""
+        started = time.perf_counter()
+        try:
+            job.result_message = SettlementQueue._settle_match(job.match_id)
+            job.status = SettlementJobStatus.DONE.value
+        except Exception:
+            job.result_message = traceback.format_exc()
+            if job.attempts >= SettlementQueue.MAX_ATTEMPTS:
+                job.status = SettlementJobStatus.FAILED.value
+            else:
+                job.status = SettlementJobStatus.PENDING.value
+                job.available_at = timezone.now() + timedelta(seconds=SettlementQueue.RETRY_BACKOFF_SECONDS * job.attempts)
+
+        job.finished_at = timezone.now()
+        job.duration_seconds = time.perf_counter() - started
+        job.save(update_fields=['status', 'available_at', 'finished_at', 'duration_seconds', 'result_message'])
+        return job
@@ -0,0 +1,65 @@
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+class VersionStamps:
+    """
+    Named version counters kept in the Django cache. Cached data embeds the stamps it was
+    built from in its key, so bumping a stamp invalidates every entry derived from it
+    without having to know or delete those entries.
+
+    Stamps start from a time-based value, so a cache flush never brings an old key back.
+    They are only coherent with a cache backend shared by all processes (redis, memcached,
+    database, file): with locmem each gunicorn worker and the settle worker only see their
+    own bumps. is_shared() tells which, and the django_bridge_project.W001 check warns
+    about a process-local cache outside of DEBUG.
+    """
+    KEY_PREFIX = "version:"
+    PROCESS_LOCAL_BACKENDS = (
+        "django.core.cache.backends.locmem.LocMemCache",
+        "django.core.cache.backends.dummy.DummyCache",
+    )
+
+    @staticmethod
+    def is_shared() -> bool:
+        """True when every process sees the same stamps, i.e. the default cache is not process-local."""
+        return settings.CACHES["default"]["BACKEND"] not in VersionStamps.PROCESS_LOCAL_BACKENDS
+
+    @staticmethod
+    def _key(name: str) -> str:
+        return f"{VersionStamps.KEY_PREFIX}{name}"
+
+    @staticmethod
+    def get_many(names) -> dict:
+        """Returns {name: stamp}, initialising the stamps that do not exist yet."""
+        keys = {VersionStamps._key(name): name for name in names}
+        found = cache.get_many(list(keys))
+        stamps = {keys[key]: value for key, value in found.items()}
+        for key, name in keys.items():
+            if name not in stamps:
+                cache.add(key, time.time_ns(), timeout=None)
+                stamps[name] = cache.get(key)
+        return stamps
+
+    @staticmethod
+    def get(name: str) -> int:
+        return VersionStamps.get_many([name])[name]
+
+    @staticmethod
+    def bump(*names):
+        for name in names:
+            key = VersionStamps._key(name)
+            try:
+                cache.incr(key)
+            except ValueError: # Not set yet (or evicted): any fresh value differs from the old ones
+                cache.set(key, time.time_ns(), timeout=None)
+
+    @staticmethod
+    def bump_on_commit(*names):
+        """
+        Bumps once the current transaction commits (immediately outside of one), so a
+        concurrent request cannot cache data the transaction has not made visible yet.
+        """
+        transaction.on_commit(lambda: VersionStamps.bump(*names))
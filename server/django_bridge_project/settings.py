@@ -42,7 +42,11 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
+    # Outermost after security, so session and authentication queries are counted too
+    "django_bridge_project.middleware.request_metrics_middleware.RequestMetricsMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
+    # Needs the session; everything after it reads from the replica when the request allows it
+    "django_bridge_project.middleware.replica_routing_middleware.ReplicaRoutingMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
@@ -52,6 +56,21 @@ MIDDLEWARE = [
     "django_bridge.middleware.DjangoBridgeMiddleware",
 ]
 
+# Request metrics (RequestMetricsMiddleware)
+# Maximum queries per view name. A view over budget prints a warning, or raises QueryBudgetExceeded
+# when DJANGO_QUERY_BUDGETS_STRICT=true (use it when running tests or benchmarks).
+VIEW_QUERY_BUDGETS = {
+    "home": 8,
+    "match_detail": 14,
+    "team_detail": 8,
+    "competition_detail": 10,
+    "leaderboard": 8,
+    "bet_slip": 16,
+}
+VIEW_QUERY_BUDGETS_STRICT = os.environ.get("DJANGO_QUERY_BUDGETS_STRICT", "false") == "true"
+# Server-Timing tells clients the query count and timings of each request: off in production unless asked for
+SERVER_TIMING_HEADER = os.environ.get("DJANGO_SERVER_TIMING_HEADER", "true" if DEBUG else "false") == "true"
+
 ROOT_URLCONF = "django_bridge_project.urls"
 
 TEMPLATES = [
@@ -78,7 +97,57 @@ WSGI_APPLICATION = "django_bridge_project.wsgi.application"
 # Database
 # https://docs.djangoproject.com/en/5.0/ref/settings/#databases
 
-DATABASES = {"default": dj_database_url.config(default="sqlite:///db.sqlite3")}
+# Connections are kept open for DJANGO_CONN_MAX_AGE seconds and checked before reuse, so a request
+# does not pay for a new PostgreSQL connection. With DJANGO_DB_POOL=true, each worker process uses a
+# psycopg3 connection pool instead (needs psycopg[pool]); size it so that
+# worker processes x DJANGO_DB_POOL_MAX_SIZE stays below the server's max_connections.
+DB_CONN_MAX_AGE = int(os.environ.get("DJANGO_CONN_MAX_AGE", "60"))
+DB_POOL = os.environ.get("DJANGO_DB_POOL", "false") == "true"
+DB_POOL_OPTIONS = {
+    "min_size": int(os.environ.get("DJANGO_DB_POOL_MIN_SIZE", "2")),
+    "max_size": int(os.environ.get("DJANGO_DB_POOL_MAX_SIZE", "4")),
+    "timeout": float(os.environ.get("DJANGO_DB_POOL_TIMEOUT", "10")), # Seconds to wait for a free connection
+}
+
+
+def database_config(url):
+    config = dj_database_url.parse(url, conn_max_age=DB_CONN_MAX_AGE, conn_health_checks=True)
+    if DB_POOL and config["ENGINE"] == "django.db.backends.postgresql":
+        # The pool replaces persistent connections, Django refuses both at once
+        config["CONN_MAX_AGE"] = 0
+        config.setdefault("OPTIONS", {})["pool"] = DB_POOL_OPTIONS
+    return config
+
+
+DATABASES = {"default": database_config(os.environ.get("DATABASE_URL", "sqlite:///db.sqlite3"))}
+
+# Optional read replica. GET requests read from it (see ReplicaRouter), except for sessions that
+# wrote in the last REPLICA_PIN_SECONDS, which keep reading from the primary.
+# Locally, two SQLite files work: DATABASE_REPLICA_URL=sqlite:///replica.sqlite3, a copy of db.sqlite3.
+if os.environ.get("DATABASE_REPLICA_URL"):
+    DATABASES["replica"] = database_config(os.environ["DATABASE_REPLICA_URL"])
+    DATABASES["replica"]["TEST"] = {"MIRROR": "default"}
+
+DATABASE_ROUTERS = ["django_bridge_project.db_routers.ReplicaRouter"]
+REPLICA_PIN_SECONDS = int(os.environ.get("DJANGO_REPLICA_PIN_SECONDS", "10"))
+
+
+# Cache
+# https://docs.djangoproject.com/en/5.0/topics/cache/
+# Local memory by default, which is only coherent with a single process (see VersionStamps). Deployments
+# with several gunicorn workers and the settle worker must share it, e.g.
+# django.core.cache.backends.redis.RedisCache with DJANGO_CACHE_LOCATION=redis://redis:6379/0 (docker-compose), or
+# django.core.cache.backends.db.DatabaseCache with DJANGO_CACHE_LOCATION=django_cache (run createcachetable).
+
+CACHES = {
+    "default": {
+        "BACKEND": os.environ.get("DJANGO_CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"),
+        "LOCATION": os.environ.get("DJANGO_CACHE_LOCATION", ""),
+    }
+}
+
+# Seconds a match page cached for anonymous visitors (AnonymousPageCache) stays fresh. 0 disables the cache.
+ANONYMOUS_PAGE_CACHE_SECONDS = int(os.environ.get("DJANGO_ANONYMOUS_PAGE_CACHE_SECONDS", "5"))
 
 
 # Password validation
@@ -125,6 +194,16 @@ if os.environ.get("VITE_BUNDLE_DIR"):
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
 
+# Uploads are named after their content; collected static files carry a content hash and a .gz copy
+STORAGES = {
+    "default": {"BACKEND": "django_bridge_project.storage.content_addressed_storage.ContentAddressedStorage"},
+    "staticfiles": {"BACKEND": "django_bridge_project.storage.compressed_static_storage.CompressedManifestStaticFilesStorage"},
+}
+
+# Serve media and static files from Django with far-future cache headers. On by default with DEBUG only:
+# in production a web server or a CDN should serve MEDIA_ROOT and STATIC_ROOT, unless DJANGO_SERVE_FILES=true.
+SERVE_FILES = os.environ.get("DJANGO_SERVE_FILES", "true" if DEBUG else "false") == "true"
+
 
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.0/ref/settings/#default-auto-field
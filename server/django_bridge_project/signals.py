@@ -1,15 +1,101 @@
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import receiver
-from .models import Match
-# Correct the import path for PointsAttributionHelper
-from .services.points_attribution_helper import PointsAttributionHelper 
+from .models import Bet, Competition, CustomUser, Match, Player, Prediction, Team
+from .services.image_variants import ImageVariants
+from .services.settlement_queue import SettlementQueue
+from .services.version_stamps import VersionStamps
+
+@receiver(post_save, sender=Match)
+@receiver(post_delete, sender=Match)
+@receiver(post_save, sender=Team)
+@receiver(post_delete, sender=Team)
+@receiver(post_save, sender=Competition)
+@receiver(post_delete, sender=Competition)
+def invalidate_home_page_cache(sender, **kwargs):
+    """Matches, teams and competitions are all shown on the home page."""
+    VersionStamps.bump_on_commit("home")
+
+@receiver(post_save, sender=CustomUser)
+@receiver(post_delete, sender=CustomUser)
+def invalidate_global_ranks(sender, created=False, **kwargs):
+    """New and deleted users move the stored ranks of the users below them (see GlobalRanks)."""
+    if created or kwargs['signal'] is post_delete:
+        VersionStamps.bump_on_commit("users")
+
+@receiver(post_save, sender=Competition)
+@receiver(post_delete, sender=Competition)
+@receiver(post_save, sender=Match)
+@receiver(post_delete, sender=Match)
+def invalidate_competition_version(sender, instance, **kwargs):
+    """A competition page lists the competition's matches."""
+    competition_id = instance.id if sender is Competition else instance.competition_id
+    VersionStamps.bump_on_commit(f"competition:{competition_id}")
+
+@receiver(post_save, sender=Team)
+@receiver(post_delete, sender=Team)
+def invalidate_teams_version(sender, **kwargs):
+    """Team names and logos appear in every match list."""
+    VersionStamps.bump_on_commit("teams")
+
+@receiver(post_save, sender=Match)
+@receiver(post_delete, sender=Match)
+@receiver(post_save, sender=Prediction)
+@receiver(post_delete, sender=Prediction)
+def invalidate_match_version(sender, instance, **kwargs):
+    """The cached bet form of a match is built from the match and its predictions."""
+    match_id = instance.id if sender is Match else instance.match_id
+    VersionStamps.bump_on_commit(f"match:{match_id}")
+
+@receiver(post_save, sender=Bet)
+@receiver(post_delete, sender=Bet)
+def invalidate_user_bets_version(sender, instance, **kwargs):
+    """Bets edited outside BetPlacement (which bumps the stamp itself), e.g. in the admin."""
+    VersionStamps.bump_on_commit(f"bets:user:{instance.user_id}")
+
+@receiver(pre_save, sender=Player)
+def remember_previous_player_team(sender, instance, **kwargs):
+    """A player moved to another team must also leave the old team's cached forms."""
+    instance._previous_team_id = None
+    if instance.pk:
+        instance._previous_team_id = Player.objects.filter(pk=instance.pk).values_list('team_id', flat=True).first()
+
+@receiver(post_save, sender=Team)
+@receiver(post_delete, sender=Team)
+@receiver(post_save, sender=Player)
+@receiver(post_delete, sender=Player)
+@receiver(post_save, sender=Match)
+@receiver(post_delete, sender=Match)
+def invalidate_team_version(sender, instance, **kwargs):
+    """Team names and rosters are the choices of the cached bet forms, and team pages list their matches."""
+    if sender is Team:
+        team_ids = {instance.id}
+    elif sender is Match:
+        team_ids = {instance.team_one_id, instance.team_two_id}
+    else:
+        team_ids = {instance.team_id, getattr(instance, '_previous_team_id', None)}
+    VersionStamps.bump_on_commit(*(f"team:{team_id}" for team_id in team_ids if team_id))
+
+@receiver(post_save, sender=Team)
+@receiver(post_save, sender=Competition)
+@receiver(post_save, sender=Player)
+def generate_image_variants(sender, instance, **kwargs):
+    """Uploaded logos and photos get their resized variants in the background."""
+    if sender is Team:
+        field_file, stamps = instance.logo, ("home", "teams", f"team:{instance.id}")
+    elif sender is Competition:
+        field_file, stamps = instance.logo, ("home", f"competition:{instance.id}")
+    else:
+        field_file, stamps = instance.photo, (f"team:{instance.team_id}",)
+    if field_file and not ImageVariants.is_available(field_file):
+        ImageVariants.schedule(field_file, stamps)
 
 @receiver(post_save, sender=Match)
 def attribute_points_on_match_finish(sender, instance, created, update_fields, **kwargs):
     """
     Listens for a Match instance to be saved. If the match is marked as finished
-    AND points have not yet been calculated, it processes bets and attributes points.
+    AND points have not yet been calculated, it enqueues a settlement job for the settle_worker.
     Ensures this runs only when is_finished transitions to True or on creation as finished.
+    A match reverted to not finished is queued as well, so that its points are taken back.
     """
     
     process_points = False
@@ -23,15 +109,8 @@ def attribute_points_on_match_finish(sender, instance, created, update_fields, *
                 process_points = True
 
     if process_points:
-        print(f"Match {instance.id} is finished and points not calculated. Triggering points attribution. Created: {created}, Update_fields: {update_fields}")
-        helper = PointsAttributionHelper(match_instance=instance)
-        result = helper.process_match_bets_and_attribute_points()
-        print(f"Points attribution result for Match {instance.id}: {result}")
-        
-        if result.get("status") == "success" or result.get("status") == "info":
-            instance.points_calculation_done = True
-            instance.save(update_fields=['points_calculation_done'])
-            print(f"Match {instance.id} marked as points_calculation_done=True.")
+        job = SettlementQueue.enqueue(instance)
+        print(f"Match {instance.id} is finished and points not calculated. Settlement job {job.id} queued. Created: {created}, Update_fields: {update_fields}")
     
     # Logic to reset points_calculation_done if match is reverted to not finished
     elif not instance.is_finished and instance.points_calculation_done:
@@ -43,6 +122,8 @@ def attribute_points_on_match_finish(sender, instance, created, update_fields, *
                 reset_flag = True
         
         if reset_flag:
-            print(f"Match {instance.id} was marked as not finished, resetting points_calculation_done flag. Update_fields: {update_fields}")
+            job = SettlementQueue.enqueue(instance) # The worker takes the points back
+            print(f"Match {instance.id} was marked as not finished, resetting points_calculation_done flag. Settlement job {job.id} queued. Update_fields: {update_fields}")
             instance.points_calculation_done = False
-            instance.save(update_fields=['points_calculation_done']) 
\ No newline at end of file
+            # Queryset update: instance.save() would re-enter this signal.
+            Match.objects.filter(pk=instance.pk).update(points_calculation_done=False) 
\ No newline at end of file
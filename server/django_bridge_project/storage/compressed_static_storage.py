@@ -0,0 +1,64 @@
+import gzip
+import os
+
+from django.contrib.staticfiles.storage import ManifestStaticFilesStorage
+
+class CompressedManifestStaticFilesStorage(ManifestStaticFilesStorage):
+    """
+    Manifest storage (file names carry a hash of their content) that also writes a .gz next to
+    every text file during collectstatic, for FileServingController to send to gzip clients.
+    Files missing from the manifest keep their plain URL instead of raising, so pages still
+    render when collectstatic has not run. Likewise a CSS url() pointing to a missing file is
+    left as is, with a warning, instead of failing collectstatic.
+    """
+    manifest_strict = False
+    COMPRESSIBLE_EXTENSIONS = ('.css', '.js', '.mjs', '.json', '.map', '.svg', '.txt', '.html', '.xml')
+    MIN_COMPRESS_SIZE = 256 # Bytes. Smaller files do not shrink enough to be worth it
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._missing_references = set()
+
+    def stored_name(self, name):
+        try:
+            return super().stored_name(name)
+        except ValueError: # Not collected
+            return name
+
+    def url_converter(self, name, hashed_files, template=None):
+        convert = super().url_converter(name, hashed_files, template)
+
+        def convert_or_keep(matchobj):
+            try:
+                return convert(matchobj)
+            except ValueError: # The referenced file does not exist
+                if (name, matchobj['url']) not in self._missing_references: # post_process makes several passes
+                    self._missing_references.add((name, matchobj['url']))
+                    print(f"Warning: {name} references {matchobj['url']}, which was not found. Its URL is left unhashed.")
+                return matchobj['matched']
+        return convert_or_keep
+
+    def post_process(self, paths, dry_run=False, **options):
+        processed_names = set()
+        for original_name, processed_name, processed in super().post_process(paths, dry_run, **options):
+            if processed_name:
+                processed_names.update((original_name, processed_name))
+            yield original_name, processed_name, processed
+        if not dry_run:
+            for name in sorted(processed_names):
+                self._write_compressed(name)
+
+    def _write_compressed(self, name):
+        if not name.endswith(self.COMPRESSIBLE_EXTENSIONS):
+            return
+        path = self.path(name)
+        with open(path, 'rb') as original:
+            content = original.read()
+        if len(content) < self.MIN_COMPRESS_SIZE:
+            return
+        compressed = gzip.compress(content, compresslevel=9, mtime=0)
+        if len(compressed) < len(content):
+            with open(f"{path}.gz", 'wb') as compressed_file:
+                compressed_file.write(compressed)
+        elif os.path.exists(f"{path}.gz"): # Stale from a previous collectstatic
+            os.remove(f"{path}.gz")
@@ -0,0 +1,49 @@
+import hashlib
+import os
+import posixpath
+import re
+
+from django.core.files import File
+from django.core.files.storage import FileSystemStorage
+
+class ContentAddressedStorage(FileSystemStorage):
+    """
+    Local file storage naming uploads after their content: team_logos/club.png is stored as
+    team_logos/<sha256 prefix>.png. Identical uploads share one file, and a stored file never
+    changes, so it can be served with an immutable Cache-Control header (FileServingController).
+    """
+    HASH_LENGTH = 32 # Hex characters of the SHA-256 digest kept in the name
+    CHUNK_SIZE = 64 * 1024
+    # A content hash, optionally followed by the suffix of a derived file such as an image variant
+    CONTENT_NAME_PATTERN = re.compile(rf"[0-9a-f]{{{HASH_LENGTH}}}(_[0-9a-z]+)?")
+
+    def content_name(self, name, content):
+        hasher = hashlib.sha256()
+        content.seek(0)
+        for chunk in content.chunks(self.CHUNK_SIZE):
+            hasher.update(chunk)
+        content.seek(0)
+        directory, filename = posixpath.split(name)
+        extension = os.path.splitext(filename)[1].lower()
+        return posixpath.join(directory, f"{hasher.hexdigest()[:self.HASH_LENGTH]}{extension}")
+
+    def save(self, name, content, max_length=None):
+        if name is None:
+            name = content.name
+        if not hasattr(content, "chunks"):
+            content = File(content, name)
+        name = self.content_name(name, content)
+        if self.exists(name): # Same content already stored
+            return name
+        return super().save(name, content, max_length=max_length)
+
+    def save_derived(self, name, content):
+        """Stores a file derived from a stored one (e.g. an image variant) under the given name, replacing it."""
+        if self.exists(name):
+            self.delete(name)
+        return super().save(name, content)
+
+    @classmethod
+    def is_content_addressed(cls, name):
+        stem = os.path.splitext(posixpath.basename(name))[0]
+        return cls.CONTENT_NAME_PATTERN.fullmatch(stem) is not None
@@ -0,0 +1,233 @@
+import json
+import re
+import shutil
+import tempfile
+from datetime import date, timedelta
+from io import StringIO
+
+from django.conf import settings
+from django.contrib.messages import constants as message_constants
+from django.contrib.messages.storage.base import Message
+from django.contrib.messages.storage.cookie import CookieStorage
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import Client, RequestFactory, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from django_bridge_project.enums.prediction_types import PredictionType
+from django_bridge_project.models import Answer, Bet, Competition, CustomUser, Match, Player, Prediction, Team
+from django_bridge_project.services.version_stamps import VersionStamps
+
+class MatchDetailQueryCountTests(TestCase):
+    """
+    The match page runs a fixed number of queries whatever the size of the rosters, the
+    predictions and the bets: growing them must not add a single query (N+1 regressions).
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        competition = Competition.objects.create(name="League", start_date=date(2025, 1, 1), end_date=date(2099, 12, 31))
+        cls.team_one = Team.objects.create(name="Home")
+        cls.team_two = Team.objects.create(name="Away")
+        cls.open_match = Match.objects.create(competition=competition, team_one=cls.team_one, team_two=cls.team_two,
+                                              start_datetime=timezone.now() + timedelta(days=1))
+        cls.settled_match = Match.objects.create(competition=competition, team_one=cls.team_one, team_two=cls.team_two,
+                                                 start_datetime=timezone.now() - timedelta(days=1),
+                                                 is_finished=True, points_calculation_done=True)
+        cls.user = CustomUser.objects.create_user(username="viewer", password="unused")
+        cls._grow(1)
+
+    @classmethod
+    def _grow(cls, size):
+        """Adds `size` players per team, predictions of each type per match and settled bets."""
+        start = Player.objects.count()
+        for team in (cls.team_one, cls.team_two):
+            Player.objects.bulk_create(Player(team=team, first_name="Player", last_name=str(start + i)) for i in range(size))
+        for match in (cls.open_match, cls.settled_match):
+            for prediction_type in PredictionType:
+                for i in range(size):
+                    Prediction.objects.create(match=match, label=f"{prediction_type.value} {start + i}",
+                                              prediction_type=prediction_type.value)
+        bettors = [CustomUser.objects.create_user(username=f"bettor{start + i}", password="unused") for i in range(size)]
+        if not Bet.objects.filter(match=cls.settled_match, user=cls.user).exists():
+            bettors.append(cls.user) # The viewer's own bet, shown with its answers
+        for bettor in bettors:
+            bet = Bet.objects.create(match=cls.settled_match, user=bettor, winner_team=cls.team_one, points_awarded=10)
+            Answer.objects.bulk_create(Answer(bet=bet, prediction=prediction, value="1", points_awarded=0)
+                                       for prediction in cls.settled_match.predictions.all())
+
+    def _query_count(self, match):
+        cache.clear() # Cached payloads, stamps and form classes would hide queries
+        self.client.force_login(self.user)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('match_detail', kwargs={'match_id': match.id}),
+                                       HTTP_X_REQUESTED_WITH='DjangoBridge')
+        self.assertEqual(response.status_code, 200)
+        return len(queries)
+
+    def _assert_constant_query_count(self, match):
+        small_count = self._query_count(match)
+        self.assertLessEqual(small_count, settings.VIEW_QUERY_BUDGETS['match_detail'])
+        self._grow(10)
+        self.assertEqual(self._query_count(match), small_count)
+
+    def test_open_match_with_bet_form(self):
+        self._assert_constant_query_count(self.open_match)
+
+    def test_settled_match_with_leaderboard_and_own_bet(self):
+        self._assert_constant_query_count(self.settled_match)
+
+
+class HotQueryIndexTests(TestCase):
+    """
+    Every hot query of explain_hot_queries must use its index: the command raises CommandError
+    when the expected index name is missing from a plan, which fails this test. On PostgreSQL
+    sequential scans are disabled for the check, so the empty test tables do not hide a miss.
+    """
+
+    def test_hot_queries_use_their_index(self):
+        call_command('explain_hot_queries', stdout=StringIO())
+
+
+@override_settings(ANONYMOUS_PAGE_CACHE_SECONDS=60, SERVER_TIMING_HEADER=True)
+class AnonymousPageCacheTests(TestCase):
+    """
+    Anonymous visitors of a match page share one cached response (AnonymousPageCache), which
+    must never carry one visitor's CSRF token or messages to another.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        competition = Competition.objects.create(name="League", start_date=date(2025, 1, 1), end_date=date(2099, 12, 31))
+        cls.match = Match.objects.create(competition=competition, team_one=Team.objects.create(name="Home"),
+                                         team_two=Team.objects.create(name="Away"),
+                                         start_datetime=timezone.now() + timedelta(days=1))
+
+    def setUp(self):
+        cache.clear()
+
+    def _get(self, client):
+        """The match page as django-bridge requests it, with the page-cache outcome of Server-Timing."""
+        response = client.get(reverse('match_detail', kwargs={'match_id': self.match.id}), HTTP_X_REQUESTED_WITH='DjangoBridge')
+        self.assertEqual(response.status_code, 200)
+        outcome = re.search(r'page-cache;desc="(\w+)"', response['Server-Timing'])
+        return response, outcome[1] if outcome else None
+
+    @staticmethod
+    def _with_pending_message(client, text):
+        client.cookies['messages'] = CookieStorage(RequestFactory().get('/'))._encode(
+            [Message(message_constants.SUCCESS, text)]
+        )
+        return client
+
+    def _post_login(self, client, csrf_token):
+        return client.post(reverse('login'), {"username": "nobody", "password": "wrong", "csrfmiddlewaretoken": csrf_token})
+
+    def test_each_visitor_gets_their_own_csrf_token(self):
+        first_client, second_client = Client(enforce_csrf_checks=True), Client(enforce_csrf_checks=True)
+        first_response, first_outcome = self._get(first_client)
+        second_response, second_outcome = self._get(second_client)
+        self.assertEqual((first_outcome, second_outcome), ("miss", "hit"))
+
+        first_token = json.loads(first_response.content)["props"]["csrfToken"]
+        second_token = json.loads(second_response.content)["props"]["csrfToken"]
+        self.assertNotEqual(first_token, second_token)
+        self.assertEqual(json.loads(second_response.content)["context"]["csrf_token"], second_token)
+        self.assertNotEqual(self._post_login(first_client, first_token).status_code, 403)
+        self.assertNotEqual(self._post_login(second_client, second_token).status_code, 403)
+        self.assertEqual(self._post_login(second_client, first_token).status_code, 403)
+
+    def test_pending_messages_are_neither_served_from_nor_stored_in_the_cache(self):
+        response, outcome = self._get(self._with_pending_message(Client(), "Welcome back."))
+        self.assertEqual(outcome, "bypass")
+        self.assertContains(response, "Welcome back.")
+
+        response, outcome = self._get(Client())
+        self.assertEqual(outcome, "miss") # Nothing was stored by the request with a message
+        self.assertNotContains(response, "Welcome back.")
+
+        response, outcome = self._get(self._with_pending_message(Client(), "Bet placed."))
+        self.assertEqual(outcome, "bypass") # Even with an entry to send
+        self.assertContains(response, "Bet placed.")
+        self.assertEqual(self._get(Client())[1], "hit")
+
+    def test_stamp_bump_turns_a_hit_into_a_miss(self):
+        self.assertEqual(self._get(Client())[1], "miss")
+        self.assertEqual(self._get(Client())[1], "hit")
+        VersionStamps.bump(f"match:{self.match.id}")
+        self.assertEqual(self._get(Client())[1], "miss")
+        self.assertEqual(self._get(Client())[1], "hit")
+
+
+class PageETagTests(TestCase):
+    """
+    Pages are answered with a 304 only while none of their version stamps changed, and only when
+    the stamps are shared by every process (PageETags.is_enabled).
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cache_dir = tempfile.mkdtemp()
+        cls.addClassCleanup(shutil.rmtree, cache_dir, ignore_errors=True)
+        cls.enterClassContext(override_settings(CACHES={
+            "default": {"BACKEND": "django.core.cache.backends.filebased.FileBasedCache", "LOCATION": cache_dir},
+        }))
+        super().setUpClass()
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.competition = Competition.objects.create(name="League", start_date=date(2025, 1, 1), end_date=date(2099, 12, 31))
+        cls.team_one = Team.objects.create(name="Home")
+        cls.team_two = Team.objects.create(name="Away")
+        cls.match = Match.objects.create(competition=cls.competition, team_one=cls.team_one, team_two=cls.team_two,
+                                         start_datetime=timezone.now() + timedelta(days=1))
+        cls.user = CustomUser.objects.create_user(username="viewer", password="unused")
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_login(self.user) # Not served by the anonymous page cache
+        self.client.get(reverse('home')) # Sets the CSRF cookie, which is part of the ETag
+
+    def _get(self, url, etag=None):
+        headers = {'HTTP_IF_NONE_MATCH': etag} if etag else {}
+        return self.client.get(url, HTTP_X_REQUESTED_WITH='DjangoBridge', **headers)
+
+    def test_match_page_is_revalidated_until_a_stamp_is_bumped(self):
+        url = reverse('match_detail', kwargs={'match_id': self.match.id})
+        response = self._get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Cache-Control'], "private, no-cache")
+        self.assertIn('X-Requested-With', response['Vary'])
+        etag = response['ETag']
+        self.assertEqual(self._get(url, etag).status_code, 304)
+
+        bumping_saves = {
+            "match": self.match.save,
+            "team": self.team_one.save,
+            "competition": self.competition.save,
+            "bet": lambda: Bet.objects.create(match=self.match, user=self.user, winner_team=self.team_one),
+        }
+        for name, save in bumping_saves.items():
+            with self.subTest(save=name):
+                with self.captureOnCommitCallbacks(execute=True):
+                    save()
+                response = self._get(url, etag)
+                self.assertEqual(response.status_code, 200)
+                self.assertNotEqual(response['ETag'], etag)
+                etag = response['ETag']
+                self.assertEqual(self._get(url, etag).status_code, 304)
+
+    def test_home_page_is_revalidated(self):
+        response = self._get(reverse('home'))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self._get(reverse('home'), response['ETag']).status_code, 304)
+
+    def test_no_etag_with_a_local_memory_cache(self):
+        with self.settings(CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}):
+            response = self._get(reverse('match_detail', kwargs={'match_id': self.match.id}))
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.has_header('ETag'))
+        self.assertNotEqual(response.get('Cache-Control'), "private, no-cache")
@@ -15,8 +15,10 @@ Including another URLconf
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
 
+import re
+
 from django.contrib import admin
-from django.urls import path
+from django.urls import path, re_path
 from django.conf import settings
 from django.conf.urls.static import static
 
@@ -31,8 +33,20 @@ urlpatterns = [
     path("match/<int:match_id>/", views.match_detail_view, name="match_detail"),
     path("competition/<int:competition_id>/", views.competition_detail_view, name="competition_detail"),
     path("team/<int:team_id>/", views.team_detail_view, name="team_detail"),
+    path("leaderboard/", views.leaderboard_view, name="leaderboard"),
+    path("api/bets/", views.bet_slip_view, name="bet_slip"),
+    path("metrics/", views.request_metrics_view, name="request_metrics"),
 ]
 
-# Serve media files during development
-if settings.DEBUG:
+# Media and collected static files, with long-lived cache headers (FileServingController).
+# In development, runserver serves static files itself from the app directories.
+if settings.SERVE_FILES:
+    urlpatterns += [
+        re_path(rf"^{re.escape(settings.MEDIA_URL.lstrip('/'))}(?P<path>.+)$", views.media_view, name="media"),
+    ]
+    if "//" not in settings.STATIC_URL: # Not on a CDN
+        urlpatterns += [
+            re_path(rf"^{re.escape(settings.STATIC_URL.lstrip('/'))}(?P<path>.+)$", views.static_view, name="static"),
+        ]
+elif settings.DEBUG:
     urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
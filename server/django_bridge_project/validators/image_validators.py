@@ -6,15 +6,27 @@ class CustomImageValidator:
     MAX_IMAGE_UPLOAD_SIZE_MB = 2
     MAX_IMAGE_UPLOAD_SIZE_BYTES = MAX_IMAGE_UPLOAD_SIZE_MB * 1024 * 1024
     ALLOWED_IMAGE_EXTENSIONS = ['.jpg', '.jpeg', '.png','.webp']
+    ALLOWED_IMAGE_FORMATS = ['JPEG', 'PNG', 'WEBP'] # Pillow format names, the only decoders tried
     MAX_IMAGE_WIDTH = 1024
     MAX_IMAGE_HEIGHT = 1024
 
+    @staticmethod
+    def validate_field(field_file, field_name_for_error_message):
+        """
+        Validates the image of a model field when it is a new upload. A file already in
+        storage was validated when it was uploaded, so a clean() that does not replace
+        the image neither opens nor reads it.
+        """
+        if not field_file or field_file._committed:
+            return
+        CustomImageValidator.validate(field_file.file, field_name_for_error_message)
+
     @staticmethod
     def validate(image_file_obj, field_name_for_error_message):
         if not image_file_obj: # Field is optional and not provided
             return
 
-        # File size validation
+        # File size validation (MaxSizeUploadHandler stops buffering oversized uploads and reports their size)
         if image_file_obj.size > CustomImageValidator.MAX_IMAGE_UPLOAD_SIZE_BYTES:
             raise ValidationError(
                 f"{field_name_for_error_message}: Image file too large. Maximum size is {CustomImageValidator.MAX_IMAGE_UPLOAD_SIZE_MB}MB."
@@ -27,32 +39,23 @@ class CustomImageValidator:
                 f"{field_name_for_error_message}: Invalid image format. Allowed formats are {', '.join(CustomImageValidator.ALLOWED_IMAGE_EXTENSIONS)}."
             )
 
-        # Dimension and actual format validation using Pillow
+        # Format and dimensions, read from the image header in one pass: Image.open does not decode pixels
         try:
-            image_file_obj.seek(0) 
-            img = Image.open(image_file_obj)
-            img.verify()
-            
             image_file_obj.seek(0)
-            img = Image.open(image_file_obj)
-
-            actual_format = img.format.lower()
-            is_allowed_format = False
-            if actual_format == 'jpeg' and ('.jpg' in CustomImageValidator.ALLOWED_IMAGE_EXTENSIONS or '.jpeg' in CustomImageValidator.ALLOWED_IMAGE_EXTENSIONS):
-                is_allowed_format = True
-            elif actual_format in [fmt.replace('.', '') for fmt in CustomImageValidator.ALLOWED_IMAGE_EXTENSIONS]:
-                is_allowed_format = True
-            
-            if not is_allowed_format:
-                raise ValidationError(
-                    f"{field_name_for_error_message}: Invalid image content or format. Allowed types: {', '.join(CustomImageValidator.ALLOWED_IMAGE_EXTENSIONS)}."
-                )
-
-            if img.width > CustomImageValidator.MAX_IMAGE_WIDTH or img.height > CustomImageValidator.MAX_IMAGE_HEIGHT:
-                raise ValidationError(
-                    f"{field_name_for_error_message}: Image dimensions too large. Maximum dimensions are {CustomImageValidator.MAX_IMAGE_WIDTH}x{CustomImageValidator.MAX_IMAGE_HEIGHT} pixels."
-                )
+            with Image.open(image_file_obj, formats=CustomImageValidator.ALLOWED_IMAGE_FORMATS) as img:
+                width, height = img.size
         except FileNotFoundError:
             raise ValidationError(f"{field_name_for_error_message}: Image file not found.")
+        except Image.UnidentifiedImageError:
+            raise ValidationError(
+                f"{field_name_for_error_message}: Invalid image content or format. Allowed types: {', '.join(CustomImageValidator.ALLOWED_IMAGE_EXTENSIONS)}."
+            )
         except Exception as e:
-            raise ValidationError(f"{field_name_for_error_message}: Invalid image file. Could not be processed. Error: {e}") 
\ No newline at end of file
+            raise ValidationError(f"{field_name_for_error_message}: Invalid image file. Could not be processed. Error: {e}")
+        finally:
+            image_file_obj.seek(0)
+
+        if width > CustomImageValidator.MAX_IMAGE_WIDTH or height > CustomImageValidator.MAX_IMAGE_HEIGHT:
+            raise ValidationError(
+                f"{field_name_for_error_message}: Image dimensions too large. Maximum dimensions are {CustomImageValidator.MAX_IMAGE_WIDTH}x{CustomImageValidator.MAX_IMAGE_HEIGHT} pixels."
+            )
@@ -0,0 +1,36 @@
+from io import BytesIO
+
+from django.core.files.uploadedfile import UploadedFile
+from django.core.files.uploadhandler import FileUploadHandler
+from django_bridge_project.validators.image_validators import CustomImageValidator
+
+class OversizedUpload(UploadedFile):
+    """Stands in for an upload over the size limit: no content, only the size received."""
+
+    def __init__(self, name, content_type, size, charset):
+        super().__init__(BytesIO(), name, content_type, size, charset)
+
+
+class MaxSizeUploadHandler(FileUploadHandler):
+    """
+    Put first in the upload handlers of the views that take images (see ImageUploadAdminMixin),
+    so it does not cap other uploads. Once an uploaded file goes over the image size limit,
+    its remaining chunks are dropped instead of being buffered in memory or on disk, and the
+    file is replaced by an OversizedUpload that CustomImageValidator rejects on its size.
+    """
+
+    def new_file(self, *args, **kwargs):
+        super().new_file(*args, **kwargs)
+        self.received = 0
+        self.too_large = False
+
+    def receive_data_chunk(self, raw_data, start):
+        self.received += len(raw_data)
+        if self.received > CustomImageValidator.MAX_IMAGE_UPLOAD_SIZE_BYTES:
+            self.too_large = True
+        return None if self.too_large else raw_data # None keeps the chunk from the next handlers
+
+    def file_complete(self, file_size):
+        if not self.too_large:
+            return None # The next handler builds the file
+        return OversizedUpload(self.file_name, self.content_type, self.received, self.charset)
@@ -2,16 +2,24 @@ from django.shortcuts import redirect
 from django.contrib.auth import login # Removed unused 'authenticate'
 from django.urls import reverse
 from django.http import Http404 # Added for match_detail_view
+from django.views.decorators.http import require_POST
 
-from django_bridge.response import Response
+from .controllers.utils.bridge_response import Response
 
 # Removed direct import of LoginForm as it's handled by the controller
 from .controllers.auth_controller import AuthController # Import the controller
 from .controllers.match_controller import MatchController # Import the MatchController
 from .controllers.competition_controller import CompetitionController # Import the CompetitionController
 from .controllers.team_controller import TeamController # Import the TeamController
+from .controllers.leaderboard_controller import LeaderboardController
+from .controllers.bet_slip_controller import BetSlipController
+from .controllers.metrics_controller import MetricsController
+from .controllers.file_serving_controller import FileServingController
 from .controllers.utils.home_data_helper import HomeDataHelper # Import HomeDataHelper
+from .services.page_etags import PageETags, conditional_page
+from .services.anonymous_page_cache import cached_for_anonymous
 
+@conditional_page(PageETags.home) # 304 when unchanged
 def home(request):
     helper = HomeDataHelper(request)
     props = helper.get_home_page_data()
@@ -31,6 +39,8 @@ def registration_view(request):
     else: # GET or other methods
         return auth_controller.display_registration_form(request)
 
+@conditional_page(PageETags.match_detail) # 304 when unchanged
+@cached_for_anonymous(PageETags.match_stamp_names)
 def match_detail_view(request, match_id):
     controller = MatchController()
     if request.method == 'POST':
@@ -38,15 +48,30 @@ def match_detail_view(request, match_id):
     else: # GET or other methods
         return controller.render_match_detail_page(request, match_id)
 
+@conditional_page(PageETags.competition_detail) # 304 when unchanged
 def competition_detail_view(request, competition_id):
     controller = CompetitionController()
     # This page is likely to be GET only for now, unless we add forms later
     return controller.render_competition_detail_page(request, competition_id)
 
+@conditional_page(PageETags.team_detail) # 304 when unchanged
 def team_detail_view(request, team_id):
     controller = TeamController()
     return controller.render_team_detail_page(request, team_id)
 
+def leaderboard_view(request):
+    controller = LeaderboardController()
+    return controller.get_leaderboard_page(request)
+
+@require_POST
+def bet_slip_view(request):
+    controller = BetSlipController()
+    return controller.submit_slip(request)
+
+def request_metrics_view(request):
+    controller = MetricsController()
+    return controller.get_request_metrics(request)
+
 def logout_view(request):
     auth_controller = AuthController()
     # Logout should ideally be a POST request for security (CSRF protection)
@@ -56,3 +81,11 @@ def logout_view(request):
     # If it's a form, it should be POST.
     # The AuthController.logout_user handles the actual logout logic.
     return auth_controller.logout_user(request)
+
+def media_view(request, path):
+    controller = FileServingController()
+    return controller.serve_media(request, path)
+
+def static_view(request, path):
+    controller = FileServingController()
+    return controller.serve_static(request, path)
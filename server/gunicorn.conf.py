@@ -0,0 +1,10 @@
+# Gunicorn settings, read from the working directory when gunicorn starts.
+# The views are synchronous, so the default is threaded sync workers: each thread serves one request
+# and keeps its own database connection (or borrows one from the pool with DJANGO_DB_POOL=true).
+# GUNICORN_WORKER_CLASS takes one of gunicorn's own worker classes (gthread or sync): no ASGI server is installed.
+import os
+
+workers = int(os.environ.get("WEB_CONCURRENCY", "4"))
+threads = int(os.environ.get("GUNICORN_THREADS", "2"))
+worker_class = os.environ.get("GUNICORN_WORKER_CLASS", "gthread")
+keepalive = int(os.environ.get("GUNICORN_KEEPALIVE", "5"))